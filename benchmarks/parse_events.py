@@ -0,0 +1,93 @@
+"""Benchmark parsing the recorded events of `tests/cassettes`, per event type.
+
+Compares the former event parsing, where `data` was validated as
+`dict | BaseModel` then validated again into its model by an if/elif chain,
+with the current dispatch on the event type prefix (`Event.data: EventData`).
+
+    PYTHONPATH=. python benchmarks/parse_events.py [--number 200]
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import argparse
+import json
+import pathlib
+import timeit
+from collections import defaultdict
+from datetime import datetime
+
+import yaml
+from pydantic import model_validator
+
+from paddle_billing_client.models import LazyBaseModel
+from paddle_billing_client.models.event import Event
+from paddle_billing_client.utils import EVENT_ENTITY_MODELS
+
+CASSETTES = pathlib.Path(__file__).parent.parent / "tests" / "cassettes"
+
+
+def legacy_parse_event_to_model(event_type: str, data):
+    if not isinstance(data, dict):
+        return data
+    for entity, model in EVENT_ENTITY_MODELS.items():
+        if event_type.startswith(entity):
+            return model(**data)
+    return data
+
+
+class LegacyEvent(LazyBaseModel):
+    notification_id: str | None = None
+    event_id: str
+    event_type: str
+    data: dict | LazyBaseModel
+    occurred_at: datetime
+
+    @model_validator(mode="after")
+    def check_status(self):
+        self.data = legacy_parse_event_to_model(self.event_type, self.data)
+        return self
+
+
+def load_events() -> dict[str, list[bytes]]:
+    """Return the recorded events and notification payloads by event type"""
+    events: dict[str, list[bytes]] = defaultdict(list)
+    for path in sorted(CASSETTES.glob("*/*.yaml")):
+        for interaction in yaml.safe_load(path.read_text())["interactions"]:
+            body = interaction["response"]["body"]["string"]
+            if not body or not body.startswith("{"):
+                continue
+            data: Any = json.loads(body).get("data")
+            for item in data if isinstance(data, list) else [data]:
+                event = item.get("payload", item) if isinstance(item, dict) else None
+                if isinstance(event, dict) and "event_type" in event:
+                    events[event["event_type"]].append(json.dumps(event).encode())
+    return events
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'event type':<32}{'events':>7}{'legacy':>12}{'current':>12}{'x':>7}")
+    for event_type, payloads in sorted(load_events().items()):
+        legacy = timeit.timeit(
+            lambda: [LegacyEvent.model_validate_json(p) for p in payloads],
+            number=args.number,
+        )
+        current = timeit.timeit(
+            lambda: [Event.model_validate_json(p) for p in payloads],
+            number=args.number,
+        )
+        count = len(payloads) * args.number
+        print(
+            f"{event_type:<32}{len(payloads):>7}"
+            f"{legacy / count * 1e6:>10.1f}us{current / count * 1e6:>10.1f}us"
+            f"{legacy / current:>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
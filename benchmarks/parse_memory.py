@@ -0,0 +1,184 @@
+"""Benchmark the memory held by a large parsed `list_transactions` response.
+
+Builds a page of transactions from the recorded `list_transactions` response,
+with ids, dates, amounts, statuses, origins and currencies varying between
+transactions, and parses it with each response path: `json.loads` +
+`model_validate`, `model_validate_json`, lazy validation (`validate_lazy`)
+and construction without validation (`construct_model`), the last two fully
+materialized. Reports the memory held by the models, and the duplicate
+strings among their values: copies of a value already held by another
+string, which interned fields (`InternedStr`) share instead.
+
+Each path is measured with interning, and without it as a baseline, where
+`InternedStr` fields are plain `str` fields. The models are built when first
+imported, so each variant runs in its own process.
+
+    PYTHONPATH=. python benchmarks/parse_memory.py [--transactions 5000]
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import argparse
+import gc
+import json
+import pathlib
+import random
+import subprocess
+import sys
+import tracemalloc
+
+import yaml
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+CASSETTE = (
+    pathlib.Path(__file__).parent.parent
+    / "tests"
+    / "cassettes"
+    / "test_transaction"
+    / "TestTransaction.test_list_transactions.yaml"
+)
+
+STATUSES = ["draft", "ready", "billed", "paid", "completed"]
+ORIGINS = ["api", "web", "subscription_recurring", "subscription_charge"]
+CURRENCIES = ["USD", "EUR", "GBP"]
+
+
+def build_response(transactions: int) -> bytes:
+    """Return the body of a `list_transactions` response with `transactions` items"""
+    interaction = yaml.safe_load(CASSETTE.read_text())["interactions"][0]
+    response = json.loads(interaction["response"]["body"]["string"])
+    template = json.dumps(response["data"][0])
+    rnd = random.Random(0)
+    data = []
+    for index in range(transactions):
+        transaction = json.loads(template)
+        timestamp = f"2024-{index % 12 + 1:02d}-{index % 28 + 1:02d}T{index % 24:02d}:{index % 60:02d}:00.{index % 10**6:06d}Z"
+        transaction.update(
+            id=f"txn_{index:026d}",
+            status=rnd.choice(STATUSES),
+            origin=rnd.choice(ORIGINS),
+            created_at=timestamp,
+            updated_at=timestamp,
+        )
+        set_values(transaction["details"], rnd.choice(CURRENCIES), rnd)
+        data.append(transaction)
+    response["data"] = data
+    return json.dumps(response).encode()
+
+
+def set_values(value: Any, currency_code: str, rnd: random.Random):
+    """Set the currency and random amounts of the money objects in `value`"""
+    if isinstance(value, list):
+        for item in value:
+            set_values(item, currency_code, rnd)
+    elif isinstance(value, dict):
+        if "currency_code" in value:
+            value["currency_code"] = currency_code
+            for name, amount in value.items():
+                if name != "currency_code" and isinstance(amount, str):
+                    value[name] = str(rnd.randrange(10**6))
+        for item in value.values():
+            set_values(item, currency_code, rnd)
+
+
+def duplicate_strings(value: Any, seen: dict[str, set[int]]):
+    """Collect the ids of the string objects held by `value`, by string value"""
+    if isinstance(value, str):
+        seen.setdefault(value, set()).add(id(value))
+    elif isinstance(value, BaseModel):
+        duplicate_strings(value.__dict__, seen)
+        duplicate_strings(value.__pydantic_extra__, seen)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            duplicate_strings(item, seen)
+    elif isinstance(value, dict):
+        for item in value.values():
+            duplicate_strings(item, seen)
+
+
+def measure(parse: Callable[[], BaseModel]) -> tuple[int, int, int]:
+    """Return the bytes held by the parsed models, and the duplicate strings and their bytes"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    response = parse()
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    seen: dict[str, set[int]] = {}
+    duplicate_strings(response, seen)
+    copies = sum(len(ids) - 1 for ids in seen.values())
+    copies_size = sum(
+        (len(ids) - 1) * sys.getsizeof(value) for value, ids in seen.items()
+    )
+    return held, copies, copies_size
+
+
+def get_parsers(body: bytes, interning: bool) -> dict[str, Callable[[], BaseModel]]:
+    """Import the models and return the response paths parsing `body`.
+
+    Without `interning`, `InternedStr` is swapped for `str` before the models
+    are imported, so their fields keep the strings as parsed.
+    """
+    if not interning:
+        import paddle_billing_client.models
+
+        paddle_billing_client.models.InternedStr = str
+    from paddle_billing_client.construct import construct_model
+    from paddle_billing_client.lazy import validate_lazy
+    from paddle_billing_client.models.transaction import TransactionsResponse
+
+    model = TransactionsResponse
+    return {
+        "loads+validate": lambda: model.model_validate(json.loads(body)),
+        "validate_json": lambda: model.model_validate_json(body),
+        "lazy": lambda: validate_lazy(model, from_json(body)).model_materialize(),
+        "construct": lambda: construct_model(
+            model, from_json(body)
+        ).model_materialize(),
+    }
+
+
+def run_variant(transactions: int, interning: bool):
+    """Print the measures of every path as JSON lines"""
+    body = build_response(transactions)
+    for name, parse in get_parsers(body, interning).items():
+        print(json.dumps([name, *measure(parse)]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=5000)
+    parser.add_argument(
+        "--variant", choices=["interned", "plain"], help=argparse.SUPPRESS
+    )
+    args = parser.parse_args()
+
+    if args.variant:
+        run_variant(args.transactions, args.variant == "interned")
+        return
+
+    size = len(build_response(args.transactions))
+    print(f"{args.transactions} transactions, {size / 2**20:.1f} MiB of JSON")
+    print(f"{'path':<16}{'strings':<10}{'held':>12}{'duplicates':>12}{'dup. size':>12}")
+    for variant in ("plain", "interned"):
+        output = subprocess.run(
+            [sys.executable, __file__, f"--transactions={args.transactions}"]
+            + [f"--variant={variant}"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        for line in output.splitlines():
+            name, held, copies, copies_size = json.loads(line)
+            print(
+                f"{name:<16}{variant:<10}{held / 2**20:>10.1f}MiB{copies:>12}"
+                f"{copies_size / 2**20:>10.1f}MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark parsing the recorded responses of `tests/cassettes` into their models.
+
+Compares decoding the JSON body into Python objects then validating them
+(`json.loads` + `model_validate`, the former response path) with validating the
+raw body in one pass (`model_validate_json`, `PydanticResponseHandler`).
+With `--construct`, compares the latter with building the models without
+validation (`construct_model`, used by clients with `validate=False`).
+
+    PYTHONPATH=. python benchmarks/parse_responses.py [--number 200] [--construct]
+"""
+
+from __future__ import annotations
+
+from typing import get_type_hints
+
+import argparse
+import json
+import pathlib
+import timeit
+
+import yaml
+from pydantic_core import from_json
+
+from paddle_billing_client.client import PaddleApiClient
+from paddle_billing_client.construct import construct_model
+
+CASSETTES = pathlib.Path(__file__).parent.parent / "tests" / "cassettes"
+
+
+def load_responses() -> list[tuple[str, type, bytes]]:
+    """Return the (method, response model, body) of the successful recorded calls"""
+    responses = []
+    for path in sorted(CASSETTES.glob("*/*.yaml")):
+        method_name = path.stem.split(".")[-1].removeprefix("test_")
+        method = getattr(PaddleApiClient, method_name, None)
+        if method is None:
+            continue
+        model = get_type_hints(method).get("return")
+        for interaction in yaml.safe_load(path.read_text())["interactions"]:
+            body = interaction["response"]["body"]["string"]
+            if interaction["response"]["status"]["code"] == 200 and body:
+                responses.append((method_name, model, body.encode()))
+    return responses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--construct", action="store_true")
+    args = parser.parse_args()
+
+    baseline = "validate_json" if args.construct else "loads+validate"
+    compared = "construct" if args.construct else "validate_json"
+    print(f"{'method':<42}{'bytes':>8}{baseline:>16}{compared:>15}{'x':>7}")
+    totals = [0.0, 0.0]
+    for method_name, model, body in load_responses():
+        if args.construct:
+            two_pass = timeit.timeit(
+                lambda: model.model_validate_json(body), number=args.number
+            )
+            one_pass = timeit.timeit(
+                lambda: construct_model(model, from_json(body)), number=args.number
+            )
+        else:
+            two_pass = timeit.timeit(
+                lambda: model.model_validate(json.loads(body)), number=args.number
+            )
+            one_pass = timeit.timeit(
+                lambda: model.model_validate_json(body), number=args.number
+            )
+        totals[0] += two_pass
+        totals[1] += one_pass
+        print(
+            f"{method_name:<42}{len(body):>8}"
+            f"{two_pass / args.number * 1e6:>14.1f}us"
+            f"{one_pass / args.number * 1e6:>13.1f}us"
+            f"{two_pass / one_pass:>7.2f}"
+        )
+    print(
+        f"{'total':<50}{totals[0]:>15.3f}s{totals[1]:>14.3f}s{totals[0] / totals[1]:>7.2f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1098 @@
+from __future__ import annotations
+
+from typing import Any, AsyncIterator
+
+import asyncio
+from functools import partial
+
+from apiclient.authentication_methods import (
+    BaseAuthenticationMethod,
+    NoAuthentication,
+)
+from apiclient.client import DEFAULT_TIMEOUT
+from apiclient.error_handlers import BaseErrorHandler, ErrorHandler
+from apiclient.exceptions import UnexpectedError
+from apiclient.request_formatters import BaseRequestFormatter
+from apiclient.response import Response
+from apiclient.response_handlers import BaseResponseHandler
+
+from paddle_billing_client.batching import get_by_ids_async
+from paddle_billing_client.connection_pool import ConnectionPoolConfig
+from paddle_billing_client.endpoints import Endpoints
+from paddle_billing_client.formatters import CustomJsonRequestFormatter
+from paddle_billing_client.idempotency import (
+    IdempotencyKeyStore,
+    get_idempotency_key,
+    is_outcome_known,
+)
+from paddle_billing_client.identity import IdentityMap
+from paddle_billing_client.models.address import (
+    Address,
+    AddressesResponse,
+    AddressQueryParams,
+    AddressRequest,
+    AddressResponse,
+)
+from paddle_billing_client.models.adjustment import (
+    Adjustment,
+    AdjustmentQueryParams,
+    AdjustmentRequest,
+    AdjustmentResponse,
+    AdjustmentsByIdsResponse,
+    AdjustmentsResponse,
+)
+from paddle_billing_client.models.business import (
+    Business,
+    BusinessesResponse,
+    BusinessQueryParams,
+    BusinessRequest,
+    BusinessResponse,
+)
+from paddle_billing_client.models.common import Paginate
+from paddle_billing_client.models.customer import (
+    Customer,
+    CustomerBalancesQueryParams,
+    CustomerBalancesResponse,
+    CustomerQueryParams,
+    CustomerRequest,
+    CustomerResponse,
+    CustomersResponse,
+)
+from paddle_billing_client.models.discount import (
+    Discount,
+    DiscountQueryParams,
+    DiscountRequest,
+    DiscountResponse,
+    DiscountsByIdsResponse,
+    DiscountsResponse,
+)
+from paddle_billing_client.models.event import (
+    Event,
+    EventQueryParams,
+    EventsResponse,
+    EventTypesResponse,
+)
+from paddle_billing_client.models.notification import (
+    Notification,
+    NotificationQueryParams,
+    NotificationReplayResponse,
+    NotificationResponse,
+    NotificationsResponse,
+)
+from paddle_billing_client.models.notification_setting import (
+    NotificationSettingRequest,
+    NotificationSettingResponse,
+    NotificationSettingsResponse,
+)
+from paddle_billing_client.models.price import (
+    Price,
+    PriceQueryParams,
+    PriceRequest,
+    PriceResponse,
+    PricesByIdsResponse,
+    PricesResponse,
+)
+from paddle_billing_client.models.product import (
+    Product,
+    ProductQueryParams,
+    ProductRequest,
+    ProductResponse,
+    ProductsByIdsResponse,
+    ProductsResponse,
+)
+from paddle_billing_client.models.subscription import (
+    Subscription,
+    SubscriptionQueryParams,
+    SubscriptionRequest,
+    SubscriptionResponse,
+    SubscriptionsResponse,
+)
+from paddle_billing_client.models.transaction import (
+    Transaction,
+    TransactionPdfResponse,
+    TransactionPreviewResponse,
+    TransactionQueryParams,
+    TransactionRequest,
+    TransactionResponse,
+    TransactionsByIdsResponse,
+    TransactionsResponse,
+)
+from paddle_billing_client.options import get_request_options
+from paddle_billing_client.pagination import async_iterate
+from paddle_billing_client.rate_limiting import RateLimiter
+from paddle_billing_client.request_strategies import set_last_response_size
+from paddle_billing_client.retrying import RetryPolicy, get_retry_after
+from paddle_billing_client.serializers import (
+    PydanticResponseHandler,
+    serialize_all_methods,
+)
+from paddle_billing_client.single_flight import AsyncSingleFlight, get_request_key
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+class HttpxResponse(Response):
+    """Implementation of the response for a httpx.Response type."""
+
+    def __init__(self, response: httpx.Response):
+        self._response = response
+
+    def get_original(self) -> Any:
+        return self._response
+
+    def get_status_code(self) -> int:
+        return self._response.status_code
+
+    def get_raw_data(self) -> str:
+        return self._response.text
+
+    def get_json(self) -> Any:
+        return self._response.json()
+
+    def get_status_reason(self) -> str:
+        return self._response.reason_phrase or ""
+
+    def get_requested_url(self) -> str:
+        return str(self._response.url)
+
+
+@serialize_all_methods
+class AsyncPaddleApiClient:
+    """Asyncio counterpart of `PaddleApiClient`.
+
+    Every endpoint method is a coroutine sharing the same `Endpoints`, request
+    models and response models as the blocking client. Requests go through a
+    single pooled `httpx.AsyncClient`, so many calls can be awaited concurrently
+    from one event loop. Close the client with `await client.aclose()` or use
+    it as an async context manager.
+    """
+
+    def __init__(
+        self,
+        base_url="https://sandbox-api.paddle.com",
+        authentication_method: BaseAuthenticationMethod | None = None,
+        request_formatter: type[BaseRequestFormatter] = CustomJsonRequestFormatter,
+        response_handler: type[BaseResponseHandler] = PydanticResponseHandler,
+        error_handler: type[BaseErrorHandler] = ErrorHandler,
+        timeout: float = DEFAULT_TIMEOUT,
+        connection_pool: ConnectionPoolConfig | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        idempotency_keys: IdempotencyKeyStore | None = None,
+        single_flight: bool = False,
+        validate: bool = True,
+        lazy: bool = False,
+        raw: bool = False,
+        identity_map: IdentityMap | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ):
+        if httpx is None:
+            raise RuntimeError(
+                "AsyncPaddleApiClient requires httpx, "
+                "install it with `pip install paddle-billing-client[async]`."
+            )
+        self.endpoints: Endpoints = Endpoints(base_url=base_url)
+        self._authentication_method = authentication_method or NoAuthentication()
+        self._request_formatter = request_formatter
+        self._response_handler = response_handler
+        self._error_handler = error_handler
+        self._timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.idempotency_keys = idempotency_keys
+        self.validate = validate
+        self.lazy = lazy
+        self.raw = raw
+        self.identity_map = identity_map
+        self.single_flight = AsyncSingleFlight() if single_flight else None
+        self._owns_http_client = http_client is None
+        self._http_client = http_client or self._create_http_client(
+            connection_pool
+            or ConnectionPoolConfig(max_connections=100, max_keepalive_connections=20)
+        )
+
+    @staticmethod
+    def _create_http_client(config: ConnectionPoolConfig) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+            verify=config.ssl_context or True,
+        )
+
+    async def __aenter__(self) -> AsyncPaddleApiClient:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool, unless it was passed in"""
+        if self._owns_http_client:
+            await self._http_client.aclose()
+
+    async def post(
+        self, endpoint: str, data: dict, params: dict | None = None, **kwargs
+    ):
+        """Send data and return response data from POST endpoint."""
+        return await self._make_request(
+            "POST", endpoint, data=data, params=params, **kwargs
+        )
+
+    async def get(self, endpoint: str, params: dict | None = None, **kwargs):
+        """Return response data from GET endpoint, sharing identical calls in flight."""
+        if self.single_flight is None or kwargs:
+            return await self._make_request("GET", endpoint, params=params, **kwargs)
+        return await self.single_flight.do(
+            get_request_key(endpoint, params),
+            lambda: self._make_request("GET", endpoint, params=params),
+        )
+
+    async def put(
+        self, endpoint: str, data: dict, params: dict | None = None, **kwargs
+    ):
+        """Send data to overwrite resource and return response data from PUT endpoint."""
+        return await self._make_request(
+            "PUT", endpoint, data=data, params=params, **kwargs
+        )
+
+    async def patch(
+        self, endpoint: str, data: dict, params: dict | None = None, **kwargs
+    ):
+        """Send data to update resource and return response data from PATCH endpoint."""
+        return await self._make_request(
+            "PATCH", endpoint, data=data, params=params, **kwargs
+        )
+
+    async def delete(self, endpoint: str, params: dict | None = None, **kwargs):
+        """Remove resource with DELETE endpoint."""
+        return await self._make_request("DELETE", endpoint, params=params, **kwargs)
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+        data: dict | None = None,
+        **kwargs,
+    ):
+        """Make the request with the given method, applying the client policies."""
+        store = self.idempotency_keys
+        header, key, fingerprint = get_idempotency_key(store, method, endpoint, data)
+        if key is not None:
+            headers = {**(headers or {}), header: key}
+        try:
+            response = await self._make_request_with_retries(
+                method,
+                endpoint,
+                params=params,
+                headers=headers,
+                data=data,
+                idempotent=key is not None,
+                **kwargs,
+            )
+        except Exception as error:
+            if fingerprint is not None and is_outcome_known(error):
+                store.release(fingerprint)
+            raise
+        if fingerprint is not None:
+            store.release(fingerprint)
+        return response
+
+    async def _make_request_with_retries(
+        self, method: str, endpoint: str, idempotent: bool = False, **kwargs
+    ):
+        retry_policy = get_request_options().retry_policy or self.retry_policy
+        attempt = 1
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.wait_async(
+                    self._authentication_method, endpoint
+                )
+            try:
+                return await self._send(method, endpoint, **kwargs)
+            except Exception as error:
+                if retry_policy is None or not retry_policy.should_retry(
+                    method, error, attempt, idempotent=idempotent
+                ):
+                    raise
+                await asyncio.sleep(retry_policy.get_delay(attempt, error))
+                attempt += 1
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+        data: dict | None = None,
+        **kwargs,
+    ):
+        """Send a single request.
+
+        Mirrors `apiclient.request_strategies.RequestStrategy._make_request`,
+        so error and response handlers behave the same as in the sync client.
+        """
+        request_params = dict(params or {})
+        request_params.update(self._authentication_method.get_query_params())
+        request_headers = dict(headers or {})
+        request_headers.update(self._authentication_method.get_headers())
+        request_headers.update(self._request_formatter.get_headers())
+        auth = self._authentication_method.get_username_password_authentication()
+        try:
+            response = HttpxResponse(
+                await self._http_client.request(
+                    method,
+                    # httpx replaces the query string of the url with `params`,
+                    # requests merges them, e.g. into the `next` pagination url.
+                    httpx.URL(endpoint).copy_merge_params(request_params),
+                    headers=request_headers,
+                    auth=auth or httpx.USE_CLIENT_DEFAULT,
+                    content=self._request_formatter.format(data),
+                    timeout=self._timeout,
+                    **kwargs,
+                )
+            )
+        except Exception as error:
+            raise UnexpectedError(f"Error when contacting '{endpoint}'") from error
+
+        status_code = response.get_status_code()
+        if status_code < 200 or status_code >= 300:
+            error = self._error_handler.get_exception(response)
+            error.retry_after = get_retry_after(response)
+            raise error
+        set_last_response_size(response)
+        return self._response_handler.get_request_data(response)
+
+    """
+    Products
+    """
+
+    async def create_product(self, data: ProductRequest) -> ProductResponse:
+        """Create a product"""
+        return await self.post(
+            self.endpoints.create_product, data.model_dump(exclude_none=True)
+        )
+
+    async def get_product(self, product_id: str) -> ProductResponse:
+        """Get a product"""
+        return await self.get(self.endpoints.get_product.format(product_id=product_id))
+
+    async def list_products(
+        self,
+        query_params: ProductQueryParams = ProductQueryParams(),
+        paginate: Paginate = None,
+    ) -> ProductsResponse:
+        """List all products"""
+        return await self.get(
+            dict(paginate)["next"] if paginate else self.endpoints.list_products,
+            params=query_params.model_dump(exclude_none=True),
+        )
+
+    def iter_products(
+        self, query_params: ProductQueryParams = ProductQueryParams(), prefetch: int = 1
+    ) -> AsyncIterator[Product]:
+        """Iterate over all products, fetching pages ahead"""
+        return async_iterate(self.list_products, prefetch, query_params=query_params)
+
+    async def get_products_by_ids(
+        self,
+        product_ids: list[str],
+        query_params: ProductQueryParams = ProductQueryParams(),
+        max_concurrency: int = 4,
+    ) -> ProductsByIdsResponse:
+        """Get products by ids, fetching pages of ids concurrently"""
+        return await get_by_ids_async(
+            self, "product", product_ids, query_params, max_concurrency
+        )
+
+    async def update_product(
+        self, product_id: str, data: ProductRequest
+    ) -> ProductResponse:
+        """Update a product"""
+        return await self.patch(
+            self.endpoints.update_product.format(product_id=product_id),
+            data.model_dump(exclude_none=True),
+        )
+
+    """
+    Prices
+    """
+
+    async def create_price(self, data: PriceRequest) -> PriceResponse:
+        """Create a price"""
+        return await self.post(
+            self.endpoints.create_price,
+            data.model_dump(exclude_none=True),
+        )
+
+    async def get_price(self, price_id: str) -> PriceResponse:
+        """Get a price"""
+        return await self.get(self.endpoints.get_price.format(price_id=price_id))
+
+    async def list_prices(
+        self,
+        query_params: PriceQueryParams = PriceQueryParams(),
+        paginate: Paginate = None,
+    ) -> PricesResponse:
+        """List all prices"""
+        return await self.get(
+            dict(paginate)["next"] if paginate else self.endpoints.list_prices,
+            params=query_params.model_dump(exclude_none=True),
+        )
+
+    def iter_prices(
+        self, query_params: PriceQueryParams = PriceQueryParams(), prefetch: int = 1
+    ) -> AsyncIterator[Price]:
+        """Iterate over all prices, fetching pages ahead"""
+        return async_iterate(self.list_prices, prefetch, query_params=query_params)
+
+    async def get_prices_by_ids(
+        self,
+        price_ids: list[str],
+        query_params: PriceQueryParams = PriceQueryParams(),
+        max_concurrency: int = 4,
+    ) -> PricesByIdsResponse:
+        """Get prices by ids, fetching pages of ids concurrently"""
+        return await get_by_ids_async(
+            self, "price", price_ids, query_params, max_concurrency
+        )
+
+    async def update_price(self, price_id: str, data: PriceRequest) -> PriceResponse:
+        """Update a price"""
+        return await self.patch(
+            self.endpoints.update_price.format(price_id=price_id),
+            data.model_dump(exclude_none=True),
+        )
+
+    """
+    Discounts
+    """
+
+    async def create_discount(self, data: DiscountRequest) -> DiscountResponse:
+        """Create a discount"""
+        return await self.post(
+            self.endpoints.create_discount,
+            data.model_dump(exclude_none=True),
+        )
+
+    async def get_discount(self, discount_id: str) -> DiscountResponse:
+        """Get a discount"""
+        return await self.get(
+            self.endpoints.get_discount.format(discount_id=discount_id)
+        )
+
+    async def list_discounts(
+        self,
+        query_params: DiscountQueryParams = DiscountQueryParams(),
+        paginate: Paginate = None,
+    ) -> DiscountsResponse:
+        """List all discounts"""
+        return await self.get(
+            dict(paginate)["next"] if paginate else self.endpoints.list_discounts,
+            params=query_params.model_dump(exclude_none=True),
+        )
+
+    def iter_discounts(
+        self,
+        query_params: DiscountQueryParams = DiscountQueryParams(),
+        prefetch: int = 1,
+    ) -> AsyncIterator[Discount]:
+        """Iterate over all discounts, fetching pages ahead"""
+        return async_iterate(self.list_discounts, prefetch, query_params=query_params)
+
+    async def get_discounts_by_ids(
+        self,
+        discount_ids: list[str],
+        query_params: DiscountQueryParams = DiscountQueryParams(),
+        max_concurrency: int = 4,
+    ) -> DiscountsByIdsResponse:
+        """Get discounts by ids, fetching pages of ids concurrently"""
+        return await get_by_ids_async(
+            self, "discount", discount_ids, query_params, max_concurrency
+        )
+
+    async def update_discount(
+        self, discount_id: str, data: DiscountRequest
+    ) -> DiscountResponse:
+        """Update a discount"""
+        return await self.patch(
+            self.endpoints.update_discount.format(discount_id=discount_id),
+            data.model_dump(exclude_none=True),
+        )
+
+    """
+    Customers
+    """
+
+    async def create_customer(self, data: CustomerRequest) -> CustomerResponse:
+        """Create a customer"""
+        return await self.post(
+            self.endpoints.create_customer,
+            data.model_dump(exclude_none=True),
+        )
+
+    async def get_customer(self, customer_id: str) -> CustomerResponse:
+        """Get a customer"""
+        return await self.get(
+            self.endpoints.get_customer.format(customer_id=customer_id)
+        )
+
+    async def list_customers(
+        self,
+        query_params: CustomerQueryParams = CustomerQueryParams(),
+        paginate: Paginate = None,
+    ) -> CustomersResponse:
+        """List all customers"""
+        return await self.get(
+            dict(paginate)["next"] if paginate else self.endpoints.list_customers,
+            params=query_params.model_dump(exclude_none=True),
+        )
+
+    def iter_customers(
+        self,
+        query_params: CustomerQueryParams = CustomerQueryParams(),
+        prefetch: int = 1,
+    ) -> AsyncIterator[Customer]:
+        """Iterate over all customers, fetching pages ahead"""
+        return async_iterate(self.list_customers, prefetch, query_params=query_params)
+
+    async def update_customer(
+        self, customer_id: str, data: CustomerRequest
+    ) -> CustomerResponse:
+        """Update a customer"""
+        return await self.patch(
+            self.endpoints.update_customer.format(customer_id=customer_id),
+            data.model_dump(exclude_none=True),
+        )
+
+    async def list_customer_credit_balances(
+        self,
+        customer_id: str,
+        query_params: CustomerBalancesQueryParams = CustomerBalancesQueryParams(),
+    ) -> CustomerBalancesResponse:
+        """List credit balances for a customer"""
+        return await self.get(
+            self.endpoints.list_customer_credit_balances.format(
+                customer_id=customer_id
+            ),
+            params=query_params.model_dump(exclude_none=True),
+        )
+
+    """
+    Addresses
+    """
+
+    async def create_address_for_customer(
+        self, customer_id: str, data: AddressRequest
+    ) -> AddressResponse:
+        """Create an address for a customer"""
+        return await self.post(
+            self.endpoints.create_address_for_customer.format(customer_id=customer_id),
+            data.model_dump(exclude_none=True),
+        )
+
+    async def get_address_for_customer(
+        self, customer_id: str, address_id: str
+    ) -> AddressResponse:
+        """Get an address for a customer"""
+        return await self.get(
+            self.endpoints.get_address_for_customer.format(
+                customer_id=customer_id, address_id=address_id
+            )
+        )
+
+    async def list_addresses_for_customer(
+        self,
+        customer_id: str,
+        query_params: AddressQueryParams = AddressQueryParams(),
+        paginate: Paginate = None,
+    ) -> AddressesResponse:
+        """List all addresses for a customer"""
+        return await self.get(
+            (
+                dict(paginate)["next"]
+                if paginate
+                else self.endpoints.list_addresses_for_customer.format(
+                    customer_id=customer_id
+                )
+            ),
+            params=query_params.model_dump(exclude_none=True),
+        )
+
+    def iter_addresses_for_customer(
+        self,
+        customer_id: str,
+        query_params: AddressQueryParams = AddressQueryParams(),
+        prefetch: int = 1,
+    ) -> AsyncIterator[Address]:
+        """Iterate over all addresses for a customer, fetching pages ahead"""
+        return async_iterate(
+            partial(self.list_addresses_for_customer, customer_id),
+            prefetch,
+            query_params=query_params,
+        )
+
+    async def update_address_for_customer(
+        self, customer_id: str, address_id: str, data: AddressRequest
+    ) -> AddressResponse:
+        """Update an address for a customer"""
+        return await self.patch(
+            self.endpoints.update_address_for_customer.format(
+                customer_id=customer_id, address_id=address_id
+            ),
+            data.model_dump(exclude_none=True),
+        )
+
+    """
+    Businesses
+    """
+
+    async def create_business_for_customer(
+        self, customer_id: str, data: BusinessRequest
+    ) -> BusinessResponse:
+        """Create a business for a customer"""
+        return await self.post(
+            self.endpoints.create_business_for_customer.format(customer_id=customer_id),
+            data.model_dump(exclude_none=True),
+        )
+
+    async def get_business_for_customer(
+        self, customer_id: str, business_id: str
+    ) -> BusinessResponse:
+        """Get a business for a customer"""
+        return await self.get(
+            self.endpoints.get_business_for_customer.format(
+                customer_id=customer_id, business_id=business_id
+            )
+        )
+
+    async def list_businesses_for_customer(
+        self,
+        customer_id: str,
+        query_params: BusinessQueryParams = BusinessQueryParams(),
+        paginate: Paginate = None,
+    ) -> BusinessesResponse:
+        """List all businesses for a customer"""
+        return await self.get(
+            (
+                dict(paginate)["next"]
+                if paginate
+                else self.endpoints.list_businesses_for_customer.format(
+                    customer_id=customer_id
+                )
+            ),
+            params=query_params.model_dump(exclude_none=True),
+        )
+
+    def iter_businesses_for_customer(
+        self,
+        customer_id: str,
+        query_params: BusinessQueryParams = BusinessQueryParams(),
+        prefetch: int = 1,
+    ) -> AsyncIterator[Business]:
+        """Iterate over all businesses for a customer, fetching pages ahead"""
+        return async_iterate(
+            partial(self.list_businesses_for_customer, customer_id),
+            prefetch,
+            query_params=query_params,
+        )
+
+    async def update_business_for_customer(
+        self, customer_id: str, business_id: str, data: BusinessRequest
+    ) -> BusinessResponse:
+        """Update a business for a customer"""
+        return await self.patch(
+            self.endpoints.update_business_for_customer.format(
+                customer_id=customer_id, business_id=business_id
+            ),
+            data.model_dump(exclude_none=True),
+        )
+
+    """
+    Transactions
+    """
+
+    async def create_transaction(
+        self,
+        data: TransactionRequest,
+        query_params: TransactionQueryParams = TransactionQueryParams(),
+    ) -> TransactionResponse:
+        """Create a transaction"""
+        return await self.post(
+            self.endpoints.create_transaction,
+            data.model_dump(exclude_none=True),
+            params=query_params.model_dump(exclude_none=True),
+        )
+
+    async def get_transaction(
+        self,
+        transaction_id: str,
+        query_params: TransactionQueryParams = TransactionQueryParams(),
+    ) -> TransactionResponse:
+        """Get a transaction"""
+        return await self.get(
+            self.endpoints.get_transaction.format(transaction_id=transaction_id),
+            params=query_params.model_dump(exclude_none=True),
+        )
+
+    async def list_transactions(
+        self,
+        query_params: TransactionQueryParams = TransactionQueryParams(),
+        paginate: Paginate = None,
+    ) -> TransactionsResponse:
+        """List all transactions"""
+        return await self.get(
+            dict(paginate)["next"] if paginate else self.endpoints.list_transactions,
+            params=query_params.model_dump(exclude_none=True, by_alias=True),
+        )
+
+    def iter_transactions(
+        self,
+        query_params: TransactionQueryParams = TransactionQueryParams(),
+        prefetch: int = 1,
+    ) -> AsyncIterator[Transaction]:
+        """Iterate over all transactions, fetching pages ahead"""
+        return async_iterate(
+            self.list_transactions, prefetch, query_params=query_params
+        )
+
+    async def get_transactions_by_ids(
+        self,
+        transaction_ids: list[str],
+        query_params: TransactionQueryParams = TransactionQueryParams(),
+        max_concurrency: int = 4,
+    ) -> TransactionsByIdsResponse:
+        """Get transactions by ids, fetching pages of ids concurrently"""
+        return await get_by_ids_async(
+            self, "transaction", transaction_ids, query_params, max_concurrency
+        )
+
+    async def update_transaction(
+        self,
+        transaction_id: str,
+        data: TransactionRequest,
+        query_params: TransactionQueryParams = TransactionQueryParams(),
+    ) -> TransactionResponse:
+        """Update a transaction"""
+        return await self.patch(
+            self.endpoints.update_transaction.format(transaction_id=transaction_id),
+            data.model_dump(exclude_none=True),
+            params=query_params.model_dump(exclude_none=True),
+        )
+
+    async def preview_transaction(
+        self,
+        data: TransactionRequest,
+        query_params: TransactionQueryParams = TransactionQueryParams(),
+    ) -> TransactionPreviewResponse:
+        """Preview a transaction"""
+        return await self.post(
+            self.endpoints.preview_transaction,
+            data.model_dump(exclude_none=True),
+            params=query_params.model_dump(exclude_none=True),
+        )
+
+    async def preview_prices(self, data: TransactionRequest) -> TransactionResponse:
+        """Preview prices"""
+        return await self.post(
+            self.endpoints.preview_prices,
+            data.model_dump(exclude_none=True),
+        )
+
+    async def get_pdf_for_transaction(
+        self, transaction_id: str
+    ) -> TransactionPdfResponse:
+        """Get a PDF for a transaction"""
+        return await self.get(
+            self.endpoints.get_pdf_for_transaction.format(transaction_id=transaction_id)
+        )
+
+    """
+    Subscriptions
+    """
+
+    async def get_subscription(self, subscription_id: str) -> SubscriptionResponse:
+        """Get a subscription"""
+        return await self.get(
+            self.endpoints.get_subscription.format(subscription_id=subscription_id)
+        )
+
+    async def list_subscriptions(
+        self,
+        query_params: SubscriptionQueryParams = SubscriptionQueryParams(),
+        paginate: Paginate = None,
+    ) -> SubscriptionsResponse:
+        """List all subscriptions"""
+        return await self.get(
+            dict(paginate)["next"] if paginate else self.endpoints.list_subscriptions,
+            params=query_params.model_dump(exclude_none=True),
+        )
+
+    def iter_subscriptions(
+        self,
+        query_params: SubscriptionQueryParams = SubscriptionQueryParams(),
+        prefetch: int = 1,
+    ) -> AsyncIterator[Subscription]:
+        """Iterate over all subscriptions, fetching pages ahead"""
+        return async_iterate(
+            self.list_subscriptions, prefetch, query_params=query_params
+        )
+
+    async def preview_update_subscription(
+        self, subscription_id: str, data: SubscriptionRequest
+    ) -> SubscriptionResponse:
+        """Preview an update to a subscription"""
+        return await self.patch(
+            self.endpoints.preview_update_subscription.format(
+                subscription_id=subscription_id
+            ),
+            data.model_dump(exclude_none=True),
+        )
+
+    async def update_subscription(
+        self, subscription_id: str, data: SubscriptionRequest
+    ) -> SubscriptionResponse:
+        """Update a subscription"""
+        return await self.patch(
+            self.endpoints.update_subscription.format(subscription_id=subscription_id),
+            data.model_dump(exclude_none=True),
+        )
+
+    async def unschedule_scheduled_action_from_subscription(
+        self, subscription_id: str
+    ) -> SubscriptionResponse:
+        """Remove a scheduled action from a subscription"""
+        return await self.patch(
+            self.endpoints.update_subscription.format(subscription_id=subscription_id),
+            {"scheduled_change": None},
+        )
+
+    async def get_transaction_to_update_payment_method(
+        self, subscription_id: str
+    ) -> TransactionResponse:
+        """Get a transaction to update a payment method"""
+        return await self.get(
+            self.endpoints.get_transaction_to_update_payment_method.format(
+                subscription_id=subscription_id
+            )
+        )
+
+    async def preview_one_time_charge(
+        self, subscription_id: str, data: SubscriptionRequest
+    ) -> SubscriptionResponse:
+        """Preview a one-time charge"""
+        return await self.post(
+            self.endpoints.preview_one_time_charge.format(
+                subscription_id=subscription_id
+            ),
+            data.model_dump(exclude_none=True),
+        )
+
+    async def create_one_time_charge(
+        self, subscription_id: str, data: SubscriptionRequest
+    ) -> SubscriptionResponse:
+        """Create a one-time charge"""
+        return await self.post(
+            self.endpoints.create_one_time_charge.format(
+                subscription_id=subscription_id
+            ),
+            data.model_dump(exclude_none=True),
+        )
+
+    async def activate_trialing_subscription(
+        self, subscription_id: str, data: SubscriptionRequest
+    ) -> SubscriptionResponse:
+        """Activate a trialing subscription"""
+        return await self.post(
+            self.endpoints.activate_trialing_subscription.format(
+                subscription_id=subscription_id
+            ),
+            data.model_dump(exclude_none=True),
+        )
+
+    async def pause_subscription(
+        self, subscription_id: str, data: SubscriptionRequest
+    ) -> SubscriptionResponse:
+        """Pause a subscription"""
+        return await self.post(
+            self.endpoints.pause_subscription.format(subscription_id=subscription_id),
+            data.model_dump(),
+        )
+
+    async def resume_subscription(
+        self, subscription_id: str, data: SubscriptionRequest
+    ) -> SubscriptionResponse:
+        """Resume a subscription"""
+        return await self.post(
+            self.endpoints.resume_subscription.format(subscription_id=subscription_id),
+            data.model_dump(exclude_none=True),
+        )
+
+    async def cancel_subscription(
+        self, subscription_id: str, data: SubscriptionRequest
+    ) -> SubscriptionResponse:
+        """Cancel a subscription"""
+        return await self.post(
+            self.endpoints.cancel_subscription.format(subscription_id=subscription_id),
+            data.model_dump(exclude_none=True),
+        )
+
+    """
+    Adjustments
+    """
+
+    async def create_adjustment(self, data: AdjustmentRequest) -> AdjustmentResponse:
+        """Create a customer"""
+        return await self.post(
+            self.endpoints.create_adjustment, data.model_dump(exclude_none=True)
+        )
+
+    async def list_adjustments(
+        self,
+        query_params: AdjustmentQueryParams = AdjustmentQueryParams(),
+        paginate: Paginate = None,
+    ) -> AdjustmentsResponse:
+        """List all customers"""
+        return await self.get(
+            dict(paginate)["next"] if paginate else self.endpoints.list_adjustments,
+            params=query_params.model_dump(exclude_none=True),
+        )
+
+    def iter_adjustments(
+        self,
+        query_params: AdjustmentQueryParams = AdjustmentQueryParams(),
+        prefetch: int = 1,
+    ) -> AsyncIterator[Adjustment]:
+        """Iterate over all adjustments, fetching pages ahead"""
+        return async_iterate(self.list_adjustments, prefetch, query_params=query_params)
+
+    async def get_adjustments_by_ids(
+        self,
+        adjustment_ids: list[str],
+        query_params: AdjustmentQueryParams = AdjustmentQueryParams(),
+        max_concurrency: int = 4,
+    ) -> AdjustmentsByIdsResponse:
+        """Get adjustments by ids, fetching pages of ids concurrently"""
+        return await get_by_ids_async(
+            self, "adjustment", adjustment_ids, query_params, max_concurrency
+        )
+
+    """
+    Events
+    """
+
+    async def list_event_types(self) -> EventTypesResponse:
+        """List all customers"""
+        return await self.get(self.endpoints.list_event_types)
+
+    async def list_events(
+        self,
+        paginate: Paginate = None,
+        query_params: EventQueryParams = EventQueryParams(),
+    ) -> EventsResponse:
+        """List all events"""
+        return await self.get(
+            dict(paginate)["next"] if paginate else self.endpoints.list_events,
+            params=query_params.model_dump(exclude_none=True),
+        )
+
+    def iter_events(
+        self, query_params: EventQueryParams = EventQueryParams(), prefetch: int = 1
+    ) -> AsyncIterator[Event]:
+        """Iterate over all events, fetching pages ahead"""
+        return async_iterate(self.list_events, prefetch, query_params=query_params)
+
+    """
+    Notification settings
+    """
+
+    async def create_notification_setting(
+        self, data: NotificationSettingRequest
+    ) -> NotificationSettingResponse:
+        """Create notification settings"""
+        return await self.post(
+            self.endpoints.create_notification_setting,
+            data.model_dump(exclude_none=True),
+        )
+
+    async def get_notification_setting(
+        self, notification_setting_id: str
+    ) -> NotificationSettingResponse:
+        """Get notification settings"""
+        return await self.get(
+            self.endpoints.get_notification_setting.format(
+                notification_setting_id=notification_setting_id
+            )
+        )
+
+    async def list_notification_settings(self) -> NotificationSettingsResponse:
+        """List notification settings"""
+        return await self.get(self.endpoints.list_notification_settings)
+
+    async def update_notification_setting(
+        self, notification_setting_id: str, data: NotificationSettingRequest
+    ) -> NotificationSettingResponse:
+        """Update notification settings"""
+        return await self.patch(
+            self.endpoints.update_notification_setting.format(
+                notification_setting_id=notification_setting_id
+            ),
+            data.model_dump(exclude_none=True),
+        )
+
+    async def delete_notification_setting(
+        self, notification_setting_id: str
+    ) -> NotificationSettingResponse | None:
+        """Delete notification settings"""
+        return await self.delete(
+            self.endpoints.delete_notification_setting.format(
+                notification_setting_id=notification_setting_id
+            )
+        )
+
+    """
+    Notifications
+    """
+
+    async def get_notification(self, notification_id: str) -> NotificationResponse:
+        """Get a notification"""
+        return await self.get(
+            self.endpoints.get_notification.format(notification_id=notification_id)
+        )
+
+    async def list_notifications(
+        self,
+        query_params: NotificationQueryParams = NotificationQueryParams(),
+        paginate: Paginate = None,
+    ) -> NotificationsResponse:
+        """List all notifications"""
+        return await self.get(
+            dict(paginate)["next"] if paginate else self.endpoints.list_notifications,
+            params=query_params.model_dump(exclude_none=True),
+        )
+
+    def iter_notifications(
+        self,
+        query_params: NotificationQueryParams = NotificationQueryParams(),
+        prefetch: int = 1,
+    ) -> AsyncIterator[Notification]:
+        """Iterate over all notifications, fetching pages ahead"""
+        return async_iterate(
+            self.list_notifications, prefetch, query_params=query_params
+        )
+
+    async def replay_notification(
+        self, notification_id: str
+    ) -> NotificationReplayResponse:
+        """Replay a notification"""
+        return await self.post(
+            self.endpoints.replay_notification.format(notification_id=notification_id),
+            dict(),
+        )
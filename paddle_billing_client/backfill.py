@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import contextvars
+import heapq
+import pickle
+import tempfile
+import threading
+from collections import deque
+from datetime import datetime, timezone
+
+from paddle_billing_client.endpoints import MAX_PER_PAGE
+from paddle_billing_client.models.event import EventQueryParams
+from paddle_billing_client.pagination import paginate
+from paddle_billing_client.sharding import split_time_range
+
+# Crockford base32 alphabet of the ULIDs in Paddle ids.
+ULID_ALPHABET = "0123456789abcdefghjkmnpqrstvwxyz"
+
+
+def get_event_cursor(value: datetime) -> str:
+    """Return an `after` cursor of `list_events` placed at the given time.
+
+    Paddle ids are ULIDs, whose first 10 characters encode their creation time
+    in milliseconds: listing events after the id with that time and no random
+    part returns the events created from that time on.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    timestamp = int(value.timestamp() * 1000)
+    encoded = ""
+    for _ in range(10):
+        timestamp, index = divmod(timestamp, 32)
+        encoded = ULID_ALPHABET[index] + encoded
+    return f"evt_{encoded}{'0' * 16}"
+
+
+def get_event_partitions(
+    start: datetime | None = None,
+    end: datetime | None = None,
+    partitions: int = 4,
+    cursors: list[str] | None = None,
+) -> list[tuple[str | None, str | None]]:
+    """Return the (after, before) event id bounds of each partition.
+
+    Partitions split [start, end) in equal time windows, or start at each of
+    the given `cursors` (e.g. saved by previous runs) and end at the next one.
+    """
+    if cursors:
+        bounds = sorted(cursors) + [get_event_cursor(end) if end else None]
+    else:
+        if start is None:
+            raise ValueError("Either start or cursors is required")
+        end = end or datetime.now(timezone.utc)
+        windows = split_time_range(start, end, partitions)
+        bounds = [get_event_cursor(window[0]) for window in windows]
+        bounds.append(get_event_cursor(end))
+    return list(zip(bounds, bounds[1:]))
+
+
+class EventSpool:
+    """Pages of events fetched by a partition ahead of the merge.
+
+    The first `in_memory` pending pages are kept in memory and the next ones
+    are pickled to `file`, so a partition keeps fetching while the merge is
+    busy with the others, without holding its history in memory. Up to
+    `max_spooled` pages are pickled before `put` waits for the merge, None
+    lets the file grow up to the whole window of the partition.
+    """
+
+    def __init__(self, in_memory: int, file, max_spooled: int | None = None):
+        self.in_memory = in_memory
+        self.max_spooled = max_spooled
+        self.pages: deque[list] = deque()
+        self.file = file
+        self.spooled = 0
+        self.read_at = self.write_at = 0
+        self.done = False
+        self.error: Exception | None = None
+        self.condition = threading.Condition()
+
+    def put(self, events: list):
+        """Add the events of the next page"""
+        with self.condition:
+            while not self.file.closed:
+                if not self.spooled and len(self.pages) < self.in_memory:
+                    self.pages.append(events)
+                    self.condition.notify()
+                    return
+                if self.max_spooled is None or self.spooled < self.max_spooled:
+                    break
+                self.condition.wait()
+        # Only the fetching thread writes, and pages read from the file are
+        # never older than those in memory, so pickling can run unlocked.
+        data = pickle.dumps(events, pickle.HIGHEST_PROTOCOL)
+        with self.condition:
+            if self.file.closed:
+                return
+            self.file.seek(self.write_at)
+            self.file.write(data)
+            self.write_at += len(data)
+            self.spooled += 1
+            self.condition.notify()
+
+    def finish(self, error: Exception | None = None):
+        """Mark the last page as added, or the fetch as failed with `error`"""
+        with self.condition:
+            self.done, self.error = True, error
+            self.condition.notify()
+
+    def get(self) -> list | None:
+        """Return the events of the next page, or None after the last one"""
+        with self.condition:
+            while not (self.pages or self.spooled or self.done):
+                self.condition.wait()
+            if self.pages:
+                self.condition.notify()
+                return self.pages.popleft()
+            if self.spooled:
+                self.file.seek(self.read_at)
+                events = pickle.load(self.file)
+                self.read_at = self.file.tell()
+                self.spooled -= 1
+                self.condition.notify()
+                if not self.spooled:
+                    self.file.seek(0)
+                    self.file.truncate()
+                    self.read_at = self.write_at = 0
+                return events
+            if self.error is not None:
+                raise self.error
+            return None
+
+    def close(self):
+        """Drop the spooled pages, ignoring the pages added afterwards"""
+        with self.condition:
+            self.file.close()
+            self.condition.notify_all()
+
+
+def iter_partition(
+    client,
+    after: str | None,
+    before: str | None,
+    query_params: EventQueryParams | None = None,
+    prefetch: int = 2,
+    max_spooled: int | None = None,
+):
+    """Yield the events with an id between `after` and `before`, in id order.
+
+    The pages are fetched by a background thread, which keeps up to
+    `prefetch` pages in memory and spools the next `max_spooled` ones to a
+    temporary file, deleted when the generator is closed.
+    """
+    if prefetch < 1:
+        raise ValueError(f"Prefetch must be at least 1, got: {prefetch}")
+    query_params = (query_params or EventQueryParams()).model_copy(
+        update={
+            "after": after,
+            "order_by": None,
+            "per_page": (query_params and query_params.per_page)
+            or MAX_PER_PAGE["events"],
+        }
+    )
+    stop = threading.Event()
+
+    def fetch():
+        pages = paginate(client.list_events, query_params=query_params)
+        try:
+            for page in pages:
+                if stop.is_set():
+                    return
+                events = page.data
+                if before is not None:
+                    events = [event for event in events if event.event_id < before]
+                spool.put(events)
+                if len(events) < len(page.data):
+                    break
+        except Exception as error:
+            spool.finish(error)
+            return
+        finally:
+            pages.close()
+        spool.finish()
+
+    with tempfile.TemporaryFile() as file:
+        spool = EventSpool(prefetch, file, max_spooled)
+        context = contextvars.copy_context()
+        thread = threading.Thread(target=context.run, args=(fetch,), daemon=True)
+        try:
+            thread.start()
+            while (events := spool.get()) is not None:
+                yield from events
+        finally:
+            stop.set()
+            spool.close()
+
+
+def backfill_events(
+    client,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    partitions: int = 4,
+    cursors: list[str] | None = None,
+    query_params: EventQueryParams | None = None,
+    prefetch: int = 2,
+    max_spooled: int | None = None,
+):
+    """Yield the event history in event id order, fetching partitions in parallel.
+
+    The history is split by `get_event_partitions`, each partition paginated by
+    its own thread, and the partitions are merged with a k-way merge on the
+    event id, the order Paddle lists events in. Ids start with the time events
+    are created, so the stream follows `occurred_at` except for events created
+    after they occurred. Partitions ahead of the merge keep fetching, with
+    `prefetch` pages per partition kept in memory and the others spooled to a
+    temporary file. `max_spooled` bounds the pages spooled per partition,
+    without it a partition spools up to its whole window while the merge is
+    behind it.
+
+    :param client: The `PaddleApiClient` used for the list calls.
+    :param cursors: Event ids starting each partition, instead of a time range.
+    """
+    iterators = [
+        iter_partition(client, after, before, query_params, prefetch, max_spooled)
+        for after, before in get_event_partitions(start, end, partitions, cursors)
+    ]
+    try:
+        yield from heapq.merge(*iterators, key=lambda event: event.event_id)
+    finally:
+        for iterator in iterators:
+            iterator.close()
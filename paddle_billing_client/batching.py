@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+from typing import Any, Literal
+
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from pydantic import BaseModel
+
+from paddle_billing_client.endpoints import MAX_PER_PAGE
+from paddle_billing_client.models.adjustment import (
+    AdjustmentQueryParams,
+    AdjustmentsByIdsResponse,
+)
+from paddle_billing_client.models.discount import (
+    DiscountQueryParams,
+    DiscountsByIdsResponse,
+)
+from paddle_billing_client.models.price import PriceQueryParams, PricesByIdsResponse
+from paddle_billing_client.models.product import (
+    ProductQueryParams,
+    ProductsByIdsResponse,
+)
+from paddle_billing_client.models.transaction import (
+    TransactionQueryParams,
+    TransactionsByIdsResponse,
+)
+from paddle_billing_client.options import async_call_parsed, call_parsed
+
+Entity = Literal["product", "price", "transaction", "discount", "adjustment"]
+
+# List method, query params and by-ids response of the entities whose list
+# endpoint has an `id` filter.
+BATCHED_ENTITIES: dict[str, tuple[str, type[BaseModel], type[BaseModel]]] = {
+    "product": ("list_products", ProductQueryParams, ProductsByIdsResponse),
+    "price": ("list_prices", PriceQueryParams, PricesByIdsResponse),
+    "transaction": (
+        "list_transactions",
+        TransactionQueryParams,
+        TransactionsByIdsResponse,
+    ),
+    "discount": ("list_discounts", DiscountQueryParams, DiscountsByIdsResponse),
+    "adjustment": (
+        "list_adjustments",
+        AdjustmentQueryParams,
+        AdjustmentsByIdsResponse,
+    ),
+}
+
+
+# Every status of the entities whose list endpoint only returns active ones by
+# default, while their single get returns them whatever their status.
+ENTITY_STATUSES: dict[str, str] = {
+    "product": "active,archived",
+    "price": "active,archived",
+    "discount": "active,archived,expired,used",
+}
+
+
+def get_chunk_size(entity: Entity) -> int:
+    """Return how many ids of the entity can be fetched with one list call"""
+    list_method, _, _ = BATCHED_ENTITIES[entity]
+    return MAX_PER_PAGE[list_method.removeprefix("list_")]
+
+
+def chunk_ids(ids: list[str], size: int) -> list[list[str]]:
+    """Split unique ids into chunks of at most `size` ids, keeping their order"""
+    ids = list(dict.fromkeys(ids))
+    return [ids[start : start + size] for start in range(0, len(ids), size)]
+
+
+def get_list_call(client, entity: Entity, ids: list[str], query_params=None):
+    """Return the list method and query params fetching the ids in one page.
+
+    Entities of any status are returned unless `query_params` filters them, like
+    single gets do.
+    """
+    list_method, query_params_class, _ = BATCHED_ENTITIES[entity]
+    query_params = query_params or query_params_class()
+    update = {"id": ",".join(ids), "per_page": len(ids), "after": None}
+    if entity in ENTITY_STATUSES and query_params.status is None:
+        update["status"] = ENTITY_STATUSES[entity]
+    return getattr(client, list_method), query_params.model_copy(update=update)
+
+
+def fetch_chunk(
+    client, entity: Entity, ids: list[str], query_params=None
+) -> dict[str, Any]:
+    """Fetch up to a page of entities with one list call, returning them by id"""
+    list_method, chunk_query_params = get_list_call(client, entity, ids, query_params)
+    response = call_parsed(list_method, query_params=chunk_query_params)
+    return {item.id: item for item in response.data}
+
+
+async def fetch_chunk_async(
+    client, entity: Entity, ids: list[str], query_params=None
+) -> dict[str, Any]:
+    """Asyncio counterpart of `fetch_chunk` for `AsyncPaddleApiClient`"""
+    list_method, chunk_query_params = get_list_call(client, entity, ids, query_params)
+    response = await async_call_parsed(list_method, query_params=chunk_query_params)
+    return {item.id: item for item in response.data}
+
+
+def get_by_ids(
+    client, entity: Entity, ids: list[str], query_params=None, max_workers: int = 4
+) -> BaseModel:
+    """Fetch entities by ids, one list call per page of ids, `max_workers` at a time.
+
+    Return the by-ids response of the entity: the found entities by id and
+    the ids Paddle did not return.
+    """
+    chunks = chunk_ids(ids, get_chunk_size(entity))
+    with ThreadPoolExecutor(max_workers) as executor:
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run,
+                fetch_chunk,
+                client,
+                entity,
+                chunk,
+                query_params,
+            )
+            for chunk in chunks
+        ]
+        items = {}
+        for future in futures:
+            items.update(future.result())
+    return get_by_ids_result(entity, chunks, items)
+
+
+async def get_by_ids_async(
+    client, entity: Entity, ids: list[str], query_params=None, max_concurrency: int = 4
+) -> BaseModel:
+    """Asyncio counterpart of `get_by_ids` for `AsyncPaddleApiClient`"""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(chunk):
+        async with semaphore:
+            return await fetch_chunk_async(client, entity, chunk, query_params)
+
+    chunks = chunk_ids(ids, get_chunk_size(entity))
+    items = {}
+    for chunk_items in await asyncio.gather(*[fetch(chunk) for chunk in chunks]):
+        items.update(chunk_items)
+    return get_by_ids_result(entity, chunks, items)
+
+
+def get_by_ids_result(
+    entity: Entity, chunks: list[list[str]], items: dict[str, Any]
+) -> BaseModel:
+    """Return the by-ids response of the entity, its items being parsed already"""
+    _, _, response_model = BATCHED_ENTITIES[entity]
+    return response_model.model_construct(
+        data=items,
+        missing=[id for chunk in chunks for id in chunk if id not in items],
+    )
+
+
+class BatchLoader:
+    """Resolve single-entity loads made within a short window with list calls.
+
+    DataLoader-style batching for `PaddleApiClient`: calls to `load` made by
+    any thread within `window` seconds are collected and resolved with one
+    `list_*` call filtered by `id` (one call per page of ids), instead of one
+    `get_*` call each, `max_workers` pages at a time. `load` returns the
+    entity model, or None when Paddle does not return the id.
+
+    Batching is opt-in: the `get_*` methods of the client are not routed
+    through a loader, as they return the whole response (with its `meta`) and
+    raise on unknown ids, which a list call cannot reproduce.
+
+    The batch runs with the request options of the call that opened the window.
+
+    :param client: The `PaddleApiClient` used for the list calls.
+    :param entity: `product`, `price`, `transaction`, `discount` or `adjustment`.
+    :param window: Seconds to wait for more loads before sending a batch.
+    :param query_params: Extra list filters, e.g. `include` for transactions.
+    :param max_workers: Pages of ids fetched concurrently.
+    """
+
+    def __init__(
+        self,
+        client,
+        entity: Entity,
+        window: float = 0.005,
+        query_params=None,
+        max_workers: int = 4,
+    ):
+        self.client = client
+        self.entity = entity
+        self.window = window
+        self.query_params = query_params
+        self.max_workers = max_workers
+        self._pending: dict[str, list[Future]] = {}
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+
+    def load(self, entity_id: str):
+        """Return the entity with the given id, batched with concurrent loads"""
+        return self.load_future(entity_id).result()
+
+    def load_many(self, entity_ids: list[str]) -> list:
+        """Return the entities with the given ids, in the same order"""
+        futures = [self.load_future(entity_id) for entity_id in entity_ids]
+        return [future.result() for future in futures]
+
+    def load_future(self, entity_id: str) -> Future:
+        """Schedule the load of an entity and return its future"""
+        future: Future = Future()
+        with self._lock:
+            self._pending.setdefault(entity_id, []).append(future)
+            if self._timer is None:
+                context = contextvars.copy_context()
+                self._timer = threading.Timer(
+                    self.window, lambda: context.run(self.dispatch)
+                )
+                self._timer.daemon = True
+                self._timer.start()
+        return future
+
+    def dispatch(self) -> None:
+        """Send the pending loads now"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = None
+
+        chunks = chunk_ids(list(pending), get_chunk_size(self.entity))
+        with ThreadPoolExecutor(min(self.max_workers, len(chunks) or 1)) as executor:
+            fetches = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    fetch_chunk,
+                    self.client,
+                    self.entity,
+                    ids,
+                    self.query_params,
+                )
+                for ids in chunks
+            ]
+            for ids, fetch in zip(chunks, fetches):
+                try:
+                    items = fetch.result()
+                except Exception as error:
+                    for entity_id in ids:
+                        for future in pending[entity_id]:
+                            future.set_exception(error)
+                    continue
+                for entity_id in ids:
+                    for future in pending[entity_id]:
+                        future.set_result(items.get(entity_id))
+
+
+class AsyncBatchLoader:
+    """Asyncio counterpart of `BatchLoader` for `AsyncPaddleApiClient`.
+
+    Loads awaited within `window` seconds are resolved together, each page
+    of ids with one list call, all pages concurrently. Like `BatchLoader`, it
+    is used explicitly instead of the `get_*` methods.
+    """
+
+    def __init__(
+        self, client, entity: Entity, window: float = 0.005, query_params=None
+    ):
+        self.client = client
+        self.entity = entity
+        self.window = window
+        self.query_params = query_params
+        self._pending: dict[str, list[asyncio.Future]] = {}
+        self._handle: asyncio.TimerHandle | None = None
+        # The loop only keeps weak references to tasks: dispatches are kept
+        # here until they finish.
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, entity_id: str):
+        """Return the entity with the given id, batched with concurrent loads"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(entity_id, []).append(future)
+        if self._handle is None:
+            self._handle = loop.call_later(self.window, self._start_dispatch)
+        return await future
+
+    async def load_many(self, entity_ids: list[str]) -> list:
+        """Return the entities with the given ids, in the same order"""
+        return list(
+            await asyncio.gather(*[self.load(entity_id) for entity_id in entity_ids])
+        )
+
+    def _start_dispatch(self) -> None:
+        task = asyncio.get_running_loop().create_task(self.dispatch())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def dispatch(self) -> None:
+        """Send the pending loads now"""
+        pending, self._pending = self._pending, {}
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = None
+
+        chunks = chunk_ids(list(pending), get_chunk_size(self.entity))
+        results = await asyncio.gather(
+            *[
+                fetch_chunk_async(self.client, self.entity, ids, self.query_params)
+                for ids in chunks
+            ],
+            return_exceptions=True,
+        )
+        for ids, items in zip(chunks, results):
+            for entity_id in ids:
+                for future in pending[entity_id]:
+                    if future.done():
+                        continue
+                    if isinstance(items, BaseException):
+                        future.set_exception(items)
+                    else:
+                        future.set_result(items.get(entity_id))
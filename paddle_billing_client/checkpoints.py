@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+
+from pydantic import BaseModel, ConfigDict
+
+
+class Checkpoint(BaseModel):
+    """Progress of a paginated walk, saved after each processed page."""
+
+    # Url of the next page, None before the first page is processed.
+    next: str | None = None
+    # Number of pages and items processed so far.
+    pages: int = 0
+    items: int = 0
+    # Whether the last page was processed.
+    completed: bool = False
+    # Id of the last processed item, for walks resumed by id like `follow_events`.
+    last_id: str | None = None
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class CheckpointStore(ABC):
+    """Base class of the checkpoint stores used by `resumable_paginate`."""
+
+    @abstractmethod
+    def load(self, key: str) -> Checkpoint | None:
+        """Return the checkpoint saved under `key`, or None"""
+
+    @abstractmethod
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        """Save the checkpoint under `key`, replacing the previous one"""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Delete the checkpoint saved under `key`, if any"""
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Keep each checkpoint in a JSON file of `directory`.
+
+    Files are replaced atomically, so a crash while saving leaves the previous
+    checkpoint in place.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def get_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load(self, key: str) -> Checkpoint | None:
+        try:
+            with open(self.get_path(key)) as file:
+                return Checkpoint.model_validate_json(file.read())
+        except FileNotFoundError:
+            return None
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        fd, path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as file:
+            file.write(checkpoint.model_dump_json())
+        os.replace(path, self.get_path(key))
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self.get_path(key))
+        except FileNotFoundError:
+            pass
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """Keep checkpoints in a table of an SQLite database."""
+
+    def __init__(self, path: str, table: str = "paddle_checkpoints"):
+        self.path = path
+        self.table = table
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, value TEXT)"
+            )
+
+    def load(self, key: str) -> Checkpoint | None:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT value FROM {self.table} WHERE key = ?", (key,)  # nosec B608
+            ).fetchone()
+        return Checkpoint.model_validate(json.loads(row[0])) if row else None
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?)",  # nosec B608
+                (key, checkpoint.model_dump_json()),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"DELETE FROM {self.table} WHERE key = ?", (key,)  # nosec B608
+            )
+
+    def close(self) -> None:
+        self._connection.close()
@@ -1,24 +1,37 @@
 from __future__ import annotations
 
+from typing import Iterable
+
+from functools import partial
+
 from apiclient.client import APIClient
-from apiclient.response_handlers import JsonResponseHandler
-from apiclient_pydantic import serialize_all_methods
 
+from paddle_billing_client.batching import get_by_ids
+from paddle_billing_client.connection_pool import (
+    ConnectionPoolConfig,
+    PooledHTTPAdapter,
+)
 from paddle_billing_client.endpoints import Endpoints
 from paddle_billing_client.formatters import CustomJsonRequestFormatter
+from paddle_billing_client.idempotency import IdempotencyKeyStore
+from paddle_billing_client.identity import IdentityMap
 from paddle_billing_client.models.address import (
+    Address,
     AddressesResponse,
     AddressQueryParams,
     AddressRequest,
     AddressResponse,
 )
 from paddle_billing_client.models.adjustment import (
+    Adjustment,
     AdjustmentQueryParams,
     AdjustmentRequest,
     AdjustmentResponse,
+    AdjustmentsByIdsResponse,
     AdjustmentsResponse,
 )
 from paddle_billing_client.models.business import (
+    Business,
     BusinessesResponse,
     BusinessQueryParams,
     BusinessRequest,
@@ -26,6 +39,7 @@ from paddle_billing_client.models.business import (
 )
 from paddle_billing_client.models.common import Paginate
 from paddle_billing_client.models.customer import (
+    Customer,
     CustomerBalancesQueryParams,
     CustomerBalancesResponse,
     CustomerQueryParams,
@@ -34,13 +48,21 @@ from paddle_billing_client.models.customer import (
     CustomersResponse,
 )
 from paddle_billing_client.models.discount import (
+    Discount,
     DiscountQueryParams,
     DiscountRequest,
     DiscountResponse,
+    DiscountsByIdsResponse,
     DiscountsResponse,
 )
-from paddle_billing_client.models.event import EventsResponse, EventTypesResponse
+from paddle_billing_client.models.event import (
+    Event,
+    EventQueryParams,
+    EventsResponse,
+    EventTypesResponse,
+)
 from paddle_billing_client.models.notification import (
+    Notification,
     NotificationQueryParams,
     NotificationReplayResponse,
     NotificationResponse,
@@ -52,48 +74,87 @@ from paddle_billing_client.models.notification_setting import (
     NotificationSettingsResponse,
 )
 from paddle_billing_client.models.price import (
+    Price,
     PriceQueryParams,
     PriceRequest,
     PriceResponse,
+    PricesByIdsResponse,
     PricesResponse,
 )
 from paddle_billing_client.models.product import (
+    Product,
     ProductQueryParams,
     ProductRequest,
     ProductResponse,
+    ProductsByIdsResponse,
     ProductsResponse,
 )
 from paddle_billing_client.models.subscription import (
+    Subscription,
     SubscriptionQueryParams,
     SubscriptionRequest,
     SubscriptionResponse,
     SubscriptionsResponse,
 )
 from paddle_billing_client.models.transaction import (
+    Transaction,
     TransactionPdfResponse,
     TransactionPreviewResponse,
     TransactionQueryParams,
     TransactionRequest,
     TransactionResponse,
+    TransactionsByIdsResponse,
     TransactionsResponse,
 )
+from paddle_billing_client.pagination import iterate
+from paddle_billing_client.rate_limiting import RateLimiter
+from paddle_billing_client.request_strategies import PaddleRequestStrategy
+from paddle_billing_client.retrying import RetryPolicy
+from paddle_billing_client.serializers import (
+    PydanticResponseHandler,
+    serialize_all_methods,
+)
+from paddle_billing_client.single_flight import SingleFlight
 
 
-@serialize_all_methods()
+@serialize_all_methods
 class PaddleApiClient(APIClient):
     def __init__(
         self,
         base_url="https://sandbox-api.paddle.com",
         request_formatter=CustomJsonRequestFormatter,
-        response_handler=JsonResponseHandler,
+        response_handler=PydanticResponseHandler,
+        connection_pool: ConnectionPoolConfig | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        idempotency_keys: IdempotencyKeyStore | None = None,
+        single_flight: bool = False,
+        validate: bool = True,
+        lazy: bool = False,
+        raw: bool = False,
+        identity_map: IdentityMap | None = None,
+        request_strategy=None,
         **kwargs,
     ):
         self.endpoints: Endpoints = Endpoints(base_url=base_url)
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.idempotency_keys = idempotency_keys
+        self.validate = validate
+        self.lazy = lazy
+        self.raw = raw
+        self.identity_map = identity_map
+        self.single_flight = SingleFlight() if single_flight else None
         super().__init__(
             request_formatter=request_formatter,
             response_handler=response_handler,
+            request_strategy=request_strategy or PaddleRequestStrategy(),
             **kwargs,
         )
+        if connection_pool is not None:
+            adapter = PooledHTTPAdapter(connection_pool)
+            self.get_session().mount("https://", adapter)
+            self.get_session().mount("http://", adapter)
 
     """
     Products
@@ -120,6 +181,21 @@ class PaddleApiClient(APIClient):
             params=query_params.model_dump(exclude_none=True),
         )
 
+    def iter_products(
+        self, query_params: ProductQueryParams = ProductQueryParams()
+    ) -> Iterable[Product]:
+        """Iterate over all products, fetching pages as needed"""
+        return iterate(self.list_products, query_params=query_params)
+
+    def get_products_by_ids(
+        self,
+        product_ids: list[str],
+        query_params: ProductQueryParams = ProductQueryParams(),
+        max_workers: int = 4,
+    ) -> ProductsByIdsResponse:
+        """Get products by ids, fetching pages of ids concurrently"""
+        return get_by_ids(self, "product", product_ids, query_params, max_workers)
+
     def update_product(self, product_id: str, data: ProductRequest) -> ProductResponse:
         """Update a product"""
         return self.patch(
@@ -153,6 +229,21 @@ class PaddleApiClient(APIClient):
             params=query_params.model_dump(exclude_none=True),
         )
 
+    def iter_prices(
+        self, query_params: PriceQueryParams = PriceQueryParams()
+    ) -> Iterable[Price]:
+        """Iterate over all prices, fetching pages as needed"""
+        return iterate(self.list_prices, query_params=query_params)
+
+    def get_prices_by_ids(
+        self,
+        price_ids: list[str],
+        query_params: PriceQueryParams = PriceQueryParams(),
+        max_workers: int = 4,
+    ) -> PricesByIdsResponse:
+        """Get prices by ids, fetching pages of ids concurrently"""
+        return get_by_ids(self, "price", price_ids, query_params, max_workers)
+
     def update_price(self, price_id: str, data: PriceRequest) -> PriceResponse:
         """Update a price"""
         return self.patch(
@@ -186,6 +277,21 @@ class PaddleApiClient(APIClient):
             params=query_params.model_dump(exclude_none=True),
         )
 
+    def iter_discounts(
+        self, query_params: DiscountQueryParams = DiscountQueryParams()
+    ) -> Iterable[Discount]:
+        """Iterate over all discounts, fetching pages as needed"""
+        return iterate(self.list_discounts, query_params=query_params)
+
+    def get_discounts_by_ids(
+        self,
+        discount_ids: list[str],
+        query_params: DiscountQueryParams = DiscountQueryParams(),
+        max_workers: int = 4,
+    ) -> DiscountsByIdsResponse:
+        """Get discounts by ids, fetching pages of ids concurrently"""
+        return get_by_ids(self, "discount", discount_ids, query_params, max_workers)
+
     def update_discount(
         self, discount_id: str, data: DiscountRequest
     ) -> DiscountResponse:
@@ -221,6 +327,12 @@ class PaddleApiClient(APIClient):
             params=query_params.model_dump(exclude_none=True),
         )
 
+    def iter_customers(
+        self, query_params: CustomerQueryParams = CustomerQueryParams()
+    ) -> Iterable[Customer]:
+        """Iterate over all customers, fetching pages as needed"""
+        return iterate(self.list_customers, query_params=query_params)
+
     def update_customer(
         self, customer_id: str, data: CustomerRequest
     ) -> CustomerResponse:
@@ -284,6 +396,17 @@ class PaddleApiClient(APIClient):
             params=query_params.model_dump(exclude_none=True),
         )
 
+    def iter_addresses_for_customer(
+        self,
+        customer_id: str,
+        query_params: AddressQueryParams = AddressQueryParams(),
+    ) -> Iterable[Address]:
+        """Iterate over all addresses for a customer, fetching pages as needed"""
+        return iterate(
+            partial(self.list_addresses_for_customer, customer_id),
+            query_params=query_params,
+        )
+
     def update_address_for_customer(
         self, customer_id: str, address_id: str, data: AddressRequest
     ) -> AddressResponse:
@@ -336,6 +459,17 @@ class PaddleApiClient(APIClient):
             params=query_params.model_dump(exclude_none=True),
         )
 
+    def iter_businesses_for_customer(
+        self,
+        customer_id: str,
+        query_params: BusinessQueryParams = BusinessQueryParams(),
+    ) -> Iterable[Business]:
+        """Iterate over all businesses for a customer, fetching pages as needed"""
+        return iterate(
+            partial(self.list_businesses_for_customer, customer_id),
+            query_params=query_params,
+        )
+
     def update_business_for_customer(
         self, customer_id: str, business_id: str, data: BusinessRequest
     ) -> BusinessResponse:
@@ -382,7 +516,24 @@ class PaddleApiClient(APIClient):
         """List all transactions"""
         return self.get(
             dict(paginate)["next"] if paginate else self.endpoints.list_transactions,
-            params=query_params.model_dump(exclude_none=True),
+            params=query_params.model_dump(exclude_none=True, by_alias=True),
+        )
+
+    def iter_transactions(
+        self, query_params: TransactionQueryParams = TransactionQueryParams()
+    ) -> Iterable[Transaction]:
+        """Iterate over all transactions, fetching pages as needed"""
+        return iterate(self.list_transactions, query_params=query_params)
+
+    def get_transactions_by_ids(
+        self,
+        transaction_ids: list[str],
+        query_params: TransactionQueryParams = TransactionQueryParams(),
+        max_workers: int = 4,
+    ) -> TransactionsByIdsResponse:
+        """Get transactions by ids, fetching pages of ids concurrently"""
+        return get_by_ids(
+            self, "transaction", transaction_ids, query_params, max_workers
         )
 
     def update_transaction(
@@ -444,6 +595,12 @@ class PaddleApiClient(APIClient):
             params=query_params.model_dump(exclude_none=True),
         )
 
+    def iter_subscriptions(
+        self, query_params: SubscriptionQueryParams = SubscriptionQueryParams()
+    ) -> Iterable[Subscription]:
+        """Iterate over all subscriptions, fetching pages as needed"""
+        return iterate(self.list_subscriptions, query_params=query_params)
+
     def preview_update_subscription(
         self, subscription_id: str, data: SubscriptionRequest
     ) -> SubscriptionResponse:
@@ -564,6 +721,21 @@ class PaddleApiClient(APIClient):
             params=query_params.model_dump(exclude_none=True),
         )
 
+    def iter_adjustments(
+        self, query_params: AdjustmentQueryParams = AdjustmentQueryParams()
+    ) -> Iterable[Adjustment]:
+        """Iterate over all adjustments, fetching pages as needed"""
+        return iterate(self.list_adjustments, query_params=query_params)
+
+    def get_adjustments_by_ids(
+        self,
+        adjustment_ids: list[str],
+        query_params: AdjustmentQueryParams = AdjustmentQueryParams(),
+        max_workers: int = 4,
+    ) -> AdjustmentsByIdsResponse:
+        """Get adjustments by ids, fetching pages of ids concurrently"""
+        return get_by_ids(self, "adjustment", adjustment_ids, query_params, max_workers)
+
     """
     Events
     """
@@ -572,12 +744,23 @@ class PaddleApiClient(APIClient):
         """List all customers"""
         return self.get(self.endpoints.list_event_types)
 
-    def list_events(self, paginate: Paginate = None) -> EventsResponse:
-        """List all customers"""
+    def list_events(
+        self,
+        paginate: Paginate = None,
+        query_params: EventQueryParams = EventQueryParams(),
+    ) -> EventsResponse:
+        """List all events"""
         return self.get(
             dict(paginate)["next"] if paginate else self.endpoints.list_events,
+            params=query_params.model_dump(exclude_none=True),
         )
 
+    def iter_events(
+        self, query_params: EventQueryParams = EventQueryParams()
+    ) -> Iterable[Event]:
+        """Iterate over all events, fetching pages as needed"""
+        return iterate(self.list_events, query_params=query_params)
+
     """
     Notification settings
     """
@@ -647,6 +830,12 @@ class PaddleApiClient(APIClient):
             params=query_params.model_dump(exclude_none=True),
         )
 
+    def iter_notifications(
+        self, query_params: NotificationQueryParams = NotificationQueryParams()
+    ) -> Iterable[Notification]:
+        """Iterate over all notifications, fetching pages as needed"""
+        return iterate(self.list_notifications, query_params=query_params)
+
     def replay_notification(self, notification_id: str) -> NotificationReplayResponse:
         """Replay a notification"""
         return self.post(
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import queue
+import ssl
+import threading
+import time
+import weakref
+
+from pydantic import BaseModel, ConfigDict
+from requests.adapters import HTTPAdapter
+
+
+class ConnectionPoolConfig(BaseModel):
+    """Connection pool settings shared by the sync and async clients.
+
+    One client (and therefore one pool) can be shared by every thread of a
+    worker: urllib3 and httpx pools are thread/task safe, so keep-alive
+    connections and their TLS sessions are reused instead of handshaking on
+    every call. Set `max_connections` to at least the number of threads using
+    the client, and `block=True` to make extra threads wait for a free
+    connection instead of opening throwaway ones.
+    """
+
+    # Number of per-host pools to keep, e.g. sandbox-api and api.paddle.com.
+    pool_connections: int = 2
+    # Maximum number of connections per host.
+    max_connections: int = 10
+    # Maximum number of idle connections kept alive.
+    # urllib3 keeps up to `max_connections` idle connections per host,
+    # so this is only applied by the async client.
+    max_keepalive_connections: int = 10
+    # Seconds an idle connection is kept before it is dropped, None to keep forever.
+    keepalive_expiry: float | None = 60.0
+    # Wait for a free connection instead of opening a connection
+    # that is discarded afterwards when the pool is exhausted.
+    block: bool = False
+    # TLS context shared by every connection of the pool.
+    ssl_context: ssl.SSLContext | None = None
+
+    model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """`requests` transport adapter configured from a `ConnectionPoolConfig`.
+
+    Idle connections of a host pool unused for longer than `keepalive_expiry`
+    are closed before its next request, so the server closing them on its side
+    does not surface as connection errors. Pools of other hosts and
+    connections in use are left alone.
+    """
+
+    def __init__(self, config: ConnectionPoolConfig | None = None):
+        self.pool_config = config or ConnectionPoolConfig()
+        # Last use of each urllib3 pool, forgotten when the pool is evicted.
+        self._last_used = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        super().__init__(
+            pool_connections=self.pool_config.pool_connections,
+            pool_maxsize=self.pool_config.max_connections,
+            pool_block=self.pool_config.block,
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.pool_config.ssl_context is not None:
+            pool_kwargs.setdefault("ssl_context", self.pool_config.ssl_context)
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+    def get_connection_with_tls_context(self, request, *args, **kwargs):
+        pool = super().get_connection_with_tls_context(request, *args, **kwargs)
+        expiry = self.pool_config.keepalive_expiry
+        with self._lock:
+            now = time.monotonic()
+            last_used = self._last_used.get(pool, now)
+            self._last_used[pool] = now
+        if expiry is not None and now - last_used > expiry:
+            close_idle_connections(pool)
+        return pool
+
+
+def close_idle_connections(pool) -> None:
+    """Close the idle connections of a urllib3 pool, keeping the pool usable.
+
+    Closed connections stay in the pool and reconnect when they are reused.
+    """
+    idle = pool.pool
+    if idle is None:
+        return
+    conns = []
+    while True:
+        try:
+            conns.append(idle.get(block=False))
+        except queue.Empty:
+            break
+    # Drain before putting them back, the pool queue is last in first out.
+    for conn in conns:
+        if conn is not None:
+            conn.close()
+        idle.put(conn, block=False)
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import types
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Literal,
+    NamedTuple,
+    Union,
+    get_args,
+    get_origin,
+)
+
+import enum
+import functools
+import inspect
+import sys
+from datetime import date, datetime
+
+from pydantic import BaseModel, TypeAdapter
+
+from paddle_billing_client.identity import IdentityMap, get_identity_map
+from paddle_billing_client.models.base import (
+    LAZY_FIELDS,
+    EntityModel,
+    LazyBaseModel,
+    build_instance,
+)
+
+Converter = Callable[[Any], Any]
+
+_parse_datetime = TypeAdapter(datetime).validate_python
+_parse_date = TypeAdapter(date).validate_python
+
+
+def _intern(value: Any) -> Any:
+    # Interns the values of `InternedStr` and string `Literal` fields, other
+    # values are kept as is.
+    return sys.intern(value) if type(value) is str else value
+
+
+# Types of the default values shared by the constructed models, other defaults
+# are copied like `model_construct` does.
+IMMUTABLE = (type(None), bool, int, float, str, bytes, enum.Enum, tuple, frozenset)
+
+
+def construct_model(model: type[BaseModel], data: Any):
+    """Build `model` from trusted JSON data without validating it.
+
+    The result has the same types as a validated model: enums are converted,
+    and sub-models are built the same way. Sub-models, lists of them and
+    datetimes of `LazyBaseModel`s are only built on first access, so reading a
+    few fields of a large response skips most of the work. Event data is built
+    into the model of the event type. Data that is not a dict is returned as is.
+    Entities are shared through the active `IdentityMap`, if any.
+    """
+    if not isinstance(data, dict):
+        return data
+    plan = get_construct_plan(model)
+    identity = get_identity_map()
+    if identity is not None and plan.entity:
+        build = functools.partial(build_model, model, plan, identity)
+        return identity.resolve(model, data, build)
+    return build_model(model, plan, identity, data)
+
+
+def build_model(
+    model: type[BaseModel],
+    plan: ConstructPlan,
+    identity: IdentityMap | None,
+    data: dict[str, Any],
+):
+    if plan.aliases:
+        data = dict(data)
+        for key, name in plan.aliases:
+            if key in data:
+                data[name] = data.pop(key)
+    fields_set = data.keys() & plan.names
+    values = {**plan.defaults, **data}
+    extra = {} if plan.extra_allowed else None
+    if len(fields_set) < len(data):
+        extra_keys = [key for key in data if key not in plan.names]
+        for key in extra_keys:
+            value = values.pop(key)
+            if extra is not None:
+                extra[key] = value
+    for name in plan.default_factories:
+        if name not in fields_set:
+            values[name] = model.model_fields[name].get_default(
+                call_default_factory=True
+            )
+
+    # Lazy models also keep their pending fields in the table when it is empty:
+    # `model_materialize` then restores the order of the fields, which are
+    # serialized in `__dict__` order.
+    lazy = values[LAZY_FIELDS] = {} if plan.lazy else None
+    for name, convert, is_lazy in plan.converters:
+        raw = values.get(name)
+        if raw is None:
+            continue
+        if is_lazy:
+            lazy[name] = (convert, values.pop(name))
+        else:
+            values[name] = convert(raw)
+    if plan.event_data and values.get("data") is not None:
+        convert = functools.partial(construct_event_data, values.get("event_type"))
+        lazy["data"] = (convert, values.pop("data"))
+    if lazy and identity is not None:
+        # Fields built on first access share their entities through the map too.
+        for name, (convert, raw) in lazy.items():
+            lazy[name] = (identity.bind(convert), raw)
+    if lazy is None:
+        values = {name: values[name] for name in plan.order if name in values}
+
+    if not plan.fast:
+        values.pop(LAZY_FIELDS, None)
+        instance = model.model_construct(fields_set, **values, **(extra or {}))
+        if lazy is not None:
+            instance.__dict__[LAZY_FIELDS] = lazy
+        return instance
+    return build_instance(model, values, fields_set, extra)
+
+
+def construct_event_data(event_type: str | None, data: Any):
+    """Build event data into the model of the event type, see `parse_event_to_model`"""
+    from paddle_billing_client.utils import EVENT_ENTITY_MODELS, get_event_entity
+
+    entity = get_event_entity(event_type) if isinstance(event_type, str) else None
+    return construct_model(EVENT_ENTITY_MODELS[entity], data) if entity else data
+
+
+class ConstructPlan(NamedTuple):
+    """How `construct_model` builds a model, computed once per model"""
+
+    # Names of the fields, in order, and the (key, name) of the fields with an alias.
+    order: tuple[str, ...]
+    names: frozenset[str]
+    aliases: list[tuple[str, str]]
+    # (name, converter, lazy) of the fields whose JSON value is converted.
+    converters: list[tuple[str, Converter, bool]]
+    # Default values of the optional fields, and the fields with a default factory.
+    defaults: dict[str, Any]
+    default_factories: list[str]
+    # Whether extra keys are kept, as in `model_config`.
+    extra_allowed: bool
+    # Whether the model is a `LazyBaseModel`, whose fields can be built lazily.
+    lazy: bool
+    # Whether the `data` field holds event data typed by `event_type`.
+    event_data: bool
+    # Whether the model is an `EntityModel`, shared through the identity map.
+    entity: bool
+    # Whether instances can be created directly rather than by `model_construct`,
+    # which is needed by models with private attributes or a `model_post_init`.
+    fast: bool
+
+
+@functools.cache
+def get_construct_plan(model: type[BaseModel]) -> ConstructPlan:
+    lazy = issubclass(model, LazyBaseModel)
+    aliases = []
+    converters = []
+    defaults = {}
+    default_factories = []
+    for name, field in model.model_fields.items():
+        if field.alias and field.alias != name:
+            aliases.append((field.alias, name))
+        annotation = field.annotation
+        if field.metadata:
+            # pydantic moves the metadata of `Annotated` fields to `metadata`.
+            annotation = Annotated[(annotation, *field.metadata)]
+        convert, is_lazy = get_converter(annotation)
+        if convert is not None:
+            converters.append((name, convert, lazy and is_lazy))
+        if field.is_required():
+            continue
+        if field.default_factory is None and isinstance(field.default, IMMUTABLE):
+            defaults[name] = field.default
+        else:
+            default_factories.append(name)
+    event_data = {"event_type", "data"} <= model.model_fields.keys()
+    return ConstructPlan(
+        order=tuple(model.model_fields),
+        names=frozenset(model.model_fields),
+        aliases=aliases,
+        converters=converters,
+        defaults=defaults,
+        default_factories=default_factories,
+        extra_allowed=model.model_config.get("extra") == "allow",
+        lazy=lazy,
+        event_data=lazy and event_data,
+        entity=issubclass(model, EntityModel),
+        fast=not model.__pydantic_post_init__ and not model.__pydantic_root_model__,
+    )
+
+
+def get_converter(annotation: Any) -> tuple[Converter | None, bool]:
+    """Return the converter of a JSON value into the annotated type, and if it is lazy"""
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        inner, *metadata = get_args(annotation)
+        if inner is str and any(
+            getattr(item, "func", None) is sys.intern for item in metadata
+        ):
+            return _intern, False
+        return get_converter(inner)
+    if origin in (Union, types.UnionType):
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(members) == 1:
+            return get_converter(members[0])
+        # Ambiguous unions (e.g. `datetime | str`) keep the JSON value
+        return None, False
+    if origin is list:
+        (item,) = get_args(annotation) or (Any,)
+        convert, _ = get_converter(item)
+        if convert is None:
+            return None, False
+        return (lambda value: [convert(v) for v in value]), True
+    if origin is dict:
+        args = get_args(annotation)
+        convert, _ = get_converter(args[1] if args else Any)
+        if convert is None:
+            return None, False
+        return (lambda value: {k: convert(v) for k, v in value.items()}), True
+    if origin is Literal and all(type(arg) is str for arg in get_args(annotation)):
+        # Validation returns the values of the literal, shared between models.
+        return _intern, False
+    if origin is Literal or not inspect.isclass(annotation):
+        return None, False
+    if issubclass(annotation, BaseModel):
+        return functools.partial(construct_model, annotation), True
+    if issubclass(annotation, enum.Enum):
+        return annotation, False
+    if issubclass(annotation, datetime):
+        return _parse_datetime, True
+    if issubclass(annotation, date):
+        return _parse_date, True
+    return None, False
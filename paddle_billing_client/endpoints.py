@@ -1,3 +1,6 @@
+from urllib.parse import urlparse
+
+
 class Endpoints:
     def __init__(self, base_url="https://sandbox-api.paddle.com"):
         self._base_url = base_url
@@ -92,3 +95,24 @@ class Endpoints:
     get_notification: str = "notifications/{notification_id}"
     list_notifications: str = "notifications"
     replay_notification: str = "notifications/{notification_id}/replay"
+
+
+def get_endpoint_group(url: str) -> str:
+    """Return the group of an endpoint url, e.g. `transactions` or `customers`"""
+    return urlparse(url).path.strip("/").split("/")[0]
+
+
+# Largest `per_page` accepted by the `list_*` endpoint of each entity.
+MAX_PER_PAGE: dict[str, int] = {
+    "products": 200,
+    "prices": 200,
+    "discounts": 200,
+    "customers": 200,
+    "addresses": 200,
+    "businesses": 200,
+    "transactions": 30,
+    "subscriptions": 200,
+    "adjustments": 50,
+    "events": 200,
+    "notifications": 200,
+}
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from paddle_billing_client.checkpoints import Checkpoint, CheckpointStore
+from paddle_billing_client.endpoints import MAX_PER_PAGE
+from paddle_billing_client.models.event import EventQueryParams
+from paddle_billing_client.options import async_call_parsed, call_parsed
+
+
+class EventFollower:
+    """Cursor and polling state of `follow_events` and `follow_events_async`."""
+
+    def __init__(
+        self,
+        store: CheckpointStore | None,
+        key: str,
+        query_params: EventQueryParams | None,
+        poll_interval: float,
+        max_poll_interval: float,
+    ):
+        self.store = store
+        self.key = key
+        self.query_params = query_params or EventQueryParams()
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.delay = poll_interval
+        self.checkpoint = (store and store.load(key)) or Checkpoint(
+            last_id=self.query_params.after
+        )
+        self._saved = self.checkpoint
+
+    def get_query_params(self) -> EventQueryParams:
+        return self.query_params.model_copy(
+            update={
+                "after": self.checkpoint.last_id,
+                "order_by": None,
+                "per_page": self.query_params.per_page or MAX_PER_PAGE["events"],
+            }
+        )
+
+    def processed(self, event) -> None:
+        self.checkpoint = self.checkpoint.model_copy(
+            update={"last_id": event.event_id, "items": self.checkpoint.items + 1}
+        )
+
+    def save(self) -> None:
+        if self.store is not None and self.checkpoint != self._saved:
+            self.store.save(self.key, self.checkpoint)
+            self._saved = self.checkpoint
+
+    def get_delay(self, response) -> float:
+        """Return the seconds to wait before the next poll"""
+        pagination = response.meta.pagination
+        if pagination is not None and pagination.has_more:
+            return 0
+        if response.data:
+            self.delay = self.poll_interval
+            return self.delay
+        delay = self.delay
+        self.delay = min(self.delay * 2, self.max_poll_interval)
+        return delay
+
+
+def follow_events(
+    client,
+    store: CheckpointStore | None = None,
+    key: str = "events",
+    query_params: EventQueryParams | None = None,
+    poll_interval: float = 5.0,
+    max_poll_interval: float = 60.0,
+    stop: threading.Event | None = None,
+):
+    """Yield new events as they appear, polling `list_events` after the last one.
+
+    Pages are read right away while `has_more`; then the events list is polled
+    every `poll_interval` seconds, doubling up to `max_poll_interval` while no
+    new events appear. With a `store`, the id of the last processed event is
+    saved after each page and when the iterator is closed, so following
+    resumes after it on restart. An event counts as processed once the next
+    one is requested: the event being processed when following stops is
+    yielded again on restart. Without a saved cursor, following starts at
+    `query_params.after`, or the oldest event Paddle keeps.
+
+    :param client: The `PaddleApiClient` used for the list calls.
+    :param stop: Event stopping the iterator, also interrupting its waits.
+    """
+    follower = EventFollower(store, key, query_params, poll_interval, max_poll_interval)
+    stop = stop or threading.Event()
+    try:
+        while not stop.is_set():
+            response = call_parsed(
+                client.list_events, query_params=follower.get_query_params()
+            )
+            for event in response.data:
+                yield event
+                follower.processed(event)
+            follower.save()
+            delay = follower.get_delay(response)
+            if delay:
+                stop.wait(delay)
+    finally:
+        follower.save()
+
+
+async def follow_events_async(
+    client,
+    store: CheckpointStore | None = None,
+    key: str = "events",
+    query_params: EventQueryParams | None = None,
+    poll_interval: float = 5.0,
+    max_poll_interval: float = 60.0,
+):
+    """Asyncio counterpart of `follow_events` for `AsyncPaddleApiClient`.
+
+    Stop following by breaking out of the loop or cancelling the task.
+    """
+    follower = EventFollower(store, key, query_params, poll_interval, max_poll_interval)
+    try:
+        while True:
+            response = await async_call_parsed(
+                client.list_events, query_params=follower.get_query_params()
+            )
+            for event in response.data:
+                yield event
+                follower.processed(event)
+            follower.save()
+            delay = follower.get_delay(response)
+            if delay:
+                await asyncio.sleep(delay)
+    finally:
+        follower.save()
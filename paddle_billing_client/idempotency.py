@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+import uuid
+
+from paddle_billing_client.options import get_request_options
+
+
+class IdempotencyKeyStore:
+    """Local record of the idempotency keys of write requests in flight.
+
+    A write gets a key the first time it is sent. The key is kept while the
+    outcome of the request is unknown (connection errors, timeouts, 5xx), so
+    sending the same write again, from the retry policy or from the caller's
+    own retry loop, reuses the key and can't be applied twice. The key is
+    released once a response settles the outcome, or after `ttl` seconds.
+
+    :param header: Name of the header carrying the key.
+    :param methods: HTTP methods which get an idempotency key.
+    :param ttl: Seconds after which a key in flight is forgotten.
+    """
+
+    def __init__(
+        self,
+        header: str = "Idempotency-Key",
+        methods: frozenset[str] = frozenset({"POST", "PATCH"}),
+        ttl: float = 24 * 60 * 60,
+    ):
+        self.header = header
+        self.methods = methods
+        self.ttl = ttl
+        self._keys: dict[str, tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_fingerprint(method: str, endpoint: str, data: dict | None) -> str:
+        """Return a fingerprint identifying the same write request"""
+        payload = json.dumps(
+            [method.upper(), endpoint, data], sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def acquire(self, fingerprint: str) -> str:
+        """Return the key in flight for the request, or a new key"""
+        now = time.monotonic()
+        with self._lock:
+            key, created_at = self._keys.get(fingerprint, (None, now))
+            if key is None or now - created_at > self.ttl:
+                key, created_at = str(uuid.uuid4()), now
+            self._keys[fingerprint] = (key, created_at)
+            return key
+
+    def release(self, fingerprint: str) -> None:
+        """Forget the key of a request whose outcome is known"""
+        with self._lock:
+            self._keys.pop(fingerprint, None)
+
+    def in_flight(self) -> dict[str, str]:
+        """Return the keys of the requests with an unknown outcome"""
+        with self._lock:
+            return {fingerprint: key for fingerprint, (key, _) in self._keys.items()}
+
+
+def is_outcome_known(error: Exception | None) -> bool:
+    """Return whether a request failing with `error` was settled by the server"""
+    status_code = getattr(error, "status_code", None)
+    return error is None or (status_code is not None and status_code < 500)
+
+
+def get_idempotency_key(
+    store: IdempotencyKeyStore | None, method: str, endpoint: str, data: dict | None
+) -> tuple[str, str | None, str | None]:
+    """Return the idempotency header, key and store fingerprint of a request.
+
+    A key set with `request_options(idempotency_key=...)` takes precedence and
+    is not recorded in the store.
+    """
+    key = get_request_options().idempotency_key
+    header = store.header if store is not None else "Idempotency-Key"
+    if key is not None or store is None or method.upper() not in store.methods:
+        return header, key, None
+    fingerprint = store.get_fingerprint(method, endpoint, data)
+    return header, store.acquire(fingerprint), fingerprint
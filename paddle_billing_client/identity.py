@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Hashable, Iterator, Optional
+
+import functools
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from pydantic import TypeAdapter
+from pydantic_core import SchemaValidator
+
+from paddle_billing_client.models.base import EntityModel, build_instance
+
+
+class IdentityMap:
+    """Shared instances of the entities parsed while the map is active.
+
+    Entities (`EntityModel`s: customers, addresses, businesses and discounts)
+    are keyed by model, `id` and `updated_at` as version (or their whole data,
+    for entities without `updated_at`): an entity already parsed with the same
+    version is returned as is instead of being validated again, so the same
+    customer embedded in every transaction of a page is one instance. Shared
+    instances are read-only (see `EntityModel.model_freeze`), and are held
+    weakly, so the map only keeps the entities still referenced elsewhere.
+    """
+
+    def __init__(self):
+        self._entities: weakref.WeakValueDictionary[Hashable, Any] = (
+            weakref.WeakValueDictionary()
+        )
+
+    def resolve(self, model: type, data: Any, build: Callable[[Any], Any]) -> Any:
+        """Return the shared instance of the entity in `data`, built by `build` when new"""
+        if not isinstance(data, dict):
+            return build(data)
+        entity_id = data.get("id")
+        if entity_id is None:
+            return build(data)
+        version = data.get("updated_at")
+        key = (model, entity_id, version if version is not None else repr(data))
+        instance = self._entities.get(key)
+        if instance is None:
+            # Shared instances are converted in full: models holding them may
+            # not be materialized along with their sub-models.
+            instance = build(data).model_materialize()
+            instance.model_freeze()
+            self._entities[key] = instance
+        return instance
+
+    def call(self, function: Callable[[Any], Any], value: Any) -> Any:
+        """Call `function` with the map active, e.g. to validate a lazy field"""
+        token = _identity_map.set(self)
+        try:
+            return function(value)
+        finally:
+            _identity_map.reset(token)
+
+    def bind(self, function: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        """Return `function` called with the map active, see `call`"""
+        return functools.partial(self.call, function)
+
+    def clear(self):
+        self._entities.clear()
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+
+_identity_map: ContextVar[Optional[IdentityMap]] = ContextVar(
+    "paddle_identity_map", default=None
+)
+
+
+def get_identity_map() -> Optional[IdentityMap]:
+    """Return the identity map of the current context, None when not enabled"""
+    return _identity_map.get()
+
+
+def resolve_entity(model: type, data: Any, build: Callable[[Any], Any]) -> Any:
+    """Return the entity in `data` from the active identity map, built by `build` when new"""
+    identity = _identity_map.get()
+    if identity is None:
+        return build(data)
+    return identity.resolve(model, data, build)
+
+
+@functools.cache
+def get_identity_validator(annotation: Any) -> Optional[SchemaValidator]:
+    """Return the validator of `annotation` resolving its entities with `resolve_entity`.
+
+    Entity models are not validated through the identity map by default, so
+    parsing without a map has no overhead: the validator is built from the
+    core schema of the type, with the schemas of entity models wrapped in
+    `resolve_entity`, and produces instances of the same models. Return None
+    when the type holds no entities.
+    """
+    schema, wrapped = wrap_entities(TypeAdapter(annotation).core_schema)
+    return SchemaValidator(schema) if wrapped else None
+
+
+def wrap_entities(schema: Any) -> tuple[Any, bool]:
+    """Return a copy of a core schema with the entity models wrapped in `resolve_entity`.
+
+    pydantic-core validates the models of a schema with their own validator,
+    ignoring their nested schemas: the models holding entities are validated
+    from their fields schema instead, by `build_validated_model`. Also return whether
+    the schema holds entities.
+    """
+    if isinstance(schema, list):
+        items = [wrap_entities(item) for item in schema]
+        return [item for item, _ in items], any(wrapped for _, wrapped in items)
+    if not isinstance(schema, dict):
+        return schema, False
+    values = {key: wrap_entities(value) for key, value in schema.items()}
+    schema = {key: value for key, (value, _) in values.items()}
+    wrapped = any(wrapped for _, wrapped in values.values())
+    if schema.get("type") != "model":
+        return schema, wrapped
+    model = schema["cls"]
+    ref = schema.pop("ref", None)
+    if wrapped and is_buildable(schema):
+        fields_schema = dict(schema["schema"])
+        extra = schema["config"].get("extra_fields_behavior")
+        if extra is not None:
+            fields_schema["extra_behavior"] = extra
+        schema = after_validator(
+            functools.partial(build_validated_model, model), fields_schema
+        )
+    if issubclass(model, EntityModel):
+        schema = wrap_validator(functools.partial(resolve_entity, model), schema)
+        wrapped = True
+    # References to the model now point to the new schema.
+    if ref is not None:
+        schema["ref"] = ref
+    return schema, wrapped
+
+
+def is_buildable(schema: dict[str, Any]) -> bool:
+    """Return whether a model schema can be validated by `build_validated_model`"""
+    return (
+        not schema.get("custom_init")
+        and not schema.get("root_model")
+        and "post_init" not in schema
+        and schema["schema"]["type"] == "model-fields"
+        and schema["config"].keys() <= {"title", "extra_fields_behavior"}
+    )
+
+
+def build_validated_model(
+    model: type, validated: tuple[dict, Optional[dict], set]
+) -> Any:
+    """Create a model instance from its validated fields, like pydantic-core does"""
+    values, extra, fields_set = validated
+    return build_instance(model, values, fields_set, extra)
+
+
+def after_validator(function: Callable, schema: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "type": "function-after",
+        "function": {"type": "no-info", "function": function},
+        "schema": schema,
+    }
+
+
+def wrap_validator(function: Callable, schema: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "type": "function-wrap",
+        "function": {"type": "no-info", "function": function},
+        "schema": schema,
+    }
+
+
+@contextmanager
+def identity_map(identity: Optional[IdentityMap] = None) -> Iterator[IdentityMap]:
+    """Share the entities parsed within the block through an `IdentityMap`.
+
+    The map is stored in a context variable like `request_options`, and is a
+    new one unless given::
+
+        with identity_map():
+            query_params = TransactionQueryParams(include="customer")
+            transactions = list(client.iter_transactions(query_params))
+    """
+    identity = identity if identity is not None else IdentityMap()
+    token = _identity_map.set(identity)
+    try:
+        yield identity
+    finally:
+        _identity_map.reset(token)
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import types
+from typing import Annotated, Any, Callable, NamedTuple, Union, get_args, get_origin
+
+import copy
+import functools
+import inspect
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, create_model
+from pydantic.fields import FieldInfo
+
+from paddle_billing_client.identity import get_identity_map, get_identity_validator
+from paddle_billing_client.models.base import (
+    LAZY_FIELDS,
+    LazyBaseModel,
+    PaddleResponse,
+    build_instance,
+)
+
+Restore = Callable[[Any], Any]
+
+
+def validate_lazy(model: type[BaseModel], data: Any):
+    """Validate a response into `model`, validating its heavy fields on first access.
+
+    Entities (e.g. the transactions of `TransactionsResponse`) are validated
+    without their fields holding sub-models, like `details` or `customer` of
+    transactions: these are kept as decoded JSON and validated when first
+    read, so reading a few fields of each item skips most of the work. `data`
+    is decoded JSON, e.g. by `pydantic_core.from_json`.
+    """
+    shallow = get_shallow_model(model)
+    if shallow is None:
+        return model.model_validate(data)
+    return restore_model(model, shallow.model_validate(data))
+
+
+def restore_model(model: type[BaseModel], instance: BaseModel):
+    """Turn an instance of the shallow model of `model` into a `model` instance"""
+    plan = get_lazy_plan(model)
+    values = instance.__dict__
+    identity = get_identity_map()
+    lazy = {}
+    for name, validate, annotation in plan.lazy_fields:
+        if values.get(name) is not None:
+            validator = (
+                get_identity_validator(annotation) if identity is not None else None
+            )
+            if validator is not None:
+                # Entities of the field are resolved through the map when read.
+                validate = identity.bind(validator.validate_python)
+            lazy[name] = (validate, values.pop(name))
+    if plan.event_data and values.get("data") is not None:
+        validate = functools.partial(parse_event_data, values.get("event_type"))
+        lazy["data"] = (validate, values.pop("data"))
+    for name, restore in plan.nested_fields:
+        if values.get(name) is not None:
+            values[name] = restore(values[name])
+    # Pending fields are kept in the table even when empty, for
+    # `model_materialize` to restore the order of the fields.
+    values[LAZY_FIELDS] = lazy
+
+    return build_instance(
+        model, values, instance.__pydantic_fields_set__, instance.__pydantic_extra__
+    )
+
+
+def parse_event_data(event_type: str | None, data: Any):
+    from paddle_billing_client.utils import parse_event_to_model
+
+    return parse_event_to_model(event_type or "", data)
+
+
+class LazyPlan(NamedTuple):
+    """How a model is validated lazily, computed once per model"""
+
+    # Model validating everything but the lazy fields, None when nothing is lazy.
+    shallow: type[BaseModel] | None
+    # (name, validator, annotation) of the fields validated on first access.
+    lazy_fields: list[tuple[str, Callable[[Any], Any], Any]]
+    # (name, restore) of the fields holding shallow models, for response models.
+    nested_fields: list[tuple[str, Restore]]
+    # Whether the `data` field holds event data typed by `event_type`.
+    event_data: bool
+
+
+def get_shallow_model(model: type[BaseModel]) -> type[BaseModel] | None:
+    return get_lazy_plan(model).shallow
+
+
+@functools.cache
+def get_lazy_plan(model: type[BaseModel]) -> LazyPlan:
+    """Return how `model` is validated lazily.
+
+    Fields of entities holding sub-models are validated on first access, while
+    response models (`PaddleResponse`) validate their entities lazily in turn.
+    Models with validators are validated as usual, except for the event data
+    dispatch of `Event` and `NotificationPayload`.
+    """
+    no_plan = LazyPlan(None, [], [], False)
+    if not issubclass(model, LazyBaseModel) or model.__pydantic_post_init__:
+        return no_plan
+    decorators = model.__pydantic_decorators__
+    event_data = {"event_type", "data"} <= model.model_fields.keys()
+    validated_fields = {
+        field
+        for decorator in decorators.field_validators.values()
+        for field in decorator.info.fields
+    }
+    if (
+        decorators.model_validators
+        or decorators.validators
+        or decorators.root_validators
+        or validated_fields - ({"data"} if event_data else set())
+    ):
+        return no_plan
+
+    is_response = issubclass(model, PaddleResponse)
+    fields = {}
+    lazy_fields = []
+    nested_fields = []
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        if is_response:
+            shallow = get_shallow_annotation(annotation)
+            if shallow is not None:
+                annotation, restore = shallow
+                nested_fields.append((name, restore))
+        elif has_model(annotation):
+            if not (event_data and name == "data"):
+                validate = TypeAdapter(annotation).validate_python
+                lazy_fields.append((name, validate, annotation))
+            fields[name] = (Any, get_raw_field(field))
+            continue
+        field = copy.copy(field)
+        field.annotation = annotation
+        fields[name] = (annotation, field)
+
+    if not lazy_fields and not nested_fields and not event_data:
+        return no_plan
+    shallow = create_model(
+        f"{model.__name__}Shallow",
+        __config__=ConfigDict(extra=model.model_config.get("extra")),
+        **fields,
+    )
+    return LazyPlan(shallow, lazy_fields, nested_fields, event_data)
+
+
+def get_raw_field(field: FieldInfo) -> FieldInfo:
+    """Return a field keeping the JSON value, with the default and alias of `field`"""
+    if field.default_factory is not None:
+        return Field(default_factory=field.default_factory, alias=field.alias)
+    return Field(field.default, alias=field.alias)
+
+
+def has_model(annotation: Any) -> bool:
+    """Return whether a type annotation holds pydantic models"""
+    if inspect.isclass(annotation) and get_origin(annotation) is None:
+        return issubclass(annotation, BaseModel)
+    return any(has_model(arg) for arg in get_args(annotation))
+
+
+def get_shallow_annotation(annotation: Any) -> tuple[Any, Restore] | None:
+    """Return the annotation using shallow models, and the restore of its values"""
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return get_shallow_annotation(get_args(annotation)[0])
+    if origin in (Union, types.UnionType):
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(members) != 1:
+            return None
+        shallow = get_shallow_annotation(members[0])
+        return (shallow[0] | None, shallow[1]) if shallow else None
+    if origin is list:
+        args = get_args(annotation)
+        shallow = get_shallow_annotation(args[0]) if args else None
+        if shallow is None:
+            return None
+        item, restore = shallow
+        return list[item], lambda value: [restore(v) for v in value]
+    if origin is dict:
+        args = get_args(annotation)
+        shallow = get_shallow_annotation(args[1]) if args else None
+        if shallow is None:
+            return None
+        item, restore = shallow
+        return dict[args[0], item], lambda value: {
+            k: restore(v) for k, v in value.items()
+        }
+    if inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+        shallow = get_shallow_model(annotation)
+        if shallow is not None:
+            return shallow, functools.partial(restore_model, annotation)
+    return None
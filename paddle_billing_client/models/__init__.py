@@ -1 +1 @@
-from .base import LazyBaseModel, PaddleResponse
+from .base import EntityModel, InternedStr, LazyBaseModel, PaddleResponse
@@ -6,6 +6,7 @@ from datetime import datetime
 
 from pydantic import ConfigDict, model_validator
 
+from paddle_billing_client.models import EntityModel
 from paddle_billing_client.models import LazyBaseModel as BaseModel
 from paddle_billing_client.models import PaddleResponse
 from paddle_billing_client.models.common import ImportMeta
@@ -23,7 +24,7 @@ class AddressBase(BaseModel):
     custom_data: dict[str, int | str | None | dict | list] | None = None
 
 
-class Address(AddressBase):
+class Address(AddressBase, EntityModel):
     id: str | None = None
     customer_id: str | None = None
     import_meta: ImportMeta | None = None
@@ -122,5 +122,12 @@ class AdjustmentsResponse(PaddleResponse):
     data: list[Adjustment]
 
 
+class AdjustmentsByIdsResponse(BaseModel):
+    # Found adjustments by id.
+    data: dict[str, Adjustment]
+    # Requested ids that were not returned.
+    missing: list[str]
+
+
 class AdjustmentRequest(AdjustmentBase):
     pass
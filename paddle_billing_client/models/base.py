@@ -1,11 +1,231 @@
-from typing import Optional
+from typing import Annotated, Any, Callable, ClassVar, Optional, SupportsIndex
 
-from pydantic import BaseModel, ConfigDict
+import functools
+import sys
+import threading
+
+from pydantic import AfterValidator, BaseModel, ConfigDict
+
+# Key of `__dict__` holding the fields converted on first access, see `LazyBaseModel`.
+LAZY_FIELDS = "__lazy_fields__"
+
+# String interned when validated, for the enum-like fields repeated across
+# entities (currency codes, statuses, ...): equal values share one object.
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
 
 
 class LazyBaseModel(BaseModel):
+    """Base model of the Paddle entities.
+
+    Fields can be stored unconverted by `set_lazy_field`: they are converted on
+    first access and cached, and converted by the methods of the model reading
+    all its fields (`model_dump`, copies, `==`, pickling, `repr`, `dict()`),
+    so lazy fields behave like regular ones. Serializers reading the fields
+    from pydantic-core, like a `TypeAdapter` or another model holding it, see
+    the converted fields only: call `model_materialize` first. Models built with
+    lazy fields (see `construct_model` and `validate_lazy`) keep their table of
+    pending fields until they and their sub-models are materialized: other
+    models have nothing to convert.
+    """
+
     model_config = ConfigDict(extra="allow")
 
+    def __getattr__(self, name: str) -> Any:
+        values = self.__dict__
+        lazy = values.get(LAZY_FIELDS)
+        if lazy and name in lazy:
+            return _convert_lazy_field(self, name)
+        if name in values:
+            # Converted by another thread since the attribute was looked up.
+            return values[name]
+        return super().__getattr__(name)
+
+    def set_lazy_field(self, name: str, convert: Callable[[Any], Any], raw: Any):
+        """Store `raw` as the value of a field, converted by `convert` on first access"""
+        self.__dict__.pop(name, None)
+        self.__dict__.setdefault(LAZY_FIELDS, {})[name] = (convert, raw)
+
+    def model_materialize(self):
+        """Convert the lazy fields of the model and of its sub-models"""
+        if LAZY_FIELDS not in self.__dict__:
+            return self
+        with _lazy_lock:
+            values = self.__dict__
+            lazy = values.get(LAZY_FIELDS)
+            if lazy is None:
+                return self
+            for name in list(lazy):
+                _convert_lazy_field(self, name)
+            # Fields are dumped in `__dict__` order, restore the order of the
+            # fields that were converted (or constructed) out of order. The
+            # dict is replaced rather than refilled, so that other threads never
+            # see it partially filled, once the sub-models are materialized.
+            ordered = {
+                name: values[name] for name in type(self).model_fields if name in values
+            }
+            for value in ordered.values():
+                _materialize(value)
+            for value in (self.__pydantic_extra__ or {}).values():
+                _materialize(value)
+            _set_dict(self, ordered)
+        return self
+
+    def model_dump(self, **kwargs) -> dict[str, Any]:
+        return super(LazyBaseModel, self.model_materialize()).model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs) -> str:
+        return super(LazyBaseModel, self.model_materialize()).model_dump_json(**kwargs)
+
+    def __copy__(self):
+        return super(LazyBaseModel, self.model_materialize()).__copy__()
+
+    def __deepcopy__(self, memo: Optional[dict[int, Any]] = None):
+        return super(LazyBaseModel, self.model_materialize()).__deepcopy__(memo)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyBaseModel):
+            other.model_materialize()
+        return super(LazyBaseModel, self.model_materialize()).__eq__(other)
+
+    def __getstate__(self) -> dict[Any, Any]:
+        return super(LazyBaseModel, self.model_materialize()).__getstate__()
+
+    def __iter__(self):
+        return super(LazyBaseModel, self.model_materialize()).__iter__()
+
+    def __repr_args__(self):
+        return super(LazyBaseModel, self.model_materialize()).__repr_args__()
+
+
+def build_instance(
+    model: type[BaseModel],
+    values: dict[str, Any],
+    fields_set: set[str],
+    extra: Optional[dict[str, Any]],
+) -> Any:
+    """Create a model instance from converted values, like `model_construct` does.
+
+    Used to build models from values validated or converted elsewhere (see
+    `construct_model`, `validate_lazy` and the identity map): `values` are the
+    fields, in order, and `extra` the extra fields, None when not allowed.
+    """
+    instance = model.__new__(model)
+    _set_dict(instance, values)
+    _set_fields_set(instance, fields_set)
+    _set_extra(instance, extra)
+    _set_private(instance, None)
+    return instance
+
+
+# Setters of the attributes of a model instance, as used by `model_construct`.
+_set_dict = BaseModel.__dict__["__dict__"].__set__
+_set_fields_set = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+_set_extra = BaseModel.__dict__["__pydantic_extra__"].__set__
+_set_private = BaseModel.__dict__["__pydantic_private__"].__set__
+
+# Held while converting lazy fields: responses are shared between threads (by
+# single-flight requests or the identity map), which may read the same field.
+_lazy_lock = threading.RLock()
+
+
+def _convert_lazy_field(model: LazyBaseModel, name: str) -> Any:
+    with _lazy_lock:
+        values = model.__dict__
+        # The field may have been converted by another thread meanwhile; it is
+        # only removed from the pending fields once converted.
+        if name not in values:
+            convert, raw = values[LAZY_FIELDS][name]
+            values[name] = convert(raw)
+            del values[LAZY_FIELDS][name]
+        return values[name]
+
+
+def _materialize(value: Any) -> None:
+    if isinstance(value, LazyBaseModel):
+        value.model_materialize()
+    elif isinstance(value, list):
+        for item in value:
+            _materialize(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _materialize(item)
+
+
+class EntityModel(LazyBaseModel):
+    """Base model of the entities shared through an `IdentityMap`, when enabled"""
+
+    def model_freeze(self):
+        """Make the model read-only, like models with `frozen=True`.
+
+        The instance becomes one of the frozen subclass of its model (see
+        `get_frozen_model`), equal to instances of the model. Copies of it are
+        instances of the model, which can be modified again.
+        """
+        if not isinstance(self, FrozenModel):
+            _set_class(self, get_frozen_model(type(self)))
+        return self
+
+
+class FrozenModel:
+    """Mixin of the frozen subclasses of the entity models, see `get_frozen_model`"""
+
+    # The model the class freezes.
+    __thawed_model__: ClassVar[type[EntityModel]]
+
+    def __copy__(self):
+        return _thaw(super().__copy__())
+
+    def __deepcopy__(self, memo: Optional[dict[int, Any]] = None):
+        return _thaw(super().__deepcopy__(memo))
+
+    def __reduce_ex__(self, protocol: SupportsIndex):
+        # Pickled as an instance of the model, like copies.
+        _, _, *state = super().__reduce_ex__(protocol)
+        return (_new_instance, (self.__thawed_model__,), *state)
+
+    def __eq__(self, other: Any) -> bool:
+        # pydantic only compares instances of the same model.
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        model = getattr(other, "__thawed_model__", type(other))
+        if model is not self.__thawed_model__:
+            return False
+        if isinstance(other, LazyBaseModel):
+            other.model_materialize()
+        self.model_materialize()
+        return (
+            self.__dict__ == other.__dict__
+            and self.__pydantic_private__ == other.__pydantic_private__
+            and self.__pydantic_extra__ == other.__pydantic_extra__
+        )
+
+
+@functools.cache
+def get_frozen_model(model: type[EntityModel]) -> type[EntityModel]:
+    """Return the subclass of an entity model with `frozen=True`, of the same name"""
+    return type(model)(
+        model.__name__,
+        (FrozenModel, model),
+        {
+            "__module__": model.__module__,
+            "__qualname__": model.__qualname__,
+            "__thawed_model__": model,
+            "model_config": ConfigDict(frozen=True),
+        },
+    )
+
+
+def _new_instance(model: type[BaseModel]) -> Any:
+    return model.__new__(model)
+
+
+def _thaw(model: Any) -> Any:
+    _set_class(model, model.__thawed_model__)
+    return model
+
+
+_set_class = object.__dict__["__class__"].__set__
+
 
 class Pagination(LazyBaseModel):
     per_page: int
@@ -21,3 +241,15 @@ class Meta(LazyBaseModel):
 
 class PaddleResponse(LazyBaseModel):
     meta: Meta
+
+
+class RawResponse(BaseModel):
+    """Undecoded response of a client method called in raw mode (`raw=True`)"""
+
+    content: bytes
+    status_code: int
+    headers: dict[str, str]
+    # Id of the request, from the `Request-Id` header.
+    request_id: Optional[str] = None
+
+    model_config = ConfigDict(frozen=True)
@@ -6,6 +6,7 @@ from datetime import datetime
 
 from pydantic import ConfigDict, model_validator
 
+from paddle_billing_client.models import EntityModel
 from paddle_billing_client.models import LazyBaseModel as BaseModel
 from paddle_billing_client.models import PaddleResponse
 from paddle_billing_client.models.common import ImportMeta
@@ -25,7 +26,7 @@ class BusinessBase(BaseModel):
     custom_data: dict[str, int | str | None | dict | list] | None = None
 
 
-class Business(BusinessBase):
+class Business(BusinessBase, EntityModel):
     id: str
     customer_id: str
     import_meta: ImportMeta | None = None
@@ -6,6 +6,7 @@ from datetime import datetime
 
 from pydantic import ConfigDict, model_validator
 
+from paddle_billing_client.models import EntityModel
 from paddle_billing_client.models import LazyBaseModel as BaseModel
 from paddle_billing_client.models import PaddleResponse
 from paddle_billing_client.models.common import ImportMeta
@@ -18,7 +19,7 @@ class CustomerBase(BaseModel):
     custom_data: dict[str, int | str | None | dict | list] | None = None
 
 
-class Customer(CustomerBase):
+class Customer(CustomerBase, EntityModel):
     id: str
     marketing_consent: bool
     created_at: datetime | None = None
@@ -6,6 +6,7 @@ from datetime import datetime
 
 from pydantic import ConfigDict, model_validator
 
+from paddle_billing_client.models import EntityModel
 from paddle_billing_client.models import LazyBaseModel as BaseModel
 from paddle_billing_client.models import PaddleResponse
 from paddle_billing_client.models.common import ImportMeta
@@ -27,7 +28,7 @@ class DiscountBase(BaseModel):
     custom_data: dict[str, int | str | None | dict | list] | None = None
 
 
-class Discount(DiscountBase):
+class Discount(DiscountBase, EntityModel):
     id: str
     times_used: int | None = None
     created_at: datetime | None = None
@@ -72,5 +73,12 @@ class DiscountsResponse(PaddleResponse):
     data: list[Discount]
 
 
+class DiscountsByIdsResponse(BaseModel):
+    # Found discounts by id.
+    data: dict[str, Discount]
+    # Requested ids that were not returned.
+    missing: list[str]
+
+
 class DiscountRequest(DiscountBase):
     pass
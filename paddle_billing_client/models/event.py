@@ -4,11 +4,12 @@ from typing import List, Literal, Optional
 
 from datetime import datetime
 
-from pydantic import model_validator
+from pydantic import ValidationInfo, field_validator
 
+from paddle_billing_client.models import InternedStr
 from paddle_billing_client.models import LazyBaseModel as BaseModel
 from paddle_billing_client.models import PaddleResponse
-from paddle_billing_client.utils import parse_event_to_model
+from paddle_billing_client.utils import EventData, validate_event_data
 
 
 class EventType(BaseModel):
@@ -34,16 +35,14 @@ class EventQueryParams(BaseModel):
 class Event(BaseModel):
     notification_id: str | None = None
     event_id: str
-    event_type: str
-    data: (
-        dict | BaseModel
-    )  # | Subscription | Transaction | Customer | Product | Price | Address | Business | Adjustment
+    event_type: InternedStr
+    data: EventData
     occurred_at: datetime
 
-    @model_validator(mode="after")
-    def check_status(self):
-        self.data = parse_event_to_model(self.event_type, self.data)
-        return self
+    @field_validator("data", mode="before")
+    @classmethod
+    def check_data(cls, data, info: ValidationInfo):
+        return validate_event_data(data, info)
 
 
 class EventsResponse(PaddleResponse):
@@ -4,11 +4,11 @@ from typing import Literal
 
 from datetime import datetime
 
-from pydantic import ConfigDict, Field, model_validator
+from pydantic import ConfigDict, Field, ValidationInfo, field_validator, model_validator
 
 from paddle_billing_client.models import LazyBaseModel as BaseModel
 from paddle_billing_client.models import PaddleResponse
-from paddle_billing_client.utils import parse_event_to_model
+from paddle_billing_client.utils import EventData, validate_event_data
 
 
 class NotificationIdPathParams(BaseModel):
@@ -19,13 +19,13 @@ class NotificationPayload(BaseModel):
     notification_id: str
     event_id: str
     event_type: str
-    data: dict | BaseModel
+    data: EventData
     occurred_at: datetime
 
-    @model_validator(mode="after")
-    def check_status(self):
-        self.data = parse_event_to_model(self.event_type, self.data)
-        return self
+    @field_validator("data", mode="before")
+    @classmethod
+    def check_data(cls, data, info: ValidationInfo):
+        return validate_event_data(data, info)
 
 
 class Notification(BaseModel):
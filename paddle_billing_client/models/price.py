@@ -4,6 +4,7 @@ from typing import Literal
 
 from pydantic import ConfigDict, model_validator
 
+from paddle_billing_client.models import InternedStr
 from paddle_billing_client.models import LazyBaseModel as BaseModel
 from paddle_billing_client.models import PaddleResponse
 from paddle_billing_client.models.common import ImportMeta
@@ -11,7 +12,7 @@ from paddle_billing_client.models.common import ImportMeta
 
 class UnitPrice(BaseModel):
     amount: str
-    currency_code: str
+    currency_code: InternedStr
 
 
 class Quantity(BaseModel):
@@ -20,7 +21,7 @@ class Quantity(BaseModel):
 
 
 class BillingCycle(BaseModel):
-    interval: str
+    interval: InternedStr
     frequency: int
 
 
@@ -30,7 +31,7 @@ class UnitPriceOverride(BaseModel):
 
 
 class TrialPeriod(BaseModel):
-    interval: str
+    interval: InternedStr
     frequency: int
 
 
@@ -40,7 +41,7 @@ class PriceBase(BaseModel):
     unit_price: UnitPrice
     billing_cycle: BillingCycle | None = None
     trial_period: TrialPeriod | None = None
-    tax_mode: str
+    tax_mode: InternedStr
     unit_price_overrides: list[UnitPriceOverride] | None = None
     quantity: Quantity | None = None
     custom_data: dict[str, int | str | None | dict | list] | None = None
@@ -50,7 +51,7 @@ class PriceBase(BaseModel):
 
 class Price(PriceBase):
     id: str
-    status: str | None = None
+    status: InternedStr | None = None
     import_meta: ImportMeta | None = None
 
 
@@ -92,5 +93,12 @@ class PricesResponse(PaddleResponse):
     data: list[Price]
 
 
+class PricesByIdsResponse(BaseModel):
+    # Found prices by id.
+    data: dict[str, Price]
+    # Requested ids that were not returned.
+    missing: list[str]
+
+
 class PriceRequest(PriceBase):
     pass
@@ -89,5 +89,12 @@ class ProductsResponse(PaddleResponse):
     data: list[Product]
 
 
+class ProductsByIdsResponse(BaseModel):
+    # Found products by id.
+    data: dict[str, Product]
+    # Requested ids that were not returned.
+    missing: list[str]
+
+
 class ProductRequest(ProductBase):
     pass
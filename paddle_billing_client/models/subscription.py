@@ -6,6 +6,7 @@ from datetime import datetime
 
 from pydantic import ConfigDict, model_validator
 
+from paddle_billing_client.models import InternedStr
 from paddle_billing_client.models.base import LazyBaseModel as BaseModel
 from paddle_billing_client.models.base import PaddleResponse
 from paddle_billing_client.models.common import (
@@ -20,7 +21,7 @@ from paddle_billing_client.models.transaction import Transaction
 class Item(BaseModel):
     price: Price | None = None
     price_id: str | None = None
-    status: str | None = None
+    status: InternedStr | None = None
     quantity: int | None = None
     recurring: bool | None = None
     created_at: datetime | None = None
@@ -44,11 +45,11 @@ class SubscriptionDiscount(BaseModel):
 
 
 class SubscriptionBase(BaseModel):
-    status: str | None = None
+    status: InternedStr | None = None
     customer_id: str | None = None
     address_id: str | None = None
     business_id: str | None = None
-    currency_code: str | None = None
+    currency_code: InternedStr | None = None
     created_at: datetime | None = None
     updated_at: datetime | None = None
     started_at: datetime | None = None
@@ -56,7 +57,7 @@ class SubscriptionBase(BaseModel):
     next_billed_at: datetime | None = None
     paused_at: datetime | None = None
     canceled_at: datetime | None = None
-    collection_mode: str | None = None
+    collection_mode: InternedStr | None = None
     billing_details: BillingDetails | None = None
     current_billing_period: BillingPeriod | None = None
     billing_cycle: BillingCycle | None = None
@@ -4,8 +4,9 @@ from typing import Literal
 
 from datetime import datetime
 
-from pydantic import ConfigDict, model_validator
+from pydantic import ConfigDict, Field, model_validator
 
+from paddle_billing_client.models import InternedStr
 from paddle_billing_client.models import LazyBaseModel as BaseModel
 from paddle_billing_client.models import PaddleResponse
 from paddle_billing_client.models.address import Address
@@ -38,7 +39,7 @@ class Totals(BaseModel):
     grand_total: str
     fee: str | None = None
     earnings: str | None = None
-    currency_code: str
+    currency_code: InternedStr
 
 
 class AdjustedTotals(BaseModel):
@@ -48,7 +49,7 @@ class AdjustedTotals(BaseModel):
     grand_total: str
     fee: str | None = None
     earnings: str | None = None
-    currency_code: str
+    currency_code: InternedStr
 
 
 class PayoutTotals(BaseModel):
@@ -61,12 +62,12 @@ class PayoutTotals(BaseModel):
     grand_total: str
     fee: str
     earnings: str
-    currency_code: str
+    currency_code: InternedStr
 
 
 class ChargebackFeeOriginal(BaseModel):
     amount: str
-    currency_code: str
+    currency_code: InternedStr
 
 
 class ChargebackFee(BaseModel):
@@ -81,7 +82,7 @@ class AdjustedPayoutTotals(BaseModel):
     fee: str
     chargeback_fee: ChargebackFee | None = None
     earnings: str
-    currency_code: str
+    currency_code: InternedStr
 
 
 class LineItemProration(BaseModel):
@@ -136,7 +137,7 @@ class TransactionBase(BaseModel):
     collection_mode: Literal["automatic", "manual"] | None = None
     billing_details: BillingDetails | None = None
     billing_period: BillingPeriod | None = None
-    currency_code: str | None = None
+    currency_code: InternedStr | None = None
     customer_ip_address: str | None = None
     ignore_trials: bool | None = None
     address: Address | None = None
@@ -149,7 +150,7 @@ class Transaction(TransactionBase):
     discount: Discount | None = None
     seller: dict | None = None
     adjustments_totals: dict | None = None
-    origin: str | None = None
+    origin: InternedStr | None = None
     subscription_id: str | None = None
     invoice_id: str | None = None
     invoice_number: str | None = None
@@ -174,6 +175,19 @@ class TransactionQueryParams(BaseModel):
     # [GT] (greater than), or [GTE] (greater than or equal to) operators.
     # For example, billed_at=2023-04-18T17:03:26 or billed_at[LT]=2023-04-18T17:03:26.
     billed_at: datetime | str | None = None
+    # Range operators of `billed_at`, sent as billed_at[LT], billed_at[LTE], billed_at[GT] and billed_at[GTE].
+    billed_at_lt: datetime | str | None = Field(
+        None, serialization_alias="billed_at[LT]"
+    )
+    billed_at_lte: datetime | str | None = Field(
+        None, serialization_alias="billed_at[LTE]"
+    )
+    billed_at_gt: datetime | str | None = Field(
+        None, serialization_alias="billed_at[GT]"
+    )
+    billed_at_gte: datetime | str | None = Field(
+        None, serialization_alias="billed_at[GTE]"
+    )
     collection_mode: Literal["automatic", "manual"] | None = None
     # Return entities created at a specific time.
     # Pass an RFC 3339 datetime string,
@@ -181,6 +195,19 @@ class TransactionQueryParams(BaseModel):
     # [GT] (greater than), or [GTE] (greater than or equal to) operators.
     # For example, billed_at=2023-04-18T17:03:26 or billed_at[LT]=2023-04-18T17:03:26.
     created_at: datetime | str | None = None
+    # Range operators of `created_at`, sent as created_at[LT], created_at[LTE], created_at[GT] and created_at[GTE].
+    created_at_lt: datetime | str | None = Field(
+        None, serialization_alias="created_at[LT]"
+    )
+    created_at_lte: datetime | str | None = Field(
+        None, serialization_alias="created_at[LTE]"
+    )
+    created_at_gt: datetime | str | None = Field(
+        None, serialization_alias="created_at[GT]"
+    )
+    created_at_gte: datetime | str | None = Field(
+        None, serialization_alias="created_at[GTE]"
+    )
     # Return entities related to the specified customer. Use a comma separated list to specify multiple customer IDs.
     customer_id: str | None = None
     # Return only the IDs specified. Use a comma separated list to get multiple entities.
@@ -204,6 +231,19 @@ class TransactionQueryParams(BaseModel):
     # [GT] (greater than), or [GTE] (greater than or equal to) operators.
     # For example, billed_at=2023-04-18T17:03:26 or billed_at[LT]=2023-04-18T17:03:26.
     updated_at: datetime | str | None = None
+    # Range operators of `updated_at`, sent as updated_at[LT], updated_at[LTE], updated_at[GT] and updated_at[GTE].
+    updated_at_lt: datetime | str | None = Field(
+        None, serialization_alias="updated_at[LT]"
+    )
+    updated_at_lte: datetime | str | None = Field(
+        None, serialization_alias="updated_at[LTE]"
+    )
+    updated_at_gt: datetime | str | None = Field(
+        None, serialization_alias="updated_at[GT]"
+    )
+    updated_at_gte: datetime | str | None = Field(
+        None, serialization_alias="updated_at[GTE]"
+    )
 
     model_config = ConfigDict(extra="forbid")
 
@@ -235,6 +275,13 @@ class TransactionsResponse(PaddleResponse):
     data: list[Transaction]
 
 
+class TransactionsByIdsResponse(BaseModel):
+    # Found transactions by id.
+    data: dict[str, Transaction]
+    # Requested ids that were not returned.
+    missing: list[str]
+
+
 class TransactionRequest(TransactionBase):
     pass
 
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+from typing import Any, ClassVar, Optional
+
+import sys
+from array import array
+
+from pydantic import BaseModel
+
+from paddle_billing_client.models.price import UnitPrice
+from paddle_billing_client.models.transaction import (
+    LineItemTotals,
+    LineItemUnitTotals,
+    PayoutTotals,
+    TaxRatesTotals,
+    Totals,
+)
+
+CURRENCY_CODE = "currency_code"
+
+# States of the copies without extra fields, shared between copies.
+_STATES: dict[tuple[int, int], tuple[int, int, None]] = {}
+
+
+class CompactMoney:
+    """Compact, immutable copy of a money model of the API.
+
+    Amounts, strings of minor units in the API, are stored as integers in one
+    `array`, and currency codes are interned, so a copy takes a fraction of
+    the memory of the model. Amounts are read as integers of minor units, and
+    `to_model` returns the model it was built from, e.g.:
+
+        totals = CompactTotals.from_model(transaction.details.totals)
+        totals.grand_total  # 1524
+        totals.to_model() == transaction.details.totals  # True
+    """
+
+    __slots__ = ("_amounts", "_currency_code", "_state")
+
+    # Money model, and names of its amount fields.
+    model: ClassVar[type[BaseModel]]
+    amount_fields: ClassVar[tuple[str, ...]]
+    has_currency: ClassVar[bool]
+
+    _amounts: array
+    _currency_code: Optional[str]
+    # None, or the (null amounts mask, unset fields mask, extra fields) of
+    # models with null amounts, fields left to their default or extra fields.
+    _state: Optional[tuple[int, int, Optional[dict[str, Any]]]]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields = cls.model.model_fields
+        cls.has_currency = CURRENCY_CODE in fields
+        cls.amount_fields = tuple(name for name in fields if name != CURRENCY_CODE)
+        for index, name in enumerate(cls.amount_fields):
+            setattr(cls, name, property(_amount_getter(index)))
+
+    @classmethod
+    def from_model(cls, model: BaseModel) -> CompactMoney:
+        """Return the compact copy of a model.
+
+        Raise `ValueError` when an amount is not a whole number of minor units
+        in canonical form or does not fit in 64 bits, as it could not be
+        restored as is.
+        """
+        if not isinstance(model, cls.model):
+            raise TypeError(
+                f"Expected {cls.model.__name__}, got {type(model).__name__}"
+            )
+        amounts = []
+        nulls = unset = 0
+        fields_set = model.model_fields_set
+        for index, name in enumerate(cls.amount_fields):
+            amount = getattr(model, name)
+            if amount is None:
+                nulls |= 1 << index
+                if name not in fields_set:
+                    unset |= 1 << index
+                amounts.append(0)
+                continue
+            try:
+                value = int(amount)
+            except ValueError:
+                value = None
+            if value is None or str(value) != amount:
+                raise ValueError(f"Invalid amount {name}={amount!r}")
+            amounts.append(value)
+
+        compact = object.__new__(cls)
+        try:
+            compact._amounts = array("q", amounts)
+        except OverflowError:
+            raise ValueError(f"Amounts of {model!r} do not fit in 64 bits") from None
+        compact._currency_code = None
+        if cls.has_currency:
+            compact._currency_code = sys.intern(model.currency_code)
+        extra = model.__pydantic_extra__
+        if extra:
+            compact._state = (nulls, unset, dict(extra))
+        elif nulls or unset:
+            compact._state = _STATES.setdefault((nulls, unset), (nulls, unset, None))
+        else:
+            compact._state = None
+        return compact
+
+    def to_model(self) -> BaseModel:
+        """Return the model the copy was built from"""
+        nulls, unset, extra = self._state or (0, 0, None)
+        values: dict[str, Any] = {}
+        for index, name in enumerate(self.amount_fields):
+            if not unset >> index & 1:
+                amount = self._amounts[index]
+                values[name] = None if nulls >> index & 1 else str(amount)
+        if self.has_currency:
+            values[CURRENCY_CODE] = self._currency_code
+        fields_set = set(values)
+        values.update(extra or {})
+        return self.model.model_construct(fields_set, **values)
+
+    @property
+    def currency_code(self) -> Optional[str]:
+        return self._currency_code
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return (self._amounts, self._currency_code, self._state) == (
+            other._amounts,
+            other._currency_code,
+            other._state,
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        values = [f"{name}={getattr(self, name)!r}" for name in self.amount_fields]
+        if self.has_currency:
+            values.append(f"currency_code={self._currency_code!r}")
+        return f"{type(self).__name__}({', '.join(values)})"
+
+    def __getstate__(self):
+        return self._amounts, self._currency_code, self._state
+
+    def __setstate__(self, state):
+        self._amounts, self._currency_code, self._state = state
+
+
+def _amount_getter(index: int):
+    def get_amount(self: CompactMoney) -> Optional[int]:
+        if self._state is not None and self._state[0] >> index & 1:
+            return None
+        return self._amounts[index]
+
+    return get_amount
+
+
+class CompactTotals(CompactMoney):
+    __slots__ = ()
+    model = Totals
+
+
+class CompactPayoutTotals(CompactMoney):
+    __slots__ = ()
+    model = PayoutTotals
+
+
+class CompactTaxRatesTotals(CompactMoney):
+    __slots__ = ()
+    model = TaxRatesTotals
+
+
+class CompactLineItemTotals(CompactMoney):
+    __slots__ = ()
+    model = LineItemTotals
+
+
+class CompactLineItemUnitTotals(CompactMoney):
+    __slots__ = ()
+    model = LineItemUnitTotals
+
+
+class CompactUnitPrice(CompactMoney):
+    __slots__ = ()
+    model = UnitPrice
+
+
+COMPACT_MODELS: dict[type[BaseModel], type[CompactMoney]] = {
+    compact.model: compact
+    for compact in (
+        CompactTotals,
+        CompactPayoutTotals,
+        CompactTaxRatesTotals,
+        CompactLineItemTotals,
+        CompactLineItemUnitTotals,
+        CompactUnitPrice,
+    )
+}
+
+
+def compact_money(model: BaseModel) -> CompactMoney:
+    """Return the compact copy of a money model, see `CompactMoney`"""
+    try:
+        compact = COMPACT_MODELS[type(model)]
+    except KeyError:
+        raise TypeError(f"No compact model for {type(model).__name__}") from None
+    return compact.from_model(model)
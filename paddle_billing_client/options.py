@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Iterator
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from paddle_billing_client.retrying import RetryPolicy
+
+
+class RequestOptions(BaseModel):
+    """Per-call overrides of the client settings"""
+
+    # Retry policy to use instead of the client `retry_policy`.
+    retry_policy: RetryPolicy | None = None
+    # Idempotency key sent with the write requests instead of a generated one.
+    idempotency_key: str | None = None
+    # Whether responses are validated, instead of the client `validate`; set
+    # as `validate` (the field name would shadow `BaseModel.validate`).
+    validate_responses: bool | None = Field(None, alias="validate")
+    # Whether heavy nested fields are validated on first access, instead of the
+    # client `lazy`.
+    lazy: bool | None = None
+    # Fields kept in the responses of the list and get methods, e.g.
+    # `["id", "status", "items[].price.id"]`, see `get_projected_model`.
+    fields: tuple[str, ...] | None = None
+    # Whether responses are returned undecoded, instead of the client `raw`.
+    raw: bool | None = None
+
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
+
+
+_request_options: ContextVar[RequestOptions] = ContextVar(
+    "paddle_request_options", default=RequestOptions()
+)
+
+
+def get_request_options() -> RequestOptions:
+    """Return the request options of the current context"""
+    return _request_options.get()
+
+
+@contextmanager
+def request_options(**options) -> Iterator[RequestOptions]:
+    """Override client settings for the calls made within the block.
+
+    Options are stored in a context variable, so they apply to the current
+    thread or asyncio task (and tasks started from it), and nest::
+
+        with request_options(retry_policy=RetryPolicy(max_attempts=10)):
+            client.list_transactions()
+    """
+    overrides = RequestOptions(**options)
+    current = _request_options.get().model_copy(
+        update={name: getattr(overrides, name) for name in overrides.model_fields_set}
+    )
+    token = _request_options.set(current)
+    try:
+        yield current
+    finally:
+        _request_options.reset(token)
+
+
+def call_parsed(function: Callable[..., Any], *args, **kwargs) -> Any:
+    """Call a client method with `raw=False`, for helpers reading its parsed response.
+
+    Helpers walking pages or items (`paginate`, `iter_*`, `get_*_by_ids`, ...)
+    work with clients or blocks set to `raw=True`, their own calls being parsed.
+    """
+    with request_options(raw=False):
+        return function(*args, **kwargs)
+
+
+async def async_call_parsed(function: Callable[..., Awaitable], *args, **kwargs) -> Any:
+    """Asyncio counterpart of `call_parsed` for `AsyncPaddleApiClient`"""
+    with request_options(raw=False):
+        return await function(*args, **kwargs)
@@ -1,15 +1,294 @@
-from typing import Callable
+from __future__ import annotations
 
+from typing import AsyncIterable, Awaitable, Callable
+
+import asyncio
+import contextvars
+import inspect
+import queue
+import threading
+import time
+from collections import deque
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from paddle_billing_client.checkpoints import Checkpoint, CheckpointStore
+from paddle_billing_client.endpoints import MAX_PER_PAGE
 from paddle_billing_client.models.common import Paginate
+from paddle_billing_client.options import async_call_parsed, call_parsed
+from paddle_billing_client.request_strategies import get_last_response_size
+
+
+class AdaptivePageSize:
+    """Page size of `paginate` adapted to the latency and size of the pages.
+
+    Pages start at the largest size accepted by the endpoint. When a page takes
+    longer than `target_latency` seconds or is larger than `max_bytes`, the
+    page size shrinks in proportion; when both stay well under their limits it
+    grows back, up to the endpoint maximum. A new instance is needed per walk.
+
+    :param maximum: Largest page size, defaults to the endpoint maximum.
+    :param minimum: Smallest page size.
+    :param target_latency: Seconds a page should take at most.
+    :param max_bytes: Size in bytes a page response should have at most.
+    """
+
+    def __init__(
+        self,
+        maximum: int | None = None,
+        minimum: int = 10,
+        target_latency: float = 2.0,
+        max_bytes: int = 4_000_000,
+    ):
+        self.maximum = maximum
+        self.minimum = minimum
+        self.target_latency = target_latency
+        self.max_bytes = max_bytes
+        self.per_page = maximum
+
+    def start(self, get: Callable) -> int:
+        """Return the size of the first page of the `get` list method"""
+        if self.maximum is None:
+            name = getattr(get, "func", get).__name__
+            entity = name.removeprefix("list_").split("_for_")[0]
+            self.maximum = MAX_PER_PAGE.get(entity, 50)
+        self.per_page = max(self.minimum, self.maximum)
+        return self.per_page
+
+    def update(self, latency: float, size: int | None) -> int:
+        """Record a full page and return the size of the next page"""
+        ratio = min(
+            self.target_latency / max(latency, 1e-6),
+            self.max_bytes / size if size else float("inf"),
+        )
+        if ratio < 1:
+            self.per_page = max(self.minimum, int(self.per_page * ratio))
+        elif ratio > 2:
+            self.per_page = min(self.maximum, int(self.per_page * 1.5) + 1)
+        return self.per_page
+
+
+def set_per_page(url: str, per_page: int) -> str:
+    """Return the url with its `per_page` query param replaced"""
+    parts = urlsplit(url)
+    query = [
+        (name, value) for name, value in parse_qsl(parts.query) if name != "per_page"
+    ]
+    return urlunsplit(parts._replace(query=urlencode([*query, ("per_page", per_page)])))
+
 
+def paginate(get: Callable, page_size: AdaptivePageSize | None = None, **kwargs):
+    """Yield the pages of a list method, following the `next` cursor.
 
-def paginate(get: Callable, **kwargs):
-    response = get(**kwargs)
+    With `page_size`, the `per_page` of every page is set by the
+    `AdaptivePageSize` from the latency and size of the previous pages.
+    """
+    if page_size is not None:
+        query_params = kwargs.get("query_params") or (
+            inspect.signature(get).parameters["query_params"].default
+        )
+        kwargs["query_params"] = query_params.model_copy(
+            update={"per_page": page_size.start(get)}
+        )
+
+    response = fetch_page(get, page_size, **kwargs)
     yield response
 
     if response.meta.pagination is None:
         raise Exception("Pagination is not supported for this endpoint")
 
     while response.meta.pagination.has_more and response.meta.pagination.next:
-        response = get(paginate=Paginate(next=response.meta.pagination.next))
+        next_url = response.meta.pagination.next
+        if page_size is not None:
+            next_url = set_per_page(next_url, page_size.per_page)
+        response = fetch_page(get, page_size, paginate=Paginate(next=next_url))
         yield response
+
+
+def fetch_page(get: Callable, page_size: AdaptivePageSize | None, **kwargs):
+    """Return a page of `get`, recording its latency and size in `page_size`.
+
+    Only the call itself is timed, not the time the consumer spends on pages.
+    """
+    started_at = time.monotonic()
+    response = call_parsed(get, **kwargs)
+    if page_size is not None:
+        page_size.update(time.monotonic() - started_at, get_last_response_size())
+    return response
+
+
+def resumable_paginate(get: Callable, store: CheckpointStore, key: str, **kwargs):
+    """Like `paginate`, but save a checkpoint in `store` after each processed page.
+
+    A page is recorded once the consumer asks for the next one, so when a walk
+    stops, calling `resumable_paginate` again with the same `key` resumes from
+    the first page that was not fully processed. Once the last page is
+    processed the walk is marked as completed and yields nothing anymore;
+    `store.delete(key)` starts it over.
+    """
+    checkpoint = store.load(key) or Checkpoint()
+    if checkpoint.completed:
+        return
+    if checkpoint.next:
+        response = call_parsed(get, paginate=Paginate(next=checkpoint.next))
+    else:
+        response = call_parsed(get, **kwargs)
+
+    while True:
+        yield response
+
+        pagination = response.meta.pagination
+        if pagination is None:
+            raise Exception("Pagination is not supported for this endpoint")
+        has_more = bool(pagination.has_more and pagination.next)
+        checkpoint = Checkpoint(
+            next=pagination.next if has_more else None,
+            pages=checkpoint.pages + 1,
+            items=checkpoint.items + len(response.data),
+            completed=not has_more,
+        )
+        store.save(key, checkpoint)
+        if not has_more:
+            return
+        response = call_parsed(get, paginate=Paginate(next=pagination.next))
+
+
+def iterate(get: Callable, **kwargs):
+    """Like `paginate`, but yield the items of each page one by one.
+
+    Only the current page is kept in memory. Responses may be shared with
+    other callers (e.g. by `single_flight`), so their items are left as is.
+    """
+    response = call_parsed(get, **kwargs)
+    while True:
+        pagination = response.meta.pagination
+        items = response.data
+        del response
+        yield from items
+        del items
+
+        if pagination is None or not (pagination.has_more and pagination.next):
+            return
+        response = call_parsed(get, paginate=Paginate(next=pagination.next))
+
+
+def prefetch_paginate(get: Callable, prefetch: int = 2, **kwargs):
+    """Like `paginate`, but fetch the next pages in a background thread.
+
+    Up to `prefetch` pages are fetched ahead and buffered while the consumer
+    processes the current one, hiding the network latency of each page.
+    Errors are raised to the consumer in page order, and closing the generator
+    stops the background thread after its current request.
+    """
+    if prefetch < 1:
+        raise ValueError(f"Prefetch must be at least 1, got: {prefetch}")
+
+    pages: queue.Queue = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+    done = object()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def fetch():
+        try:
+            for response in paginate(get, **kwargs):
+                if not put((response, None)):
+                    return
+        except Exception as error:
+            put((None, error))
+            return
+        put((done, None))
+
+    context = contextvars.copy_context()
+    thread = threading.Thread(target=context.run, args=(fetch,), daemon=True)
+    thread.start()
+    try:
+        while True:
+            response, error = pages.get()
+            if error is not None:
+                raise error
+            if response is done:
+                return
+            yield response
+    finally:
+        stop.set()
+
+
+async def async_paginate(get: Callable, prefetch: int = 1, **kwargs):
+    """Asyncio counterpart of `paginate` for `AsyncPaddleApiClient`.
+
+    Pages are fetched in cursor order by a background task, up to `prefetch`
+    pages ahead of the consumer: a slow consumer holds the fetching back
+    instead of letting pages pile up.
+    """
+    if prefetch < 1:
+        raise ValueError(f"Prefetch must be at least 1, got: {prefetch}")
+
+    pages: asyncio.Queue = asyncio.Queue(maxsize=prefetch)
+    done = object()
+
+    async def fetch():
+        try:
+            response = await async_call_parsed(get, **kwargs)
+            await pages.put((response, None))
+            if response.meta.pagination is None:
+                raise Exception("Pagination is not supported for this endpoint")
+            while response.meta.pagination.has_more and response.meta.pagination.next:
+                response = await async_call_parsed(
+                    get, paginate=Paginate(next=response.meta.pagination.next)
+                )
+                await pages.put((response, None))
+        except Exception as error:
+            await pages.put((None, error))
+            return
+        await pages.put((done, None))
+
+    task = asyncio.ensure_future(fetch())
+    try:
+        while True:
+            response, error = await pages.get()
+            if error is not None:
+                raise error
+            if response is done:
+                return
+            yield response
+    finally:
+        task.cancel()
+
+
+async def async_iterate(get: Callable, prefetch: int = 1, **kwargs):
+    """Asyncio counterpart of `iterate`, fetching pages like `async_paginate`"""
+    async for response in async_paginate(get, prefetch, **kwargs):
+        for item in response.data:
+            yield item
+
+
+async def async_process(
+    items: AsyncIterable, process: Callable[..., Awaitable], concurrency: int = 8
+):
+    """Run `process` on items concurrently and yield the results in item order.
+
+    At most `concurrency` items are processed at once; the next items are only
+    pulled from `items` when a slot frees up, so pagination waits for slow
+    processing.
+    """
+    if concurrency < 1:
+        raise ValueError(f"Concurrency must be at least 1, got: {concurrency}")
+
+    running: deque[asyncio.Future] = deque()
+    try:
+        async for item in items:
+            if len(running) >= concurrency:
+                yield await running.popleft()
+            running.append(asyncio.ensure_future(process(item)))
+        while running:
+            yield await running.popleft()
+    finally:
+        for future in running:
+            future.cancel()
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import types
+from typing import Annotated, Any, Iterable, Union, get_args, get_origin
+
+import copy
+import functools
+import inspect
+
+from pydantic import BaseModel, ConfigDict, create_model, field_validator
+
+from paddle_billing_client.models.base import LazyBaseModel, PaddleResponse
+
+# Nested selections: the selected fields of a model, by name, with the selected
+# fields of their sub-models (empty when the whole field is selected).
+Selection = dict[str, "Selection"]
+
+
+class ProjectedModel(LazyBaseModel):
+    """Base of the models generated by `get_projected_model`.
+
+    Keys of fields that were not selected are ignored while validating, so
+    they are skipped by the JSON parser rather than built into objects.
+    """
+
+    model_config = ConfigDict(extra="ignore")
+
+    # Model the projection was generated from.
+    __projected_from__: type[BaseModel]
+
+
+def parse_fields(fields: Iterable[str]) -> Selection:
+    """Parse field paths like `items[].price.id` into a nested selection"""
+    selection: Selection = {}
+    for path in sorted(fields):
+        names = path.replace("[]", "").split(".")
+        if not all(names):
+            raise ValueError(f"Invalid field path {path!r}")
+        node = selection
+        for name in names[:-1]:
+            if node.get(name) == {}:
+                # The whole field is selected by a shorter path.
+                break
+            node = node.setdefault(name, {})
+        else:
+            node[names[-1]] = {}
+    return selection
+
+
+def get_projected_model(
+    model: type[BaseModel], fields: Iterable[str]
+) -> type[BaseModel]:
+    """Return the model of `model` responses keeping only the given fields.
+
+    Fields are paths relative to the entities of the response (the items of
+    `data`), with dots separating the fields of sub-models and an optional
+    `[]` after lists, e.g. `["id", "status", "items[].price.id"]`. Models are
+    generated once per projection and cached.
+    """
+    return _get_projected_model(model, tuple(sorted(set(fields))))
+
+
+@functools.cache
+def _get_projected_model(
+    model: type[BaseModel], fields: tuple[str, ...]
+) -> type[BaseModel]:
+    selection = parse_fields(fields)
+    if issubclass(model, PaddleResponse):
+        selection = {"meta": {}, "data": selection}
+    projected = project_model(model, selection)
+    projected.__projected_from__ = model
+    return projected
+
+
+def project_model(model: type[BaseModel], selection: Selection) -> type[BaseModel]:
+    unknown = selection.keys() - model.model_fields.keys()
+    if unknown:
+        raise ValueError(f"{model.__name__} has no field {min(unknown)!r}")
+    fields = {}
+    # Fields keep the order of the model, which validators can rely on (e.g.
+    # the event data dispatch reads `event_type`).
+    for name, field in model.model_fields.items():
+        if name not in selection:
+            continue
+        sub_selection = selection[name]
+        annotation = field.annotation
+        if sub_selection:
+            annotation = project_annotation(annotation, sub_selection)
+            if annotation is None:
+                raise ValueError(
+                    f"Field {name!r} of {model.__name__} has no sub-fields to select"
+                )
+        field = copy.copy(field)
+        field.annotation = annotation
+        fields[name] = (annotation, field)
+
+    # Field validators of the selected fields, like the event data dispatch.
+    validators = {}
+    for (
+        decorator_name,
+        decorator,
+    ) in model.__pydantic_decorators__.field_validators.items():
+        selected = [name for name in decorator.info.fields if name in fields]
+        if selected:
+            validators[decorator_name] = field_validator(
+                *selected, mode=decorator.info.mode
+            )(classmethod(decorator.func.__func__))
+    return create_model(
+        f"{model.__name__}Projection",
+        __base__=ProjectedModel,
+        __validators__=validators,
+        **fields,
+    )
+
+
+def project_annotation(annotation: Any, selection: Selection) -> Any:
+    """Return the annotation with its model projected, None when it holds no model"""
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return project_annotation(get_args(annotation)[0], selection)
+    if origin in (Union, types.UnionType):
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(members) != 1:
+            return None
+        projected = project_annotation(members[0], selection)
+        if projected is None:
+            return None
+        return (
+            projected | None if len(members) < len(get_args(annotation)) else projected
+        )
+    if origin is list:
+        args = get_args(annotation)
+        projected = project_annotation(args[0], selection) if args else None
+        return list[projected] if projected is not None else None
+    if origin is dict:
+        args = get_args(annotation)
+        projected = project_annotation(args[1], selection) if args else None
+        return dict[args[0], projected] if projected is not None else None
+    if inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+        return project_model(annotation, selection)
+    return None
+
+
+def is_projection_of(instance: Any, model: type[BaseModel]) -> bool:
+    """Return whether `instance` is a projection of `model`"""
+    return getattr(type(instance), "__projected_from__", None) is model
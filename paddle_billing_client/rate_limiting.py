@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+
+from apiclient.authentication_methods import BaseAuthenticationMethod
+
+from paddle_billing_client.endpoints import get_endpoint_group
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    `reserve` takes tokens right away, going into debt when the bucket is empty,
+    and returns how long the caller has to wait before using them. Concurrent
+    callers therefore queue up in arrival order instead of racing for refills.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        if rate <= 0:
+            raise ValueError(f"Rate limit must be positive, got: {rate}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take tokens from the bucket and return the seconds to wait for them"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, wait = _take(
+                self._tokens, now - self._updated_at, self.rate, self.capacity, tokens
+            )
+            self._updated_at = now
+        return wait
+
+
+class FileTokenBucket(TokenBucket):
+    """Token bucket kept in a file, shared by every process using the same path.
+
+    The bucket state is read and written under an exclusive `flock`, so it is
+    safe to use from several threads and processes on the same host.
+    """
+
+    def __init__(self, path: str, rate: float, capacity: float | None = None):
+        if fcntl is None:  # pragma: no cover
+            raise RuntimeError("FileTokenBucket requires fcntl (POSIX only)")
+        super().__init__(rate, capacity)
+        self.path = path
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take tokens from the shared bucket and return the seconds to wait for them"""
+        with self._lock, open(self.path, "a+") as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                file.seek(0)
+                content = file.read()
+                now = time.time()
+                state = json.loads(content) if content else {}
+                available, wait = _take(
+                    state.get("tokens", self.capacity),
+                    now - state.get("updated_at", now),
+                    self.rate,
+                    self.capacity,
+                    tokens,
+                )
+                file.seek(0)
+                file.truncate()
+                file.write(json.dumps({"tokens": available, "updated_at": now}))
+                file.flush()
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
+        return wait
+
+
+def _take(
+    available: float, elapsed: float, rate: float, capacity: float, tokens: float
+) -> tuple[float, float]:
+    available = min(capacity, available + max(elapsed, 0) * rate) - tokens
+    return available, max(-available, 0) / rate
+
+
+class RateLimiter:
+    """Client-side rate limiter for `PaddleApiClient` and `AsyncPaddleApiClient`.
+
+    Requests are limited per API key and, with `per_endpoint_group`, per
+    endpoint group (`products`, `transactions`, `subscriptions`, ...).
+    One limiter can be shared by several clients and threads.
+    When `directory` is set, buckets are stored as files in that directory,
+    sharing the limit with every process using the same directory.
+
+    :param rate: Number of requests allowed per second.
+    :param capacity: Maximum burst size, defaults to `rate`.
+    :param per_endpoint_group: Keep a separate bucket for each endpoint group.
+    :param directory: Directory for the cross-process file buckets.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        per_endpoint_group: bool = False,
+        directory: str | None = None,
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self.per_endpoint_group = per_endpoint_group
+        self.directory = directory
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def get_bucket(
+        self, authentication_method: BaseAuthenticationMethod, endpoint: str
+    ) -> TokenBucket:
+        api_key = str(authentication_method.get_headers()) + str(
+            authentication_method.get_query_params()
+        )
+        key = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+        if self.per_endpoint_group:
+            key = f"{key}-{get_endpoint_group(endpoint)}"
+        with self._lock:
+            if key not in self._buckets:
+                if self.directory is not None:
+                    self._buckets[key] = FileTokenBucket(
+                        os.path.join(self.directory, f"paddle-rate-limit-{key}.json"),
+                        self.rate,
+                        self.capacity,
+                    )
+                else:
+                    self._buckets[key] = TokenBucket(self.rate, self.capacity)
+            return self._buckets[key]
+
+    def wait(
+        self, authentication_method: BaseAuthenticationMethod, endpoint: str
+    ) -> None:
+        """Block until a request to the endpoint is allowed"""
+        delay = self.get_bucket(authentication_method, endpoint).reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(
+        self, authentication_method: BaseAuthenticationMethod, endpoint: str
+    ) -> None:
+        """Wait without blocking the event loop until a request is allowed"""
+        delay = self.get_bucket(authentication_method, endpoint).reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
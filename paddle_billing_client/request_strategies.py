@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import time
+from contextvars import ContextVar
+
+from apiclient.request_strategies import RequestStrategy
+from apiclient.response import Response
+
+from paddle_billing_client.idempotency import get_idempotency_key, is_outcome_known
+from paddle_billing_client.options import get_request_options
+from paddle_billing_client.retrying import RetryPolicy, get_retry_after
+from paddle_billing_client.single_flight import get_request_key
+
+_response_size: ContextVar[int | None] = ContextVar(
+    "paddle_response_size", default=None
+)
+
+
+def get_last_response_size() -> int | None:
+    """Return the body size in bytes of the last response of the current context"""
+    return _response_size.get()
+
+
+def set_last_response_size(response: Response) -> None:
+    _response_size.set(len(response.get_original().content))
+
+
+class PaddleRequestStrategy(RequestStrategy):
+    """Requests strategy applying the `PaddleApiClient` request policies."""
+
+    def get(self, endpoint: str, params: dict | None = None, **kwargs):
+        """Return response data from GET endpoint, sharing identical calls in flight."""
+        single_flight = self.get_client().single_flight
+        if single_flight is None or kwargs:
+            return super().get(endpoint, params=params, **kwargs)
+        return single_flight.do(
+            get_request_key(endpoint, params),
+            lambda: super(PaddleRequestStrategy, self).get(endpoint, params=params),
+        )
+
+    def _make_request(
+        self,
+        request_method: Callable,
+        endpoint: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+        data: dict | None = None,
+        **kwargs,
+    ) -> Response:
+        method = request_method.__name__.upper()
+        store = self.get_client().idempotency_keys
+        header, key, fingerprint = get_idempotency_key(store, method, endpoint, data)
+        if key is not None:
+            headers = {**(headers or {}), header: key}
+        try:
+            response = self._make_request_with_retries(
+                request_method,
+                endpoint,
+                params=params,
+                headers=headers,
+                data=data,
+                idempotent=key is not None,
+                **kwargs,
+            )
+        except Exception as error:
+            if fingerprint is not None and is_outcome_known(error):
+                store.release(fingerprint)
+            raise
+        if fingerprint is not None:
+            store.release(fingerprint)
+        return response
+
+    def _make_request_with_retries(
+        self,
+        request_method: Callable,
+        endpoint: str,
+        idempotent: bool = False,
+        **kwargs,
+    ) -> Response:
+        client = self.get_client()
+        retry_policy = self._get_retry_policy()
+        method = request_method.__name__
+        attempt = 1
+        while True:
+            if client.rate_limiter is not None:
+                client.rate_limiter.wait(client.get_authentication_method(), endpoint)
+            try:
+                return super()._make_request(request_method, endpoint, **kwargs)
+            except Exception as error:
+                if retry_policy is None or not retry_policy.should_retry(
+                    method, error, attempt, idempotent=idempotent
+                ):
+                    raise
+                time.sleep(retry_policy.get_delay(attempt, error))
+                attempt += 1
+
+    def _get_retry_policy(self) -> RetryPolicy | None:
+        return get_request_options().retry_policy or self.get_client().retry_policy
+
+    def _decode_response_data(self, response: Response):
+        set_last_response_size(response)
+        return super()._decode_response_data(response)
+
+    def _handle_bad_response(self, response: Response):
+        """Convert the error into a client exception, keeping its `Retry-After`."""
+        error = self.get_client().get_error_handler().get_exception(response)
+        error.retry_after = get_retry_after(response)
+        raise error
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from apiclient.exceptions import APIRequestError
+from apiclient.response import Response
+from pydantic import BaseModel, ConfigDict
+
+
+class RetryPolicy(BaseModel):
+    """When and how often a failed request is retried.
+
+    Only idempotent methods are retried by default, so a write is never sent
+    twice unless it is explicitly allowed in `methods`.
+    """
+
+    # Total number of attempts, including the first request.
+    max_attempts: int = 3
+    # Delay before the first retry in seconds, doubled on each further attempt.
+    backoff_factor: float = 0.5
+    # Upper bound of the backoff delay in seconds.
+    backoff_max: float = 30.0
+    # Randomize delays between 0 and the backoff delay ("full jitter").
+    jitter: bool = True
+    # Status codes worth retrying.
+    retry_on_status: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    # Retry requests failing without a response, e.g. connection errors or timeouts.
+    retry_on_connection_errors: bool = True
+    # HTTP methods which are safe to retry.
+    methods: frozenset[str] = frozenset({"GET"})
+    # Also retry writes sent with an idempotency key.
+    retry_idempotent_writes: bool = True
+    # Wait as long as the `Retry-After` header says, when it is present.
+    respect_retry_after: bool = True
+    # Upper bound in seconds of the wait asked by a `Retry-After` header.
+    max_retry_after: float = 60.0
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    def should_retry(
+        self, method: str, error: Exception, attempt: int, idempotent: bool = False
+    ) -> bool:
+        """Return whether the request should be sent again after `error`"""
+        if attempt >= self.max_attempts:
+            return False
+        if method.upper() not in self.methods and not (
+            idempotent and self.retry_idempotent_writes
+        ):
+            return False
+        if not isinstance(error, APIRequestError):
+            return False
+        if error.status_code is None:
+            return self.retry_on_connection_errors
+        return error.status_code in self.retry_on_status
+
+    def get_delay(self, attempt: int, error: Exception | None = None) -> float:
+        """Return the seconds to wait before the next attempt"""
+        retry_after = getattr(error, "retry_after", None)
+        if self.respect_retry_after and retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        delay = min(self.backoff_max, self.backoff_factor * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)  # nosec B311
+        return delay
+
+
+def get_retry_after(response: Response) -> float | None:
+    """Return the `Retry-After` header of a response in seconds"""
+    headers = getattr(response.get_original(), "headers", None) or {}
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
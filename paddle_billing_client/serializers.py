@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Literal, TypeVar, get_type_hints
+
+import functools
+import inspect
+import re
+from contextlib import nullcontext
+from contextvars import ContextVar
+
+from apiclient import APIClient
+from apiclient.exceptions import ResponseParseError
+from apiclient.response import Response
+from apiclient.response_handlers import JsonResponseHandler
+from pydantic import BaseModel, TypeAdapter, ValidationError, validate_call
+from pydantic_core import from_json
+
+from paddle_billing_client.construct import construct_model
+from paddle_billing_client.identity import (
+    get_identity_map,
+    get_identity_validator,
+    identity_map,
+)
+from paddle_billing_client.lazy import validate_lazy
+from paddle_billing_client.models.base import PaddleResponse, RawResponse
+from paddle_billing_client.options import get_request_options, request_options
+from paddle_billing_client.projection import get_projected_model
+
+T = TypeVar("T", bound=type)
+
+APICLIENT_METHODS: set[str] = {
+    name for name, _ in inspect.getmembers(APIClient, predicate=inspect.isfunction)
+}
+# Client helpers built on the endpoint methods, whose calls are serialized.
+HELPER_METHODS = re.compile(r"iter_\w+|get_\w+_by_ids")
+
+_response_model: ContextVar[type[BaseModel] | None] = ContextVar(
+    "paddle_response_model", default=None
+)
+# How responses are parsed: validated, validated lazily (`validate_lazy`),
+# built without validation (`construct_model`) or not decoded (`RawResponse`).
+ResponseMode = Literal["validate", "lazy", "construct", "raw"]
+
+_response_mode: ContextVar[ResponseMode] = ContextVar(
+    "paddle_response_mode", default="validate"
+)
+
+
+def get_response_model() -> type[BaseModel] | None:
+    """Return the model the response of the current client method is parsed into"""
+    return _response_model.get()
+
+
+def get_response_mode() -> ResponseMode:
+    """Return how the response of the current client method is parsed"""
+    return _response_mode.get()
+
+
+def get_client_response_mode(client: Any) -> ResponseMode:
+    """Return how a client parses responses, honouring `request_options`"""
+    options = get_request_options()
+    raw = options.raw
+    if raw is None:
+        raw = getattr(client, "raw", False)
+    if raw:
+        return "raw"
+    validate = options.validate_responses
+    if validate is None:
+        validate = getattr(client, "validate", True)
+    if not validate:
+        return "construct"
+    lazy = options.lazy
+    if lazy is None:
+        lazy = getattr(client, "lazy", False)
+    return "lazy" if lazy else "validate"
+
+
+class PydanticResponseHandler(JsonResponseHandler):
+    """Parse response bodies straight into the response model of the client method.
+
+    The raw bytes are validated by pydantic's JSON parser in one pass, instead
+    of being decoded into Python objects first and validated afterwards.
+    Responses of calls made outside client methods are decoded as JSON.
+
+    With `lazy=True`, the decoded JSON is validated by `validate_lazy`, and
+    with `validate=False` it is built into the model by `construct_model`
+    instead, without validating it. With `raw=True`, the response is returned
+    undecoded as a `RawResponse`. While an `IdentityMap` is enabled, entities
+    already parsed are shared rather than validated again.
+    """
+
+    @staticmethod
+    def get_request_data(response: Response):
+        if get_response_mode() == "raw":
+            return get_raw_response(response)
+        model = get_response_model()
+        if model is None:
+            return JsonResponseHandler.get_request_data(response)
+
+        content = response.get_original().content
+        if not content:
+            return None
+        mode = get_response_mode()
+        if mode != "validate":
+            try:
+                data = from_json(content)
+            except ValueError as error:
+                raise ResponseParseError(
+                    f"Unable to decode response data to json. data='{response.get_raw_data()}'"
+                ) from error
+            if mode == "lazy":
+                return validate_lazy(model, data)
+            return construct_model(model, data)
+        try:
+            identity = get_identity_map()
+            validator = get_identity_validator(model) if identity is not None else None
+            if validator is not None:
+                return validator.validate_json(content)
+            return model.model_validate_json(content)
+        except ValidationError as error:
+            if any(detail["type"] == "json_invalid" for detail in error.errors()):
+                raise ResponseParseError(
+                    f"Unable to decode response data to json. data='{response.get_raw_data()}'"
+                ) from error
+            raise
+
+
+def get_raw_response(response: Response) -> RawResponse:
+    """Return the undecoded body, status and headers of a response"""
+    original = response.get_original()
+    return RawResponse(
+        content=original.content,
+        status_code=response.get_status_code(),
+        headers=dict(original.headers),
+        request_id=original.headers.get("Request-Id"),
+    )
+
+
+def serialize(function: Callable) -> Callable:
+    """Validate the arguments and the return value of a client method.
+
+    Methods returning a pydantic model expose it to `PydanticResponseHandler`,
+    which parses the response body into it, or returns it undecoded as a
+    `RawResponse` when the client or the call has `raw=True`. Other return
+    values (e.g. the JSON decoded by a custom response handler) are validated
+    into the return type, lazily when the client or the call has `lazy=True`,
+    or built into the model without validation when it has `validate=False`.
+
+    Entities are parsed with the identity map of the client (`identity_map`)
+    enabled, unless one is already enabled by the `identity_map` block.
+
+    Methods returning a `PaddleResponse` also take a `fields` keyword argument,
+    a shorthand for `request_options(fields=...)`: their response is then
+    validated into the projection of the model keeping these fields (see
+    `get_projected_model`).
+    """
+    validated = validate_call(function)
+    return_type = get_type_hints(function, include_extras=True).get("return", Any)
+    model = (
+        return_type
+        if inspect.isclass(return_type) and issubclass(return_type, BaseModel)
+        else None
+    )
+    adapter = TypeAdapter(return_type)
+
+    projectable = model is not None and issubclass(model, PaddleResponse)
+
+    def get_response_setup(args) -> tuple[type[BaseModel] | None, ResponseMode]:
+        mode = get_client_response_mode(args[0]) if args else "validate"
+        fields = get_request_options().fields if projectable else None
+        if fields and mode != "raw":
+            return get_projected_model(model, fields), "validate"
+        return model, mode
+
+    def get_options(kwargs):
+        fields = kwargs.pop("fields", None) if projectable else None
+        return request_options(fields=fields) if fields is not None else nullcontext()
+
+    def get_identity_scope(args):
+        # The client identity map, unless one is enabled for the block.
+        identity = getattr(args[0], "identity_map", None) if args else None
+        if identity is None or get_identity_map() is not None:
+            return nullcontext()
+        return identity_map(identity)
+
+    def validate_return(result, response_model, mode: ResponseMode):
+        if isinstance(result, RawResponse) or (
+            response_model is not None and isinstance(result, response_model)
+        ):
+            return result
+        if response_model is not model:
+            return response_model.model_validate(result)
+        if model is None and get_request_options().fields:
+            # Items of projected responses, e.g. yielded by the `iter_*` methods.
+            return result
+        if model is not None and mode == "lazy":
+            return validate_lazy(model, result)
+        if model is not None and mode == "construct":
+            return construct_model(model, result)
+        return adapter.validate_python(result)
+
+    if inspect.iscoroutinefunction(function):
+
+        @functools.wraps(function)
+        async def async_wrapper(*args, **kwargs):
+            with get_options(kwargs), get_identity_scope(args):
+                response_model, mode = get_response_setup(args)
+                token = _response_model.set(response_model)
+                mode_token = _response_mode.set(mode)
+                try:
+                    result = await validated(*args, **kwargs)
+                finally:
+                    _response_mode.reset(mode_token)
+                    _response_model.reset(token)
+            return validate_return(result, response_model, mode)
+
+        return async_wrapper
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        with get_options(kwargs), get_identity_scope(args):
+            response_model, mode = get_response_setup(args)
+            token = _response_model.set(response_model)
+            mode_token = _response_mode.set(mode)
+            try:
+                result = validated(*args, **kwargs)
+            finally:
+                _response_mode.reset(mode_token)
+                _response_model.reset(token)
+        return validate_return(result, response_model, mode)
+
+    return wrapper
+
+
+def serialize_all_methods(cls: T) -> T:
+    """Serialize every public endpoint method of a client class with `serialize`.
+
+    Helpers (`iter_*`, `get_*_by_ids`) are left as is, the endpoint methods
+    they call being serialized.
+    """
+    for name, value in list(vars(cls).items()):
+        if (
+            not name.startswith("_")
+            and inspect.isfunction(value)
+            and name not in APICLIENT_METHODS
+            and not HELPER_METHODS.fullmatch(name)
+        ):
+            setattr(cls, name, serialize(value))
+    return cls
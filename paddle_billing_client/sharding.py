@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+from typing import Literal
+
+import asyncio
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+
+from paddle_billing_client.endpoints import MAX_PER_PAGE
+from paddle_billing_client.models.common import Paginate
+from paddle_billing_client.models.transaction import TransactionQueryParams
+from paddle_billing_client.options import async_call_parsed, call_parsed
+
+TimeField = Literal["created_at", "updated_at", "billed_at"]
+Window = tuple[datetime, datetime]
+
+
+def split_time_range(start: datetime, end: datetime, shards: int) -> list[Window]:
+    """Split [start, end) into `shards` contiguous windows of equal length"""
+    if shards < 1:
+        raise ValueError(f"Shards must be at least 1, got: {shards}")
+    if end <= start:
+        raise ValueError(f"Time range end must be after its start, got: {start}, {end}")
+    step = (end - start) / shards
+    bounds = [start + step * index for index in range(shards)] + [end]
+    return [
+        (window_start, window_end)
+        for window_start, window_end in zip(bounds, bounds[1:])
+        if window_start < window_end
+    ]
+
+
+def format_datetime(value: datetime) -> str:
+    """Format a datetime as an RFC 3339 UTC string, naive datetimes being UTC"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def get_window_query_params(
+    query_params: TransactionQueryParams | None, field: TimeField, window: Window
+) -> TransactionQueryParams:
+    """Return the query params listing the transactions of a window"""
+    query_params = query_params or TransactionQueryParams()
+    return query_params.model_copy(
+        update={
+            f"{field}_gte": format_datetime(window[0]),
+            f"{field}_lt": format_datetime(window[1]),
+            "after": None,
+            "per_page": query_params.per_page or MAX_PER_PAGE["transactions"],
+        }
+    )
+
+
+def should_split(
+    response, window: Window, max_window_total: int | None, min_window: timedelta
+) -> bool:
+    pagination = response.meta.pagination
+    return (
+        max_window_total is not None
+        and pagination is not None
+        and pagination.has_more
+        and pagination.estimated_total > max_window_total
+        and window[1] - window[0] >= min_window * 2
+    )
+
+
+def fetch_window_page(
+    client,
+    window: Window,
+    field: TimeField,
+    query_params: TransactionQueryParams | None,
+    max_window_total: int | None,
+    min_window: timedelta,
+    next_url: str | None = None,
+) -> tuple[list, str | None, list[Window]]:
+    """Fetch a page of a window, or split the window when it is too large.
+
+    The first page is fetched without `next_url`. Return the transactions of the
+    page and the url of the next one (None after the last page), or the two
+    halves of the window to fetch instead.
+    """
+    if next_url is None:
+        response = call_parsed(
+            client.list_transactions,
+            query_params=get_window_query_params(query_params, field, window),
+        )
+        if should_split(response, window, max_window_total, min_window):
+            return [], None, split_time_range(*window, 2)
+    else:
+        response = call_parsed(
+            client.list_transactions, paginate=Paginate(next=next_url)
+        )
+    return response.data, get_next_url(response), []
+
+
+async def fetch_window_page_async(
+    client,
+    window: Window,
+    field: TimeField,
+    query_params: TransactionQueryParams | None,
+    max_window_total: int | None,
+    min_window: timedelta,
+    next_url: str | None = None,
+) -> tuple[list, str | None, list[Window]]:
+    """Asyncio counterpart of `fetch_window_page` for `AsyncPaddleApiClient`"""
+    if next_url is None:
+        response = await async_call_parsed(
+            client.list_transactions,
+            query_params=get_window_query_params(query_params, field, window),
+        )
+        if should_split(response, window, max_window_total, min_window):
+            return [], None, split_time_range(*window, 2)
+    else:
+        response = await async_call_parsed(
+            client.list_transactions, paginate=Paginate(next=next_url)
+        )
+    return response.data, get_next_url(response), []
+
+
+def get_next_url(response) -> str | None:
+    pagination = response.meta.pagination
+    if pagination is None or not pagination.has_more:
+        return None
+    return pagination.next
+
+
+class WindowMerger:
+    """Collect the pages of windows fetched in any order.
+
+    When `ordered`, windows are buffered until they are complete, released in
+    time order and their transactions sorted by the scanned field. Otherwise
+    pages are released as soon as they are fetched.
+    """
+
+    def __init__(self, windows: list[Window], field: TimeField, ordered: bool):
+        self.field = field
+        self.ordered = ordered
+        self._windows = list(windows)
+        self._results: dict[Window, list] = {}
+        self._completed: set[Window] = set()
+        self._ready: list = []
+
+    def split(self, window: Window, windows: list[Window]) -> None:
+        if self.ordered:
+            index = self._windows.index(window)
+            self._windows[index : index + 1] = windows
+
+    def add(self, window: Window, items: list, last: bool) -> None:
+        """Add a page of a window, `last` when it completes the window"""
+        if not self.ordered:
+            self._ready.extend(items)
+            return
+        self._results.setdefault(window, []).extend(items)
+        if last:
+            self._completed.add(window)
+
+    def pop_ready(self) -> list:
+        """Return the transactions that can be yielded now"""
+        ready, self._ready = self._ready, []
+        while self._windows and self._windows[0] in self._completed:
+            window = self._windows.pop(0)
+            self._completed.remove(window)
+            items = self._results.pop(window, [])
+            ready.extend(
+                sorted(items, key=lambda item: getattr(item, self.field) or "")
+            )
+        return ready
+
+
+def scan_transactions(
+    client,
+    start: datetime,
+    end: datetime,
+    shards: int = 4,
+    field: TimeField = "created_at",
+    query_params: TransactionQueryParams | None = None,
+    max_workers: int = 4,
+    max_window_total: int | None = None,
+    min_window: timedelta = timedelta(minutes=1),
+    ordered: bool = False,
+):
+    """Iterate over the transactions of a time range, paginating windows in parallel.
+
+    The range [start, end) of `field` is split into `shards` windows, paginated
+    in parallel threads with the `[GTE]`/`[LT]` operators of the field: each
+    fetched page schedules the next page of its window.
+    With `max_window_total`, windows whose `estimated_total` is larger are
+    split in two until they are shorter than `2 * min_window`.
+
+    :param client: The `PaddleApiClient` used for the list calls.
+    :param query_params: Other filters applied to every window.
+    :param ordered: Yield transactions ordered by `field`, buffering each window
+        until it is fetched, instead of as soon as their page is fetched.
+    """
+    windows = split_time_range(start, end, shards)
+    merger = WindowMerger(windows, field, ordered)
+    executor = ThreadPoolExecutor(max_workers)
+
+    def submit(window: Window, next_url: str | None = None):
+        return executor.submit(
+            contextvars.copy_context().run,
+            fetch_window_page,
+            client,
+            window,
+            field,
+            query_params,
+            max_window_total,
+            min_window,
+            next_url,
+        )
+
+    try:
+        pending = {submit(window): window for window in windows}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                window = pending.pop(future)
+                items, next_url, split = future.result()
+                if split:
+                    merger.split(window, split)
+                    pending.update({submit(half): half for half in split})
+                    continue
+                if next_url:
+                    pending[submit(window, next_url)] = window
+                merger.add(window, items, last=not next_url)
+            yield from merger.pop_ready()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def scan_transactions_async(
+    client,
+    start: datetime,
+    end: datetime,
+    shards: int = 4,
+    field: TimeField = "created_at",
+    query_params: TransactionQueryParams | None = None,
+    max_concurrency: int = 4,
+    max_window_total: int | None = None,
+    min_window: timedelta = timedelta(minutes=1),
+    ordered: bool = False,
+):
+    """Asyncio counterpart of `scan_transactions` for `AsyncPaddleApiClient`"""
+    windows = split_time_range(start, end, shards)
+    merger = WindowMerger(windows, field, ordered)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(window: Window, next_url: str | None = None):
+        async with semaphore:
+            return await fetch_window_page_async(
+                client,
+                window,
+                field,
+                query_params,
+                max_window_total,
+                min_window,
+                next_url,
+            )
+
+    pending = {asyncio.ensure_future(fetch(window)): window for window in windows}
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                window = pending.pop(task)
+                items, next_url, split = task.result()
+                if split:
+                    merger.split(window, split)
+                    pending.update(
+                        {asyncio.ensure_future(fetch(half)): half for half in split}
+                    )
+                    continue
+                if next_url:
+                    pending[asyncio.ensure_future(fetch(window, next_url))] = window
+                merger.add(window, items, last=not next_url)
+            for item in merger.pop_ready():
+                yield item
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Hashable
+
+import asyncio
+import json
+import threading
+
+from paddle_billing_client.options import get_request_options
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Collapse concurrent identical calls into one.
+
+    The first caller of a key runs the function while the callers arriving
+    before it finished wait and receive the same result (or exception).
+    Results are not cached: a call made after the first one finished runs
+    the function again.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """Run `function`, or wait for the call in flight with the same key"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """Asyncio counterpart of `SingleFlight`.
+
+    The shared call runs in its own task, so a waiter being cancelled does not
+    cancel the request for the other waiters.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[Any]]) -> Any:
+        """Await `function`, or the call in flight with the same key"""
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(function())
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(task)
+
+
+def get_request_key(endpoint: str, params: dict | None) -> Hashable:
+    """Return the key identifying identical GET requests"""
+    return (
+        endpoint,
+        json.dumps(params, sort_keys=True, default=str),
+        get_request_options(),
+    )
@@ -1,4 +1,8 @@
-import functools
+from __future__ import annotations
+
+from typing import Annotated, Any, Union
+
+from pydantic import BaseModel, SkipValidation, ValidationInfo
 
 from paddle_billing_client.models.address import Address
 from paddle_billing_client.models.adjustment import Adjustment
@@ -9,24 +13,57 @@ from paddle_billing_client.models.product import Product
 from paddle_billing_client.models.subscription import Subscription
 from paddle_billing_client.models.transaction import Transaction
 
+# Model of the event data, by event type prefix (`subscription.created` -> `subscription`).
+EVENT_ENTITY_MODELS: dict[str, type[BaseModel]] = {
+    "subscription": Subscription,
+    "transaction": Transaction,
+    "customer": Customer,
+    "product": Product,
+    "price": Price,
+    "address": Address,
+    "business": Business,
+    "adjustment": Adjustment,
+}
+
+
+def get_event_entity(event_type: str) -> str | None:
+    """Return the entity of an event type, None when its data is kept as a dict"""
+    entity = event_type.partition(".")[0]
+    return entity if entity in EVENT_ENTITY_MODELS else None
+
+
+# Event data: the model of its event type, or a dict for other event types.
+# `validate_event_data` validates it, the field keeping the result as is.
+EventData = Annotated[
+    Union[
+        Subscription,
+        Transaction,
+        Customer,
+        Product,
+        Price,
+        Address,
+        Business,
+        Adjustment,
+        BaseModel,
+        dict[str, Any],
+    ],
+    SkipValidation,
+]
+
 
 def parse_event_to_model(event_type: str, data):
     if not isinstance(data, dict):
         return data
-    if event_type.startswith("subscription"):
-        return Subscription(**data)
-    elif event_type.startswith("transaction"):
-        return Transaction(**data)
-    elif event_type.startswith("customer"):
-        return Customer(**data)
-    elif event_type.startswith("product"):
-        return Product(**data)
-    elif event_type.startswith("price"):
-        return Price(**data)
-    elif event_type.startswith("address"):
-        return Address(**data)
-    elif event_type.startswith("business"):
-        return Business(**data)
-    elif event_type.startswith("adjustment"):
-        return Adjustment(**data)
-    return data
+    entity = get_event_entity(event_type)
+    if entity is None:
+        return data
+    return EVENT_ENTITY_MODELS[entity].model_validate(data)
+
+
+def validate_event_data(data, info: ValidationInfo):
+    """Before validator of event `data` fields, dispatching on the event type.
+
+    The data is validated once, into the model of the event type, and kept
+    as is by the `EventData` field.
+    """
+    return parse_event_to_model(info.data.get("event_type", ""), data)
@@ -1,6 +1,60 @@
+import os
+
 import pytest
+import requests
+import yaml
+from apiclient.authentication_methods import HeaderAuthentication
+
+from paddle_billing_client.client import PaddleApiClient
+
+CASSETTES = os.path.join(os.path.dirname(__file__), "cassettes")
+
+
+def cassette_body(path):
+    """Return the body of the first response recorded in a cassette of `CASSETTES`"""
+    with open(os.path.join(CASSETTES, path)) as file:
+        interaction = yaml.safe_load(file)["interactions"][0]
+    return interaction["response"]["body"]["string"].encode()
 
 
 @pytest.fixture(autouse=True)
 def vcr_config():
     return {"decode_compressed_response": True, "record_mode": "once"}
+
+
+class FakeAdapter(requests.adapters.BaseAdapter):
+    """Replay canned (status, headers, body) responses"""
+
+    def __init__(self, responses):
+        super().__init__()
+        self.responses = list(responses)
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        status, headers, body = self.responses.pop(0)
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response._content = body
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_client():
+    """Return a factory of clients answering with canned responses"""
+
+    def create_client(responses, **kwargs):
+        client = PaddleApiClient(
+            authentication_method=HeaderAuthentication(token="token"), **kwargs
+        )
+        adapter = FakeAdapter(responses)
+        client.get_session().mount("https://", adapter)
+        return client, adapter
+
+    return create_client
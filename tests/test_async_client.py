@@ -0,0 +1,97 @@
+import asyncio
+import os
+
+import deepdiff
+import pytest
+from apiclient.authentication_methods import HeaderAuthentication
+from conftest import CASSETTES
+
+from paddle_billing_client.models.price import PriceResponse
+from paddle_billing_client.models.product import ProductResponse, ProductsResponse
+
+
+class TestAsyncClient:
+    def setup_class(self):
+        from paddle_billing_client.async_client import (  # pragma: no cover
+            AsyncPaddleApiClient,
+        )
+        from paddle_billing_client.client import PaddleApiClient  # pragma: no cover
+
+        self.async_client_class = AsyncPaddleApiClient
+        self.client = PaddleApiClient(
+            authentication_method=HeaderAuthentication(
+                token=os.getenv("PADDLE_SANDBOX_AUTH_TOKEN")
+            ),
+        )
+
+    def run(self, method_name, *args, **kwargs):
+        async def call():
+            async with self.async_client_class(
+                authentication_method=HeaderAuthentication(
+                    token=os.getenv("PADDLE_SANDBOX_AUTH_TOKEN")
+                ),
+            ) as client:
+                return await getattr(client, method_name)(*args, **kwargs)
+
+        return asyncio.run(call())
+
+    @pytest.mark.vcr(
+        os.path.join(CASSETTES, "test_product", "TestProduct.test_product_get.yaml"),
+        allow_playback_repeats=True,
+    )
+    def test_get_product(self):
+        product = self.run("get_product", "pro_01h89b2j66qq82x6vn5d39c4av")
+        expected_product = self.client.get_product("pro_01h89b2j66qq82x6vn5d39c4av")
+
+        assert isinstance(product, ProductResponse)
+        assert (
+            deepdiff.DeepDiff(
+                product,
+                expected_product,
+                ignore_order=True,
+                exclude_regex_paths=r".+\.model_fields_set",
+            )
+            == {}
+        )
+
+    @pytest.mark.vcr(
+        os.path.join(CASSETTES, "test_product", "TestProduct.test_product_list.yaml"),
+        allow_playback_repeats=True,
+    )
+    def test_list_products(self):
+        products = self.run("list_products")
+        expected_products = self.client.list_products()
+
+        assert isinstance(products, ProductsResponse)
+        assert (
+            deepdiff.DeepDiff(
+                products,
+                expected_products,
+                ignore_order=True,
+                exclude_regex_paths=r".+\.model_fields_set",
+            )
+            == {}
+        )
+
+    @pytest.mark.vcr(
+        os.path.join(CASSETTES, "test_price", "TestPrice.test_get_price.yaml"),
+        allow_playback_repeats=True,
+    )
+    def test_get_price_concurrently(self):
+        async def gather():
+            async with self.async_client_class(
+                authentication_method=HeaderAuthentication(
+                    token=os.getenv("PADDLE_SANDBOX_AUTH_TOKEN")
+                ),
+            ) as client:
+                return await asyncio.gather(
+                    *[
+                        client.get_price("pri_01h8xce4x86pq3byesf71a7kw1")
+                        for _ in range(5)
+                    ]
+                )
+
+        prices = asyncio.run(gather())
+
+        assert all(isinstance(price, PriceResponse) for price in prices)
+        assert all(price == prices[0] for price in prices)
@@ -0,0 +1,176 @@
+import json
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qs, urlencode, urlparse
+
+import requests
+
+from paddle_billing_client.backfill import (
+    EventSpool,
+    backfill_events,
+    get_event_cursor,
+    get_event_partitions,
+)
+from paddle_billing_client.models.event import EventQueryParams
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+URL = "https://sandbox-api.paddle.com/events"
+
+
+def test_event_cursors_sort_by_time():
+    cursor = get_event_cursor(datetime(2023, 8, 18, 10, 46, 18, 792000, timezone.utc))
+
+    assert cursor == "evt_01h8441jx80000000000000000"
+    assert get_event_cursor(START) < get_event_cursor(START + timedelta(milliseconds=1))
+
+
+def test_event_partitions_from_cursors():
+    assert get_event_partitions(cursors=["evt_2", "evt_1"]) == [
+        ("evt_1", "evt_2"),
+        ("evt_2", None),
+    ]
+
+
+def recorded_events(count):
+    times = [START + timedelta(minutes=37 * index) for index in range(count)]
+    return [
+        {
+            "event_id": get_event_cursor(time)[:-1] + "1",
+            "event_type": "product.created",
+            "occurred_at": time.isoformat(),
+            "data": {"id": "pro_1", "name": "Product", "tax_category": "standard"},
+        }
+        for time in times
+    ]
+
+
+def events_client(fake_client, events, afters):
+    lock = threading.Lock()
+
+    def send(request, **kwargs):
+        query = {
+            key: value[0]
+            for key, value in parse_qs(urlparse(request.url).query).items()
+        }
+        with lock:
+            afters.append(query["after"])
+        matching = [event for event in events if event["event_id"] > query["after"]]
+        page = matching[: int(query["per_page"])]
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(
+            {
+                "data": page,
+                "meta": {
+                    "request_id": "1",
+                    "pagination": {
+                        "per_page": int(query["per_page"]),
+                        "next": URL
+                        + "?"
+                        + urlencode({**query, "after": page[-1]["event_id"]}),
+                        "has_more": len(matching) > len(page),
+                        "estimated_total": len(matching),
+                    },
+                },
+            }
+        ).encode()
+        response.url = request.url
+        response.request = request
+        return response
+
+    client, adapter = fake_client([])
+    adapter.send = send
+    return client
+
+
+def test_backfill_events_merges_partitions_in_order(fake_client):
+    events, afters = recorded_events(20), []
+    client = events_client(fake_client, events, afters)
+    end = datetime.fromisoformat(events[-1]["occurred_at"]) + timedelta(seconds=1)
+
+    backfilled = list(
+        backfill_events(
+            client, START, end, partitions=4, query_params=EventQueryParams(per_page=3)
+        )
+    )
+
+    assert [event.event_id for event in backfilled] == [
+        event["event_id"] for event in events
+    ]
+    partitions = get_event_partitions(START, end, 4)
+    assert {after for after, _ in partitions} <= set(afters)
+
+
+def test_backfill_partitions_ahead_of_the_merge_keep_fetching(fake_client):
+    events, afters = recorded_events(20), []
+    client = events_client(fake_client, events, afters)
+    end = datetime.fromisoformat(events[-1]["occurred_at"]) + timedelta(seconds=1)
+    backfill = backfill_events(
+        client,
+        START,
+        end,
+        partitions=4,
+        query_params=EventQueryParams(per_page=1),
+        prefetch=1,
+    )
+
+    first = next(backfill)
+    # One page per event, and for the first 3 partitions one more page
+    # holding the first event of the next partition.
+    deadline = time.monotonic() + 5
+    while len(afters) < 20 + 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(afters) == 20 + 3
+
+    backfilled = [first, *backfill]
+    assert [event.event_id for event in backfilled] == [
+        event["event_id"] for event in events
+    ]
+
+
+def test_event_spool_waits_for_the_merge_when_full():
+    with tempfile.TemporaryFile() as file:
+        spool = EventSpool(1, file, max_spooled=1)
+        spool.put([1])
+        spool.put([2])
+        writer = threading.Thread(target=spool.put, args=([3],))
+        writer.start()
+        writer.join(0.1)
+        assert writer.is_alive()
+
+        assert spool.get() == [1]
+        assert spool.get() == [2]
+        writer.join(5)
+        assert not writer.is_alive()
+        assert spool.get() == [3]
+
+
+def test_closing_a_backfill_deletes_its_spools(fake_client, monkeypatch):
+    events, afters = recorded_events(20), []
+    client = events_client(fake_client, events, afters)
+    end = datetime.fromisoformat(events[-1]["occurred_at"]) + timedelta(seconds=1)
+    files, temporary_file = [], tempfile.TemporaryFile
+
+    def record_temporary_file():
+        files.append(temporary_file())
+        return files[-1]
+
+    monkeypatch.setattr(
+        "paddle_billing_client.backfill.tempfile.TemporaryFile", record_temporary_file
+    )
+    backfill = backfill_events(
+        client,
+        START,
+        end,
+        partitions=4,
+        query_params=EventQueryParams(per_page=1),
+        prefetch=1,
+        max_spooled=2,
+    )
+
+    next(backfill)
+    backfill.close()
+    assert len(files) == 4
+    assert all(file.closed for file in files)
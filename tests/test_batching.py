@@ -0,0 +1,204 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import requests
+from apiclient.authentication_methods import HeaderAuthentication
+
+from paddle_billing_client.async_client import AsyncPaddleApiClient
+from paddle_billing_client.batching import AsyncBatchLoader, BatchLoader, chunk_ids
+from paddle_billing_client.models.product import (
+    ProductQueryParams,
+    ProductsByIdsResponse,
+)
+
+
+def products_page(*ids):
+    return json.dumps(
+        {
+            "data": [
+                {"id": id, "name": "Product", "tax_category": "standard"} for id in ids
+            ],
+            "meta": {
+                "request_id": "1",
+                "pagination": {
+                    "per_page": len(ids),
+                    "next": "https://api.paddle.com/products?after=x",
+                    "has_more": False,
+                    "estimated_total": len(ids),
+                },
+            },
+        }
+    ).encode()
+
+
+def test_chunk_ids_deduplicates_and_keeps_order():
+    assert chunk_ids(["a", "b", "a", "c", "d"], 2) == [["a", "b"], ["c", "d"]]
+
+
+def test_concurrent_loads_are_resolved_with_one_list_call(fake_client):
+    client, adapter = fake_client([(200, {}, products_page("pro_1", "pro_2"))])
+    loader = BatchLoader(client, "product", window=0.05)
+
+    with ThreadPoolExecutor(3) as executor:
+        results = list(executor.map(loader.load, ["pro_1", "pro_2", "pro_3"]))
+
+    assert [product and product.id for product in results] == ["pro_1", "pro_2", None]
+    assert len(adapter.requests) == 1
+    query = parse_qs(urlparse(adapter.requests[0].url).query)
+    assert sorted(query["id"][0].split(",")) == ["pro_1", "pro_2", "pro_3"]
+    assert query["per_page"] == ["3"]
+
+
+def test_loads_are_chunked_to_the_page_size(fake_client):
+    ids = [f"txn_{index}" for index in range(31)]
+    client, adapter = fake_client(
+        [(200, {}, b'{"data":[],"meta":{"request_id":"1"}}')] * 2
+    )
+    loader = BatchLoader(client, "transaction")
+
+    assert loader.load_many(ids) == [None] * 31
+    assert sorted(
+        len(parse_qs(urlparse(request.url).query)["id"][0].split(","))
+        for request in adapter.requests
+    ) == [1, 30]
+
+
+def test_loaded_pages_are_fetched_concurrently(fake_client):
+    ids = [f"txn_{index}" for index in range(90)]
+    client, adapter = fake_client(
+        [(200, {}, b'{"data":[],"meta":{"request_id":"1"}}')] * 3
+    )
+    send, running, max_running = adapter.send, 0, 0
+    lock = threading.Lock()
+
+    def slow_send(request, **kwargs):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.1)
+        with lock:
+            running -= 1
+            return send(request, **kwargs)
+
+    adapter.send = slow_send
+    loader = BatchLoader(client, "transaction", max_workers=3)
+
+    assert loader.load_many(ids) == [None] * 90
+    assert len(adapter.requests) == 3
+    assert max_running == 3
+
+
+def test_async_loads_are_batched():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, content=products_page("pro_2", "pro_1"))
+
+    async def main():
+        async with AsyncPaddleApiClient(
+            authentication_method=HeaderAuthentication(token="token"),
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ) as client:
+            loader = AsyncBatchLoader(client, "product")
+            return await asyncio.gather(
+                loader.load("pro_1"), loader.load_many(["pro_2", "pro_3"])
+            )
+
+    product, products = asyncio.run(main())
+    assert product.id == "pro_1"
+    assert [product and product.id for product in products] == ["pro_2", None]
+    assert len(requests) == 1
+
+
+def test_async_loader_keeps_its_dispatch_until_it_finishes():
+    release = asyncio.Event()
+
+    async def handler(request):
+        await release.wait()
+        return httpx.Response(200, content=products_page("pro_1"))
+
+    async def main():
+        async with AsyncPaddleApiClient(
+            authentication_method=HeaderAuthentication(token="token"),
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ) as client:
+            loader = AsyncBatchLoader(client, "product", window=0)
+            load = asyncio.ensure_future(loader.load("pro_1"))
+            await asyncio.sleep(0.01)
+            dispatches = set(loader._tasks)
+            release.set()
+            product = await load
+            await asyncio.sleep(0)
+            return dispatches, loader._tasks, product
+
+    dispatches, tasks, product = asyncio.run(main())
+    assert len(dispatches) == 1
+    assert tasks == set()
+    assert product.id == "pro_1"
+
+
+def test_get_by_ids_finds_archived_entities(fake_client):
+    client, adapter = fake_client([])
+    statuses = {"pro_1": "active", "pro_2": "archived"}
+
+    def send(request, **kwargs):
+        adapter.requests.append(request)
+        query = parse_qs(urlparse(request.url).query)
+        allowed = query.get("status", ["active"])[0].split(",")
+        ids = [id for id in query["id"][0].split(",") if statuses[id] in allowed]
+        response = requests.Response()
+        response.status_code = 200
+        response._content = products_page(*ids)
+        response.url = request.url
+        response.request = request
+        return response
+
+    adapter.send = send
+
+    response = client.get_products_by_ids(["pro_1", "pro_2"])
+    filtered = client.get_products_by_ids(
+        ["pro_1", "pro_2"], query_params=ProductQueryParams(status="active")
+    )
+
+    assert list(response.data) == ["pro_1", "pro_2"]
+    assert response.missing == []
+    assert filtered.missing == ["pro_2"]
+
+
+def test_get_by_ids_returns_found_and_missing_ids(fake_client):
+    ids = [f"pro_{index}" for index in range(250)]
+    client, adapter = fake_client(
+        [(200, {}, products_page(*ids[:200])), (200, {}, products_page(*ids[200:249]))]
+    )
+
+    response = client.get_products_by_ids(ids + ["pro_0"], max_workers=1)
+
+    assert isinstance(response, ProductsByIdsResponse)
+    assert list(response.data) == ids[:249]
+    assert response.data["pro_3"].id == "pro_3"
+    assert response.missing == ["pro_249"]
+    assert len(adapter.requests) == 2
+
+
+def test_async_get_by_ids():
+    def handler(request):
+        ids = parse_qs(request.url.query.decode())["id"][0].split(",")
+        return httpx.Response(200, content=products_page(*ids[:-1]))
+
+    async def main():
+        async with AsyncPaddleApiClient(
+            authentication_method=HeaderAuthentication(token="token"),
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ) as client:
+            return await client.get_products_by_ids(["pro_1", "pro_2", "pro_3"])
+
+    response = asyncio.run(main())
+    assert list(response.data) == ["pro_1", "pro_2"]
+    assert response.missing == ["pro_3"]
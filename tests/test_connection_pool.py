@@ -0,0 +1,58 @@
+import pytest
+import requests
+from apiclient.authentication_methods import HeaderAuthentication
+
+from paddle_billing_client.client import PaddleApiClient
+from paddle_billing_client.connection_pool import (
+    ConnectionPoolConfig,
+    PooledHTTPAdapter,
+)
+
+
+def test_connection_pool_is_mounted():
+    client = PaddleApiClient(
+        authentication_method=HeaderAuthentication(token="token"),
+        connection_pool=ConnectionPoolConfig(max_connections=32, block=True),
+    )
+    adapter = client.get_session().get_adapter("https://sandbox-api.paddle.com")
+
+    assert isinstance(adapter, PooledHTTPAdapter)
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 32
+    assert adapter.poolmanager.connection_pool_kw["block"] is True
+
+
+def test_connection_pool_default_session_untouched():
+    client = PaddleApiClient(authentication_method=HeaderAuthentication(token="token"))
+    adapter = client.get_session().get_adapter("https://sandbox-api.paddle.com")
+
+    assert not isinstance(adapter, PooledHTTPAdapter)
+
+
+def test_connection_pool_drops_idle_connections():
+    adapter = PooledHTTPAdapter(ConnectionPoolConfig(keepalive_expiry=5))
+    closed = []
+
+    def get_pool(host):
+        request = requests.Request("GET", f"https://{host}/products").prepare()
+        return adapter.get_connection_with_tls_context(request, verify=True)
+
+    for host in ("sandbox-api.paddle.com", "api.paddle.com"):
+        pool = get_pool(host)
+        conn = pool._get_conn()
+        conn.close = lambda host=host: closed.append(host)
+        pool._put_conn(conn)
+
+    get_pool("sandbox-api.paddle.com")
+    assert closed == []
+
+    adapter._last_used[get_pool("sandbox-api.paddle.com")] -= 10
+    sandbox_pool = get_pool("sandbox-api.paddle.com")
+    get_pool("api.paddle.com")
+    assert closed == ["sandbox-api.paddle.com"]
+    assert len(adapter.poolmanager.pools) == 2
+    assert sandbox_pool.pool.qsize() == adapter.pool_config.max_connections
+
+
+def test_connection_pool_config_forbids_unknown_options():
+    with pytest.raises(ValueError):
+        ConnectionPoolConfig(max_conections=10)
@@ -0,0 +1,157 @@
+import asyncio
+import copy
+import pickle
+import sys
+import threading
+from datetime import datetime
+
+import httpx
+import pytest
+from conftest import cassette_body
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import from_json
+
+from paddle_billing_client.async_client import AsyncPaddleApiClient
+from paddle_billing_client.construct import construct_model
+from paddle_billing_client.models.base import LAZY_FIELDS
+from paddle_billing_client.models.event import EventsResponse
+from paddle_billing_client.models.subscription import Subscription
+from paddle_billing_client.models.transaction import Transaction, TransactionsResponse
+from paddle_billing_client.options import request_options
+
+TRANSACTIONS = cassette_body(
+    "test_transaction/TestTransaction.test_list_transactions.yaml"
+)
+EVENTS = cassette_body("test_events/TestEvents.test_list_events.yaml")
+
+
+@pytest.mark.parametrize(
+    "method, body", [("list_transactions", TRANSACTIONS), ("list_events", EVENTS)]
+)
+def test_constructed_responses_match_validated_ones(fake_client, method, body):
+    client, _ = fake_client([(200, {}, body)])
+    expected = getattr(client, method)()
+    client, _ = fake_client([(200, {}, body)], validate=False)
+
+    response = getattr(client, method)()
+
+    assert type(response) is type(expected)
+    assert [type(item) for item in response.data] == [
+        type(item) for item in expected.data
+    ]
+    assert response.model_dump_json() == expected.model_dump_json()
+    assert response == expected
+
+
+def test_constructed_fields_are_converted_on_first_access(fake_client):
+    client, _ = fake_client([(200, {}, TRANSACTIONS)], validate=False)
+
+    transaction = client.list_transactions().data[0]
+
+    assert "created_at" in transaction.__dict__[LAZY_FIELDS]
+    assert isinstance(transaction.created_at, datetime)
+    assert transaction.__dict__["created_at"] == transaction.created_at
+    assert "created_at" not in transaction.__dict__[LAZY_FIELDS]
+
+
+def test_constructed_models_serialize_as_validated_ones(fake_client):
+    client, _ = fake_client([(200, {}, TRANSACTIONS)] * 2)
+    expected = client.list_transactions().data[0]
+    with request_options(validate=False):
+        transaction = client.list_transactions().data[0]
+    adapter = TypeAdapter(Transaction)
+
+    assert dict(transaction) == dict(expected)
+    assert adapter.dump_json(transaction.model_materialize()) == adapter.dump_json(
+        expected
+    )
+
+
+def test_materialized_models_hold_no_pending_fields(fake_client):
+    client, _ = fake_client([(200, {}, TRANSACTIONS)], validate=False)
+    response = client.list_transactions()
+
+    response.model_dump()
+
+    for model in (response, response.data[0], response.data[0].details):
+        assert LAZY_FIELDS not in model.__dict__
+
+
+def test_constructed_models_copy_and_pickle_as_validated_ones(fake_client):
+    client, _ = fake_client([(200, {}, EVENTS), (200, {}, EVENTS)])
+    expected = client.list_events()
+
+    with request_options(validate=False):
+        events = client.list_events()
+
+    assert copy.copy(events) == expected
+    assert copy.deepcopy(events) == expected
+    assert pickle.loads(pickle.dumps(events)) == expected
+    assert isinstance(events.data[-1].data, type(expected.data[-1].data))
+
+
+def test_constructed_fields_can_be_read_from_several_threads():
+    interval = sys.getswitchinterval()
+    errors = []
+
+    def read(transaction, barrier):
+        barrier.wait()
+        try:
+            transaction.details, transaction.created_at, transaction.model_dump()
+        except AttributeError as error:
+            errors.append(error)
+
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(50):
+            transaction = construct_model(
+                TransactionsResponse, from_json(TRANSACTIONS)
+            ).data[0]
+            barrier = threading.Barrier(4)
+            threads = [
+                threading.Thread(target=read, args=(transaction, barrier))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert errors == []
+
+
+def test_validation_can_be_turned_off_per_call(fake_client):
+    body = b'{"data":[{"id":"txn_1","status":"billed"}],"meta":{"request_id":"1"}}'
+    client, _ = fake_client([(200, {}, body), (200, {}, body)])
+
+    with pytest.raises(ValidationError):
+        client.list_transactions()
+    with request_options(validate=False):
+        response = client.list_transactions()
+
+    assert isinstance(response, TransactionsResponse)
+    assert response.data[0].id == "txn_1"
+
+
+def test_async_client_constructs_responses():
+    body = cassette_body(
+        "test_subscription/TestSubscription.test_list_subscriptions.yaml"
+    )
+
+    async def main():
+        async with AsyncPaddleApiClient(
+            validate=False,
+            http_client=httpx.AsyncClient(
+                transport=httpx.MockTransport(
+                    lambda _: httpx.Response(200, content=body)
+                )
+            ),
+        ) as client:
+            return await client.list_subscriptions()
+
+    subscription = asyncio.run(main()).data[0]
+
+    assert isinstance(subscription, Subscription)
+    assert isinstance(subscription.started_at, datetime)
@@ -0,0 +1,81 @@
+import json
+import threading
+
+from paddle_billing_client.checkpoints import FileCheckpointStore
+from paddle_billing_client.events import follow_events
+
+
+def events_page(*ids, has_more=False):
+    return json.dumps(
+        {
+            "data": [
+                {
+                    "event_id": id,
+                    "event_type": "product.created",
+                    "occurred_at": "2024-01-01T00:00:00Z",
+                    "data": {
+                        "id": "pro_1",
+                        "name": "Product",
+                        "tax_category": "standard",
+                    },
+                }
+                for id in ids
+            ],
+            "meta": {
+                "request_id": "1",
+                "pagination": {
+                    "per_page": 200,
+                    "next": "https://sandbox-api.paddle.com/events",
+                    "has_more": has_more,
+                    "estimated_total": len(ids),
+                },
+            },
+        }
+    ).encode()
+
+
+def test_follow_events_polls_with_backoff_and_resumes(
+    fake_client, tmp_path, monkeypatch
+):
+    store = FileCheckpointStore(str(tmp_path))
+    client, adapter = fake_client(
+        [
+            (200, {}, events_page("evt_1", "evt_2", has_more=True)),
+            (200, {}, events_page("evt_3")),
+            (200, {}, events_page()),
+            (200, {}, events_page()),
+            (200, {}, events_page("evt_4")),
+        ]
+    )
+    stop = threading.Event()
+    waits = []
+    monkeypatch.setattr(stop, "wait", waits.append)
+
+    events = follow_events(
+        client, store, poll_interval=1, max_poll_interval=3, stop=stop
+    )
+    assert [next(events).event_id for _ in range(4)] == [
+        "evt_1",
+        "evt_2",
+        "evt_3",
+        "evt_4",
+    ]
+    events.close()
+
+    assert waits == [1, 1, 2]
+    queries = [request.url.partition("?")[2] for request in adapter.requests]
+    assert queries[0] == "per_page=200"
+    assert (
+        queries[1:] == ["after=evt_2&per_page=200"] + ["after=evt_3&per_page=200"] * 3
+    )
+    # evt_4 was not processed yet when the iterator was closed
+    checkpoint = store.load("events")
+    assert (checkpoint.last_id, checkpoint.items) == ("evt_3", 3)
+
+    client, adapter = fake_client([(200, {}, events_page("evt_4"))])
+    stop.wait = lambda delay: stop.set()
+    assert [event.event_id for event in follow_events(client, store, stop=stop)] == [
+        "evt_4"
+    ]
+    assert adapter.requests[0].url.endswith("after=evt_3&per_page=200")
+    assert store.load("events").last_id == "evt_4"
@@ -0,0 +1,93 @@
+import pytest
+from apiclient.exceptions import ClientError, ServerError
+
+from paddle_billing_client.idempotency import IdempotencyKeyStore
+from paddle_billing_client.models.product import ProductRequest
+from paddle_billing_client.options import request_options
+from paddle_billing_client.retrying import RetryPolicy
+
+PRODUCT = (
+    b'{"data":{"id":"pro_1","name":"Product","tax_category":"standard"},'
+    b'"meta":{"request_id":"1"}}'
+)
+PRODUCT_REQUEST = ProductRequest(name="Product", tax_category="standard")
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(
+        "paddle_billing_client.request_strategies.time.sleep", lambda delay: None
+    )
+
+
+def test_idempotency_key_store():
+    store = IdempotencyKeyStore()
+    fingerprint = store.get_fingerprint("POST", "products", {"name": "Product"})
+
+    key = store.acquire(fingerprint)
+    assert store.acquire(fingerprint) == key
+    assert store.in_flight() == {fingerprint: key}
+
+    store.release(fingerprint)
+    assert store.acquire(fingerprint) != key
+
+
+def test_idempotency_key_reused_by_retries(fake_client):
+    client, adapter = fake_client(
+        [(503, {}, b""), (200, {}, PRODUCT)],
+        idempotency_keys=IdempotencyKeyStore(),
+        retry_policy=RetryPolicy(),
+    )
+
+    client.create_product(PRODUCT_REQUEST)
+
+    keys = [request.headers["Idempotency-Key"] for request in adapter.requests]
+    assert len(keys) == 2
+    assert keys[0] == keys[1]
+    assert client.idempotency_keys.in_flight() == {}
+
+
+def test_idempotency_key_kept_while_outcome_unknown(fake_client):
+    client, adapter = fake_client(
+        [(504, {}, b""), (200, {}, PRODUCT)],
+        idempotency_keys=IdempotencyKeyStore(),
+    )
+
+    with pytest.raises(ServerError):
+        client.create_product(PRODUCT_REQUEST)
+    assert len(client.idempotency_keys.in_flight()) == 1
+
+    client.create_product(PRODUCT_REQUEST)
+
+    keys = [request.headers["Idempotency-Key"] for request in adapter.requests]
+    assert keys[0] == keys[1]
+    assert client.idempotency_keys.in_flight() == {}
+
+
+def test_idempotency_key_released_on_client_error(fake_client):
+    client, adapter = fake_client(
+        [(400, {}, b"")], idempotency_keys=IdempotencyKeyStore()
+    )
+
+    with pytest.raises(ClientError):
+        client.create_product(PRODUCT_REQUEST)
+    assert client.idempotency_keys.in_flight() == {}
+
+
+def test_idempotency_key_not_sent_for_reads(fake_client):
+    client, adapter = fake_client(
+        [(200, {}, PRODUCT)], idempotency_keys=IdempotencyKeyStore()
+    )
+
+    client.get_product("pro_1")
+
+    assert "Idempotency-Key" not in adapter.requests[0].headers
+
+
+def test_explicit_idempotency_key(fake_client):
+    client, adapter = fake_client([(200, {}, PRODUCT)])
+
+    with request_options(idempotency_key="my-key"):
+        client.create_product(PRODUCT_REQUEST)
+
+    assert adapter.requests[0].headers["Idempotency-Key"] == "my-key"
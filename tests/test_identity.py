@@ -0,0 +1,110 @@
+import json
+import pickle
+
+import pytest
+from conftest import cassette_body
+from pydantic import ValidationError
+
+from paddle_billing_client.identity import IdentityMap, identity_map
+from paddle_billing_client.models.customer import Customer
+from paddle_billing_client.options import request_options
+
+
+def transactions_page(count, updated_at=None):
+    """Return a page of transactions of the same customer"""
+    body = json.loads(
+        cassette_body("test_transaction/TestTransaction.test_list_transactions.yaml")
+    )
+    transaction = body["data"][0]
+    if updated_at is not None:
+        transaction["customer"]["updated_at"] = updated_at
+    body["data"] = [dict(transaction, id=f"txn_{index}") for index in range(count)]
+    return json.dumps(body).encode()
+
+
+PAGE = transactions_page(3, updated_at="2024-01-01T00:00:00Z")
+
+
+def test_embedded_entities_are_shared(fake_client):
+    identity = IdentityMap()
+    client, _ = fake_client([(200, {}, PAGE)] * 2, identity_map=identity)
+
+    first = client.list_transactions().data
+    second = client.list_transactions().data
+
+    customers = [transaction.customer for transaction in first + second]
+    assert all(customer is customers[0] for customer in customers)
+    assert isinstance(customers[0], Customer)
+    assert len(identity) == 1
+
+
+def test_entities_are_not_shared_by_default(fake_client):
+    client, _ = fake_client([(200, {}, PAGE)])
+
+    transactions = client.list_transactions().data
+
+    assert transactions[0].customer is not transactions[1].customer
+    transactions[0].customer.name = "Name"
+
+
+def test_updated_entities_are_not_shared(fake_client):
+    body = transactions_page(1, updated_at="2024-02-01T00:00:00Z")
+    client, _ = fake_client([(200, {}, PAGE), (200, {}, body)])
+
+    with identity_map():
+        customer = client.list_transactions().data[0].customer
+        updated = client.list_transactions().data[0].customer
+
+    assert updated is not customer
+    assert updated.updated_at.month == 2
+
+
+def test_entities_without_version_are_shared_when_equal(fake_client):
+    client, _ = fake_client([(200, {}, transactions_page(2))])
+
+    with identity_map():
+        transactions = client.list_transactions().data
+
+    assert transactions[0].customer is transactions[1].customer
+
+
+def test_shared_entities_are_read_only(fake_client):
+    client, _ = fake_client([(200, {}, PAGE)])
+
+    with identity_map():
+        customer = client.list_transactions().data[0].customer
+
+    with pytest.raises(ValidationError):
+        customer.name = "Name"
+    copy = customer.model_copy(update={"name": "Name"})
+    copy.locale = "fr"
+    assert (copy.name, customer.name) == ("Name", "")
+    assert isinstance(customer, Customer) and type(copy) is Customer
+    unpickled = pickle.loads(pickle.dumps(customer))
+    assert type(unpickled) is Customer and unpickled == customer
+
+
+@pytest.mark.parametrize("options", [{}, {"lazy": True}, {"validate": False}])
+def test_parsed_responses_are_unchanged(fake_client, options):
+    client, _ = fake_client([(200, {}, PAGE)] * 2)
+    expected = client.list_transactions()
+    client, _ = fake_client([(200, {}, PAGE)], identity_map=IdentityMap(), **options)
+
+    response = client.list_transactions()
+
+    transactions = response.data
+    assert transactions[0].customer is transactions[2].customer
+    assert response.model_dump_json() == expected.model_dump_json()
+
+
+def test_constructed_entities_are_shared_in_full(fake_client):
+    client, _ = fake_client([(200, {}, PAGE)])
+    expected = client.list_transactions()
+    client, _ = fake_client([(200, {}, PAGE)] * 2, identity_map=IdentityMap())
+
+    with request_options(validate=False):
+        customer = client.list_transactions().data[0].customer
+    response = client.list_transactions()
+
+    assert response.data[0].customer is customer
+    assert response.model_dump_json() == expected.model_dump_json()
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+from conftest import cassette_body
+from pydantic_core import from_json
+
+from paddle_billing_client.construct import construct_model
+from paddle_billing_client.lazy import validate_lazy
+from paddle_billing_client.models.event import EventsResponse
+from paddle_billing_client.models.transaction import TransactionsResponse
+
+
+def transactions_page(count):
+    body = json.loads(
+        cassette_body("test_transaction/TestTransaction.test_list_transactions.yaml")
+    )
+    body["data"] = [dict(body["data"][0], id=f"txn_{index}") for index in range(count)]
+    return json.dumps(body).encode()
+
+
+PAGE = transactions_page(3)
+
+PARSERS = {
+    "validate": lambda model, body: model.model_validate(json.loads(body)),
+    "validate_json": lambda model, body: model.model_validate_json(body),
+    "lazy": lambda model, body: validate_lazy(model, from_json(body)),
+    "construct": lambda model, body: construct_model(model, from_json(body)),
+}
+
+
+@pytest.mark.parametrize("parse", PARSERS.values(), ids=PARSERS)
+def test_enum_like_values_are_shared(parse):
+    first, second, third = parse(TransactionsResponse, PAGE).data
+
+    for transaction in (second, third):
+        assert transaction.currency_code is first.currency_code
+        assert transaction.origin is first.origin
+        assert transaction.status is first.status
+        assert (
+            transaction.details.totals.currency_code
+            is first.details.totals.currency_code
+        )
+    assert first.details.totals.currency_code is first.currency_code
+
+
+def test_event_types_are_shared():
+    body = json.loads(cassette_body("test_events/TestEvents.test_list_events.yaml"))
+    body["data"] = [body["data"][0]] * 2
+    data = json.loads(json.dumps(body))
+
+    first, second = EventsResponse.model_validate(data).data
+
+    assert first.event_type == body["data"][0]["event_type"]
+    assert second.event_type is first.event_type
+
+
+def test_construct_keeps_unexpected_values():
+    body = json.loads(PAGE)
+    body["data"][0]["currency_code"] = 12
+
+    response = construct_model(TransactionsResponse, body)
+
+    assert response.data[0].currency_code == 12
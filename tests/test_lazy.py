@@ -0,0 +1,67 @@
+import json
+
+import pytest
+from conftest import cassette_body
+from pydantic import ValidationError
+
+from paddle_billing_client.models.base import LAZY_FIELDS
+from paddle_billing_client.models.subscription import Subscription
+from paddle_billing_client.models.transaction import TransactionDetails
+from paddle_billing_client.options import request_options
+
+TRANSACTIONS = cassette_body(
+    "test_transaction/TestTransaction.test_list_transactions.yaml"
+)
+EVENTS = cassette_body("test_events/TestEvents.test_list_events.yaml")
+
+
+@pytest.mark.parametrize(
+    "method, body", [("list_transactions", TRANSACTIONS), ("list_events", EVENTS)]
+)
+def test_lazy_responses_match_validated_ones(fake_client, method, body):
+    client, _ = fake_client([(200, {}, body)])
+    expected = getattr(client, method)()
+    client, _ = fake_client([(200, {}, body)], lazy=True)
+
+    response = getattr(client, method)()
+
+    assert type(response) is type(expected)
+    assert response.model_dump_json() == expected.model_dump_json()
+    assert response == expected
+
+
+def test_nested_fields_are_validated_on_first_access(fake_client):
+    client, _ = fake_client([(200, {}, TRANSACTIONS)], lazy=True)
+
+    transaction = client.list_transactions().data[0]
+
+    assert transaction.id.startswith("txn_")
+    assert {"details", "customer"} <= transaction.__dict__[LAZY_FIELDS].keys()
+    assert isinstance(transaction.details, TransactionDetails)
+    assert "details" not in transaction.__dict__[LAZY_FIELDS]
+    assert transaction.details is transaction.details
+
+
+def test_invalid_nested_fields_raise_when_read(fake_client):
+    body = json.loads(TRANSACTIONS)
+    body["data"][0]["details"]["totals"] = "invalid"
+    client, _ = fake_client([(200, {}, json.dumps(body).encode())] * 2)
+
+    with pytest.raises(ValidationError):
+        client.list_transactions()
+    with request_options(lazy=True):
+        transaction = client.list_transactions().data[0]
+
+    assert transaction.status
+    with pytest.raises(ValidationError):
+        transaction.details
+
+
+def test_event_data_is_validated_into_the_event_type_model(fake_client):
+    client, _ = fake_client([(200, {}, EVENTS)], lazy=True)
+
+    events = client.list_events().data
+    event = next(event for event in events if event.event_type.startswith("sub"))
+
+    assert "data" in event.__dict__[LAZY_FIELDS]
+    assert isinstance(event.data, Subscription)
@@ -0,0 +1,92 @@
+import pickle
+
+import pytest
+from conftest import cassette_body
+
+from paddle_billing_client.models.price import UnitPrice
+from paddle_billing_client.models.transaction import (
+    LineItemTotals,
+    Totals,
+    TransactionsResponse,
+)
+from paddle_billing_client.money import (
+    CompactTotals,
+    CompactUnitPrice,
+    compact_money,
+)
+
+TRANSACTIONS = TransactionsResponse.model_validate_json(
+    cassette_body("test_transaction/TestTransaction.test_list_transactions.yaml")
+)
+
+
+def money_models():
+    for transaction in TRANSACTIONS.data:
+        details = transaction.details
+        yield details.totals
+        for line_item in details.line_items:
+            yield line_item.totals
+            yield line_item.unit_totals
+        for tax_rate in details.tax_rates_used:
+            yield tax_rate.totals
+
+
+@pytest.mark.parametrize("model", list(money_models()), ids=lambda m: type(m).__name__)
+def test_compact_copies_restore_the_model(model):
+    compact = compact_money(model)
+
+    restored = compact.to_model()
+    assert type(restored) is type(model)
+    assert restored == model
+    assert restored.model_dump_json(exclude_unset=True) == model.model_dump_json(
+        exclude_unset=True
+    )
+    assert pickle.loads(pickle.dumps(compact)) == compact
+
+
+def test_amounts_are_integers_of_minor_units():
+    totals = Totals.model_validate(
+        {
+            "subtotal": "1000",
+            "discount": "0",
+            "tax": "200",
+            "total": "1200",
+            "credit": "0",
+            "balance": "-1200",
+            "grand_total": "1200",
+            "fee": None,
+            "currency_code": "USD",
+        }
+    )
+
+    compact = CompactTotals.from_model(totals)
+
+    assert (compact.total, compact.balance) == (1200, -1200)
+    assert compact.fee is None and compact.earnings is None
+    assert compact.currency_code == "USD"
+    assert compact.currency_code is compact_money(totals).currency_code
+    restored = compact.to_model()
+    assert restored.model_fields_set == totals.model_fields_set
+    assert restored == totals
+
+
+def test_extra_fields_are_kept():
+    price = UnitPrice(amount="500", currency_code="EUR", formatted="5.00 €")
+
+    compact = CompactUnitPrice.from_model(price)
+
+    assert compact.amount == 500
+    assert compact.to_model().model_dump() == price.model_dump()
+
+
+@pytest.mark.parametrize("amount", ["1.5", "0100", "-0", "", "9" * 20])
+def test_amounts_that_cannot_be_restored_raise(amount):
+    totals = LineItemTotals(subtotal=amount, discount="0", tax="0", total="0")
+
+    with pytest.raises(ValueError):
+        compact_money(totals)
+
+
+def test_models_without_compact_copy_raise():
+    with pytest.raises(TypeError):
+        compact_money(TRANSACTIONS)
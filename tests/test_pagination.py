@@ -0,0 +1,311 @@
+import asyncio
+import json
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+from apiclient.authentication_methods import HeaderAuthentication
+from apiclient.exceptions import ServerError
+from conftest import cassette_body
+
+from paddle_billing_client.async_client import AsyncPaddleApiClient
+from paddle_billing_client.checkpoints import (
+    Checkpoint,
+    CheckpointStore,
+    FileCheckpointStore,
+    SQLiteCheckpointStore,
+)
+from paddle_billing_client.models.common import Paginate
+from paddle_billing_client.models.product import ProductQueryParams
+from paddle_billing_client.pagination import (
+    AdaptivePageSize,
+    async_paginate,
+    async_process,
+    paginate,
+    prefetch_paginate,
+    resumable_paginate,
+)
+
+EVENTS = cassette_body("test_events/TestEvents.test_list_events.yaml")
+
+
+def products_page(page, has_more=True):
+    return json.dumps(
+        {
+            "data": [
+                {"id": f"pro_{page}", "name": "Product", "tax_category": "standard"}
+            ],
+            "meta": {
+                "request_id": str(page),
+                "pagination": {
+                    "per_page": 1,
+                    "next": f"https://sandbox-api.paddle.com/products?after=pro_{page}",
+                    "has_more": has_more,
+                    "estimated_total": 3,
+                },
+            },
+        }
+    ).encode()
+
+
+def test_prefetch_paginate_yields_pages_in_order(fake_client):
+    client, adapter = fake_client(
+        [(200, {}, products_page(1)), (200, {}, products_page(2))]
+        + [(200, {}, products_page(3, has_more=False))]
+    )
+
+    pages = list(prefetch_paginate(client.list_products))
+
+    assert [page.data[0].id for page in pages] == ["pro_1", "pro_2", "pro_3"]
+    assert adapter.requests[2].url.endswith("after=pro_2")
+
+
+def test_prefetch_paginate_fetches_ahead_of_the_consumer(fake_client):
+    client, adapter = fake_client(
+        [(200, {}, products_page(1)), (200, {}, products_page(2))]
+        + [(200, {}, products_page(3, has_more=False))]
+    )
+    fetched = threading.Event()
+    send = adapter.send
+
+    def send_and_notify(request, **kwargs):
+        response = send(request, **kwargs)
+        if len(adapter.requests) == 3:
+            fetched.set()
+        return response
+
+    adapter.send = send_and_notify
+    pages = prefetch_paginate(client.list_products, prefetch=2)
+    next(pages)
+
+    assert fetched.wait(1)
+    assert len(list(pages)) == 2
+
+
+def test_prefetch_paginate_raises_errors_after_the_fetched_pages(fake_client):
+    client, _ = fake_client([(200, {}, products_page(1)), (500, {}, b"{}")])
+    pages = prefetch_paginate(client.list_products)
+
+    assert next(pages).data[0].id == "pro_1"
+    with pytest.raises(ServerError):
+        next(pages)
+
+
+def test_closing_prefetch_paginate_stops_fetching(fake_client):
+    client, adapter = fake_client(
+        [(200, {}, products_page(page)) for page in range(10)]
+    )
+    pages = prefetch_paginate(client.list_products, prefetch=1)
+    next(pages)
+    pages.close()
+    time.sleep(0.3)
+
+    assert len(adapter.requests) <= 3
+
+
+def test_iter_products_streams_items_across_pages(fake_client):
+    client, adapter = fake_client(
+        [(200, {}, products_page(1)), (200, {}, products_page(2, has_more=False))]
+    )
+
+    products = client.iter_products(ProductQueryParams(status="active"))
+
+    assert not adapter.requests
+    assert [product.id for product in products] == ["pro_1", "pro_2"]
+    assert "status=active" in adapter.requests[0].url
+    assert adapter.requests[1].url.endswith("after=pro_1")
+
+
+def test_iter_addresses_for_customer_follows_pages(fake_client):
+    def addresses_page(page, has_more):
+        return json.dumps(
+            {
+                "data": [{"id": f"add_{page}", "country_code": "US"}],
+                "meta": {
+                    "request_id": "1",
+                    "pagination": {
+                        "per_page": 1,
+                        "next": "https://sandbox-api.paddle.com/customers/ctm_1"
+                        f"/addresses?after=add_{page}",
+                        "has_more": has_more,
+                        "estimated_total": 2,
+                    },
+                },
+            }
+        ).encode()
+
+    client, adapter = fake_client(
+        [(200, {}, addresses_page(1, True)), (200, {}, addresses_page(2, False))]
+    )
+
+    addresses = list(client.iter_addresses_for_customer("ctm_1"))
+
+    assert [address.id for address in addresses] == ["add_1", "add_2"]
+    assert "/customers/ctm_1/addresses" in adapter.requests[0].url
+
+
+def test_list_events_takes_paginate_first(fake_client):
+    client, adapter = fake_client([(200, {}, EVENTS)])
+    next_url = "https://sandbox-api.paddle.com/events?after=evt_1"
+
+    client.list_events(Paginate(next=next_url))
+
+    assert adapter.requests[0].url == next_url
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def checkpoint_store(request, tmp_path):
+    if request.param == "file":
+        return FileCheckpointStore(str(tmp_path / "checkpoints"))
+    return SQLiteCheckpointStore(str(tmp_path / "checkpoints.db"))
+
+
+def test_checkpoint_store_roundtrip(checkpoint_store):
+    checkpoint = Checkpoint(next="https://sandbox-api.paddle.com/x", pages=2, items=9)
+
+    assert checkpoint_store.load("export") is None
+    checkpoint_store.save("export", checkpoint)
+    assert checkpoint_store.load("export") == checkpoint
+    checkpoint_store.delete("export")
+    assert checkpoint_store.load("export") is None
+
+
+def test_checkpoint_stores_implement_every_method():
+    class PartialStore(CheckpointStore):
+        def load(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        PartialStore()
+
+
+def test_resumable_paginate_resumes_from_the_last_processed_page(
+    fake_client, checkpoint_store
+):
+    client, adapter = fake_client(
+        [(200, {}, products_page(1)), (200, {}, products_page(2))]
+        + [(200, {}, products_page(2)), (200, {}, products_page(3, has_more=False))]
+    )
+
+    pages = resumable_paginate(client.list_products, checkpoint_store, "export")
+    next(pages)
+    next(pages)
+    # The walk dies while processing the second page
+    pages.close()
+    assert checkpoint_store.load("export") == Checkpoint(
+        next="https://sandbox-api.paddle.com/products?after=pro_1", pages=1, items=1
+    )
+
+    pages = list(resumable_paginate(client.list_products, checkpoint_store, "export"))
+    assert [page.data[0].id for page in pages] == ["pro_2", "pro_3"]
+    assert adapter.requests[2].url.endswith("after=pro_1")
+    assert checkpoint_store.load("export") == Checkpoint(
+        pages=3, items=3, completed=True
+    )
+    assert not list(
+        resumable_paginate(client.list_products, checkpoint_store, "export")
+    )
+
+
+def async_products_client(pages, requests):
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, content=pages[len(requests) - 1])
+
+    return AsyncPaddleApiClient(
+        authentication_method=HeaderAuthentication(token="token"),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+def test_async_iter_products_streams_items_in_order():
+    requests = []
+    pages = [products_page(1), products_page(2), products_page(3, has_more=False)]
+
+    async def main():
+        async with async_products_client(pages, requests) as client:
+            return [product.id async for product in client.iter_products()]
+
+    assert asyncio.run(main()) == ["pro_1", "pro_2", "pro_3"]
+    assert requests[2].url.params["after"] == "pro_2"
+
+
+def test_async_paginate_prefetch_is_bounded_by_the_consumer():
+    requests = []
+    pages = [products_page(page) for page in range(1, 10)]
+
+    async def main():
+        async with async_products_client(pages, requests) as client:
+            async for _ in async_paginate(client.list_products, prefetch=2):
+                await asyncio.sleep(0.05)
+                # The consumed page, the two buffered pages and the one waiting for room
+                assert len(requests) <= 4
+                break
+
+    asyncio.run(main())
+
+
+def test_async_process_keeps_order_with_bounded_concurrency():
+    running, max_running = 0, 0
+
+    async def items():
+        for item in range(10):
+            yield item
+
+    async def process(item):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01 * (10 - item))
+        running -= 1
+        return item * 2
+
+    async def main():
+        return [result async for result in async_process(items(), process, 3)]
+
+    assert asyncio.run(main()) == [item * 2 for item in range(10)]
+    assert max_running == 3
+
+
+def test_adaptive_page_size_starts_at_the_maximum_and_backs_off(fake_client):
+    client, adapter = fake_client(
+        [(200, {}, products_page(1)), (200, {}, products_page(2))]
+        + [(200, {}, products_page(3, has_more=False))]
+    )
+    page_size = AdaptivePageSize(minimum=1, max_bytes=len(products_page(1)) / 2)
+
+    list(paginate(client.list_products, page_size=page_size))
+
+    per_page = [
+        parse_qs(urlparse(request.url).query)["per_page"][0]
+        for request in adapter.requests
+    ]
+    assert per_page == ["200", "100", "50"]
+
+
+def test_adaptive_page_size_grows_back_on_fast_small_pages():
+    page_size = AdaptivePageSize(maximum=100, minimum=10)
+    assert page_size.start(None) == 100
+
+    assert page_size.update(latency=8.0, size=1000) == 25
+    assert page_size.update(latency=0.1, size=1000) == 38
+    assert page_size.update(latency=1.5, size=1000) == 38
+    assert page_size.update(latency=0.1, size=None) == 58
+
+
+def test_adaptive_page_size_ignores_the_time_spent_on_pages(fake_client):
+    client, adapter = fake_client(
+        [(200, {}, products_page(1)), (200, {}, products_page(2, has_more=False))]
+    )
+    page_size = AdaptivePageSize(maximum=100, target_latency=0.05)
+
+    for _ in paginate(client.list_products, page_size=page_size):
+        time.sleep(0.1)
+
+    per_page = [
+        parse_qs(urlparse(request.url).query)["per_page"][0]
+        for request in adapter.requests
+    ]
+    assert per_page == ["100", "100"]
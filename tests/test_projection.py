@@ -0,0 +1,87 @@
+import pytest
+from conftest import cassette_body
+
+from paddle_billing_client.models.event import EventsResponse
+from paddle_billing_client.models.subscription import (
+    Subscription,
+    SubscriptionsResponse,
+)
+from paddle_billing_client.options import request_options
+from paddle_billing_client.projection import (
+    get_projected_model,
+    is_projection_of,
+    parse_fields,
+)
+
+FIELDS = ["id", "status", "items[].price.id", "next_billed_at"]
+
+
+SUBSCRIPTIONS = cassette_body(
+    "test_subscription/TestSubscription.test_list_subscriptions.yaml"
+)
+
+
+def test_parse_fields():
+    assert parse_fields(["id", "items[].price.id", "items.quantity"]) == {
+        "id": {},
+        "items": {"price": {"id": {}}, "quantity": {}},
+    }
+    assert parse_fields(["items.price.id", "items"]) == {"items": {}}
+
+
+def test_projected_models_are_cached_per_projection():
+    model = get_projected_model(SubscriptionsResponse, FIELDS)
+
+    assert get_projected_model(SubscriptionsResponse, reversed(FIELDS)) is model
+    assert model.model_fields.keys() == {"meta", "data"}
+    item = model.model_fields["data"].annotation.__args__[0]
+    assert item.model_fields.keys() == {"id", "status", "items", "next_billed_at"}
+
+
+@pytest.mark.parametrize("fields", [["unknown"], ["status.id"]])
+def test_invalid_projections_raise(fields):
+    with pytest.raises(ValueError):
+        get_projected_model(SubscriptionsResponse, fields)
+
+
+def test_list_methods_return_the_projection(fake_client):
+    client, _ = fake_client([(200, {}, SUBSCRIPTIONS), (200, {}, SUBSCRIPTIONS)])
+    expected = client.list_subscriptions().data[0]
+
+    response = client.list_subscriptions(fields=FIELDS)
+    subscription = response.data[0]
+
+    assert is_projection_of(response, SubscriptionsResponse)
+    assert not isinstance(subscription, Subscription)
+    assert subscription.model_dump() == {
+        "id": expected.id,
+        "status": expected.status,
+        "items": [{"price": {"id": expected.items[0].price.id}}],
+        "next_billed_at": expected.next_billed_at,
+    }
+    assert response.meta.pagination.has_more is False
+
+
+def test_request_options_project_iterated_items(fake_client):
+    client, adapter = fake_client([(200, {}, SUBSCRIPTIONS)])
+
+    with request_options(fields=["id"]):
+        subscriptions = list(client.iter_subscriptions())
+
+    assert [subscription.model_dump() for subscription in subscriptions] == [
+        {"id": "sub_01h7n3a88jwktex2tfjzahmn57"}
+    ]
+    assert len(adapter.requests) == 1
+
+
+def test_projected_events_keep_typed_data(fake_client):
+    body = cassette_body("test_events/TestEvents.test_list_events.yaml")
+    client, _ = fake_client([(200, {}, body), (200, {}, body)])
+    expected = client.list_events()
+
+    events = client.list_events(fields=["event_type", "data"])
+
+    assert is_projection_of(events, EventsResponse)
+    assert [event.data for event in events.data] == [
+        event.data for event in expected.data
+    ]
@@ -0,0 +1,80 @@
+import os
+
+import pytest
+from apiclient.authentication_methods import HeaderAuthentication
+from conftest import CASSETTES
+
+from paddle_billing_client.client import PaddleApiClient
+from paddle_billing_client.rate_limiting import (
+    FileTokenBucket,
+    RateLimiter,
+    TokenBucket,
+)
+
+
+def test_token_bucket_allows_burst_then_queues():
+    bucket = TokenBucket(rate=10, capacity=2)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_token_bucket_invalid_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_file_token_bucket_is_shared(tmp_path):
+    path = str(tmp_path / "bucket.json")
+    first = FileTokenBucket(path, rate=10, capacity=1)
+    second = FileTokenBucket(path, rate=10, capacity=1)
+
+    assert first.reserve() == 0
+    assert second.reserve() == pytest.approx(0.1, abs=0.01)
+
+
+def test_rate_limiter_buckets():
+    limiter = RateLimiter(rate=5, per_endpoint_group=True)
+    auth = HeaderAuthentication(token="token")
+    other_auth = HeaderAuthentication(token="other-token")
+
+    products = limiter.get_bucket(auth, "https://api.paddle.com/products/pro_1")
+    assert products is limiter.get_bucket(auth, "https://api.paddle.com/products")
+    assert products is not limiter.get_bucket(
+        auth, "https://api.paddle.com/transactions"
+    )
+    assert products is not limiter.get_bucket(
+        other_auth, "https://api.paddle.com/products"
+    )
+
+
+def test_rate_limiter_file_buckets(tmp_path):
+    limiter = RateLimiter(rate=5, directory=str(tmp_path))
+    bucket = limiter.get_bucket(HeaderAuthentication(token="token"), "products")
+
+    assert isinstance(bucket, FileTokenBucket)
+    assert os.path.dirname(bucket.path) == str(tmp_path)
+
+
+@pytest.mark.vcr(
+    os.path.join(CASSETTES, "test_product", "TestProduct.test_product_get.yaml")
+)
+def test_client_waits_for_rate_limiter(monkeypatch):
+    limiter = RateLimiter(rate=100)
+    calls = []
+    monkeypatch.setattr(
+        limiter, "wait", lambda auth, endpoint: calls.append((auth, endpoint))
+    )
+    auth = HeaderAuthentication(token=os.getenv("PADDLE_SANDBOX_AUTH_TOKEN"))
+    client = PaddleApiClient(authentication_method=auth, rate_limiter=limiter)
+
+    client.get_product("pro_01h89b2j66qq82x6vn5d39c4av")
+
+    assert calls == [
+        (
+            auth,
+            "https://sandbox-api.paddle.com/products/pro_01h89b2j66qq82x6vn5d39c4av",
+        )
+    ]
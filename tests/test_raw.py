@@ -0,0 +1,81 @@
+import asyncio
+
+import httpx
+import pytest
+from apiclient.authentication_methods import HeaderAuthentication
+from apiclient.exceptions import ClientError
+from conftest import cassette_body
+
+from paddle_billing_client.async_client import AsyncPaddleApiClient
+from paddle_billing_client.models.base import RawResponse
+from paddle_billing_client.options import request_options
+from paddle_billing_client.pagination import paginate
+
+HEADERS = {"Content-Type": "application/json", "Request-Id": "req_1"}
+
+
+SUBSCRIPTIONS = cassette_body(
+    "test_subscription/TestSubscription.test_list_subscriptions.yaml"
+)
+
+
+def test_raw_clients_return_the_undecoded_response(fake_client):
+    client, _ = fake_client([(200, HEADERS, SUBSCRIPTIONS)], raw=True)
+
+    response = client.list_subscriptions(fields=["id"])
+
+    assert isinstance(response, RawResponse)
+    assert response.content == SUBSCRIPTIONS
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "application/json"
+    assert response.request_id == "req_1"
+
+
+def test_request_options_return_raw_responses(fake_client):
+    client, _ = fake_client([(200, {}, SUBSCRIPTIONS), (200, {}, SUBSCRIPTIONS)])
+
+    with request_options(raw=True):
+        response = client.list_subscriptions()
+
+    assert response.content == SUBSCRIPTIONS
+    assert response.request_id is None
+    assert client.list_subscriptions().data[0].id.startswith("sub_")
+
+
+def test_helpers_of_raw_clients_parse_their_calls(fake_client):
+    empty = b'{"data": [], "meta": {"request_id": "1"}}'
+    responses = [(200, {}, SUBSCRIPTIONS)] * 2 + [(200, {}, empty)]
+    client, _ = fake_client(responses + [(200, {}, SUBSCRIPTIONS)], raw=True)
+
+    subscriptions = list(client.iter_subscriptions())
+    pages = list(paginate(client.list_subscriptions))
+    found = client.get_transactions_by_ids(["txn_1"])
+
+    assert subscriptions[0].id.startswith("sub_")
+    assert pages[0].data == subscriptions
+    assert found.missing == ["txn_1"]
+    assert isinstance(client.list_subscriptions(), RawResponse)
+
+
+def test_raw_error_responses_raise(fake_client):
+    client, _ = fake_client([(404, HEADERS, b'{"error": {}}')], raw=True)
+
+    with pytest.raises(ClientError):
+        client.get_subscription("sub_1")
+
+
+def test_async_raw_responses():
+    def handler(request):
+        return httpx.Response(200, headers=HEADERS, content=SUBSCRIPTIONS)
+
+    async def main():
+        async with AsyncPaddleApiClient(
+            authentication_method=HeaderAuthentication(token="token"),
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            raw=True,
+        ) as client:
+            return await client.list_subscriptions()
+
+    response = asyncio.run(main())
+    assert response.content == SUBSCRIPTIONS
+    assert response.request_id == "req_1"
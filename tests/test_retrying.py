@@ -0,0 +1,109 @@
+import asyncio
+
+import httpx
+import pytest
+from apiclient.authentication_methods import HeaderAuthentication
+from apiclient.exceptions import ClientError, ServerError
+
+from paddle_billing_client.async_client import AsyncPaddleApiClient
+from paddle_billing_client.models.product import ProductRequest, ProductResponse
+from paddle_billing_client.options import request_options
+from paddle_billing_client.retrying import RetryPolicy
+
+PRODUCT = (
+    b'{"data":{"id":"pro_1","name":"Product","tax_category":"standard"},'
+    b'"meta":{"request_id":"1"}}'
+)
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    delays = []
+    monkeypatch.setattr(
+        "paddle_billing_client.request_strategies.time.sleep", delays.append
+    )
+    return delays
+
+
+def test_retry_policy_delay():
+    policy = RetryPolicy(backoff_factor=1, backoff_max=5, jitter=False)
+
+    assert [policy.get_delay(attempt) for attempt in range(1, 5)] == [1, 2, 4, 5]
+
+
+def test_retry_policy_only_retries_idempotent_methods():
+    policy = RetryPolicy()
+    error = ServerError(status_code=503)
+
+    assert policy.should_retry("get", error, 1)
+    assert not policy.should_retry("post", error, 1)
+    assert not policy.should_retry("get", error, 3)
+    assert not policy.should_retry("get", ClientError(status_code=400), 1)
+
+
+def test_no_retry_by_default(fake_client):
+    client, adapter = fake_client([(503, {}, b"")])
+
+    with pytest.raises(ServerError):
+        client.get_product("pro_1")
+    assert len(adapter.requests) == 1
+
+
+def test_retry_respects_retry_after(no_sleep, fake_client):
+    client, adapter = fake_client(
+        [(429, {"Retry-After": "7"}, b""), (502, {}, b""), (200, {}, PRODUCT)],
+        retry_policy=RetryPolicy(backoff_factor=1, jitter=False),
+    )
+
+    product = client.get_product("pro_1")
+
+    assert isinstance(product, ProductResponse)
+    assert len(adapter.requests) == 3
+    assert no_sleep == [7, 2]
+
+
+def test_retry_after_is_capped(no_sleep, fake_client):
+    client, _ = fake_client(
+        [(429, {"Retry-After": "86400"}, b""), (200, {}, PRODUCT)],
+        retry_policy=RetryPolicy(max_retry_after=10),
+    )
+
+    client.get_product("pro_1")
+
+    assert no_sleep == [10]
+
+
+def test_retry_gives_up_after_max_attempts(fake_client):
+    client, adapter = fake_client(
+        [(500, {}, b"")] * 2, retry_policy=RetryPolicy(max_attempts=2)
+    )
+
+    with pytest.raises(ServerError):
+        client.get_product("pro_1")
+    assert len(adapter.requests) == 2
+
+
+def test_retry_per_call_override(fake_client):
+    client, adapter = fake_client([(500, {}, b""), (200, {}, PRODUCT)])
+
+    with request_options(retry_policy=RetryPolicy(methods={"GET", "POST"})):
+        client.create_product(ProductRequest(name="Product", tax_category="standard"))
+
+    assert len(adapter.requests) == 2
+
+
+def test_async_retry():
+    responses = [httpx.Response(503), httpx.Response(200, content=PRODUCT)]
+
+    async def get_product():
+        async with AsyncPaddleApiClient(
+            authentication_method=HeaderAuthentication(token="token"),
+            retry_policy=RetryPolicy(backoff_factor=0),
+            http_client=httpx.AsyncClient(
+                transport=httpx.MockTransport(lambda request: responses.pop(0))
+            ),
+        ) as client:
+            return await client.get_product("pro_1")
+
+    assert isinstance(asyncio.run(get_product()), ProductResponse)
+    assert responses == []
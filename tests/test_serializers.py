@@ -0,0 +1,56 @@
+from typing import AsyncIterator, get_type_hints
+
+import pytest
+from apiclient.exceptions import ResponseParseError
+from apiclient.response_handlers import JsonResponseHandler
+
+from paddle_billing_client.async_client import AsyncPaddleApiClient
+from paddle_billing_client.client import PaddleApiClient
+from paddle_billing_client.models.product import Product, ProductResponse
+from paddle_billing_client.serializers import get_response_model
+
+PRODUCT = (
+    b'{"data":{"id":"pro_1","name":"Product","tax_category":"standard"},'
+    b'"meta":{"request_id":"1"}}'
+)
+
+
+def test_responses_are_validated_from_the_raw_body(fake_client, monkeypatch):
+    client, _ = fake_client([(200, {}, PRODUCT)])
+    validated = []
+    validate_json = ProductResponse.model_validate_json
+    monkeypatch.setattr(
+        ProductResponse,
+        "model_validate_json",
+        lambda data: validated.append(data) or validate_json(data),
+    )
+
+    product = client.get_product("pro_1")
+
+    assert isinstance(product, ProductResponse)
+    assert product.data.id == "pro_1"
+    assert validated == [PRODUCT]
+    assert get_response_model() is None
+
+
+def test_custom_response_handlers_are_validated_into_the_model(fake_client):
+    client, _ = fake_client([(200, {}, PRODUCT)], response_handler=JsonResponseHandler)
+
+    assert client.get_product("pro_1").data.id == "pro_1"
+
+
+def test_invalid_json_raises_response_parse_error(fake_client):
+    client, _ = fake_client([(200, {}, b"{not json")])
+
+    with pytest.raises(ResponseParseError):
+        client.get_product("pro_1")
+
+
+def test_helper_methods_are_not_serialized():
+    for client_class in (PaddleApiClient, AsyncPaddleApiClient):
+        assert hasattr(client_class.list_products, "__wrapped__")
+        assert not hasattr(client_class.iter_products, "__wrapped__")
+        assert not hasattr(client_class.get_products_by_ids, "__wrapped__")
+
+    hints = get_type_hints(AsyncPaddleApiClient.iter_products)
+    assert hints["return"] == AsyncIterator[Product]
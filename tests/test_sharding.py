@@ -0,0 +1,179 @@
+import asyncio
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qs, urlencode, urlparse
+
+import httpx
+import pytest
+import requests
+from apiclient.authentication_methods import HeaderAuthentication
+
+from paddle_billing_client.async_client import AsyncPaddleApiClient
+from paddle_billing_client.models.transaction import TransactionQueryParams
+from paddle_billing_client.sharding import (
+    scan_transactions,
+    scan_transactions_async,
+    split_time_range,
+)
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+END = START + timedelta(days=1)
+URL = "https://sandbox-api.paddle.com/transactions"
+
+
+class TransactionsServer:
+    """Serve one transaction per hour, honouring the created_at range and cursor"""
+
+    def __init__(self):
+        self.created_at = [START + timedelta(hours=hour) for hour in range(24)]
+        self.queries = []
+        self.lock = threading.Lock()
+
+    def respond(self, url):
+        query = {
+            key: values[0] for key, values in parse_qs(urlparse(url).query).items()
+        }
+        with self.lock:
+            self.queries.append(query)
+        gte = datetime.fromisoformat(query["created_at[GTE]"].replace("Z", "+00:00"))
+        lt = datetime.fromisoformat(query["created_at[LT]"].replace("Z", "+00:00"))
+        matching = [
+            (index, created_at)
+            for index, created_at in enumerate(self.created_at)
+            if gte <= created_at < lt and index > int(query.get("after", -1))
+        ]
+        per_page = int(query["per_page"])
+        page = matching[:per_page]
+        has_more = len(matching) > per_page
+        next_query = {**query, "after": page[-1][0] if page else -1}
+        return json.dumps(
+            {
+                "data": [
+                    {
+                        "id": f"txn_{index}",
+                        "created_at": created_at.isoformat(),
+                        "details": {},
+                    }
+                    for index, created_at in page
+                ],
+                "meta": {
+                    "request_id": "1",
+                    "pagination": {
+                        "per_page": per_page,
+                        "next": f"{URL}?{urlencode(next_query)}",
+                        "has_more": has_more,
+                        "estimated_total": len(matching),
+                    },
+                },
+            }
+        ).encode()
+
+
+@pytest.fixture
+def server(fake_client):
+    server = TransactionsServer()
+    client, adapter = fake_client([])
+
+    def send(request, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = server.respond(request.url)
+        response.url = request.url
+        response.request = request
+        return response
+
+    adapter.send = send
+    server.client = client
+    return server
+
+
+def test_split_time_range():
+    assert split_time_range(START, END, 2) == [
+        (START, START + timedelta(hours=12)),
+        (START + timedelta(hours=12), END),
+    ]
+    with pytest.raises(ValueError):
+        split_time_range(END, START, 2)
+
+
+def test_scan_transactions_covers_every_window(server):
+    transactions = list(
+        scan_transactions(
+            server.client,
+            START,
+            END,
+            shards=4,
+            query_params=TransactionQueryParams(status="completed", per_page=4),
+        )
+    )
+
+    assert sorted(int(txn.id[4:]) for txn in transactions) == list(range(24))
+    assert {query["created_at[GTE]"] for query in server.queries} == {
+        "2024-01-01T00:00:00Z",
+        "2024-01-01T06:00:00Z",
+        "2024-01-01T12:00:00Z",
+        "2024-01-01T18:00:00Z",
+    }
+    assert all(query["status"] == "completed" for query in server.queries)
+    # 4 windows of 6 transactions, 2 pages each
+    assert len(server.queries) == 8
+
+
+def test_scan_transactions_yields_pages_as_they_are_fetched(server):
+    scan = scan_transactions(
+        server.client,
+        START,
+        END,
+        shards=1,
+        query_params=TransactionQueryParams(per_page=2),
+    )
+
+    first = [next(scan), next(scan)]
+
+    # The first page, and at most the next one requested while it was yielded
+    assert [txn.id for txn in first] == ["txn_0", "txn_1"]
+    assert len(server.queries) <= 2
+    assert [txn.id for txn in scan] == [f"txn_{index}" for index in range(2, 24)]
+    assert len(server.queries) == 12
+
+
+def test_scan_transactions_splits_large_windows_and_orders(server):
+    transactions = list(
+        scan_transactions(
+            server.client,
+            START,
+            END,
+            shards=2,
+            query_params=TransactionQueryParams(per_page=2),
+            max_window_total=3,
+            min_window=timedelta(hours=1),
+            ordered=True,
+        )
+    )
+
+    assert [txn.id for txn in transactions] == [f"txn_{index}" for index in range(24)]
+    windows = {query["created_at[GTE]"] for query in server.queries}
+    assert "2024-01-01T03:00:00Z" in windows
+
+
+def test_scan_transactions_async():
+    server = TransactionsServer()
+
+    def handler(request):
+        return httpx.Response(200, content=server.respond(str(request.url)))
+
+    async def main():
+        async with AsyncPaddleApiClient(
+            authentication_method=HeaderAuthentication(token="token"),
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ) as client:
+            return [
+                transaction
+                async for transaction in scan_transactions_async(
+                    client, START, END, shards=3, ordered=True
+                )
+            ]
+
+    transactions = asyncio.run(main())
+    assert [txn.id for txn in transactions] == [f"txn_{index}" for index in range(24)]
@@ -0,0 +1,162 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from apiclient.authentication_methods import HeaderAuthentication
+from apiclient.exceptions import ServerError
+
+from paddle_billing_client.async_client import AsyncPaddleApiClient
+from paddle_billing_client.models.product import ProductResponse
+from paddle_billing_client.single_flight import SingleFlight
+
+PRODUCT = (
+    b'{"data":{"id":"pro_1","name":"Product","tax_category":"standard"},'
+    b'"meta":{"request_id":"1"}}'
+)
+PRODUCTS = json.dumps(
+    {
+        "data": [
+            {"id": f"pro_{index}", "name": "Product", "tax_category": "standard"}
+            for index in range(10)
+        ],
+        "meta": {
+            "request_id": "1",
+            "pagination": {
+                "per_page": 10,
+                "next": "https://sandbox-api.paddle.com/products?after=pro_9",
+                "has_more": False,
+                "estimated_total": 10,
+            },
+        },
+    }
+).encode()
+
+
+def test_single_flight_shares_errors():
+    single_flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def fail():
+        calls.append(1)
+        started.set()
+        release.wait()
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(2) as executor:
+        leader = executor.submit(single_flight.do, "key", fail)
+        started.wait()
+        follower = executor.submit(single_flight.do, "key", fail)
+        time.sleep(0.05)
+        release.set()
+
+        for future in (leader, follower):
+            with pytest.raises(ValueError):
+                future.result()
+    assert calls == [1]
+
+
+def test_concurrent_identical_gets_are_collapsed(fake_client):
+    client, adapter = fake_client([(200, {}, PRODUCT)], single_flight=True)
+    send = adapter.send
+
+    def slow_send(request, **kwargs):
+        time.sleep(0.2)
+        return send(request, **kwargs)
+
+    adapter.send = slow_send
+    with ThreadPoolExecutor(8) as executor:
+        products = list(executor.map(lambda _: client.get_product("pro_1"), range(8)))
+
+    assert len(adapter.requests) == 1
+    assert all(isinstance(product, ProductResponse) for product in products)
+
+
+def test_sequential_gets_are_not_cached(fake_client):
+    client, adapter = fake_client([(200, {}, PRODUCT)] * 2, single_flight=True)
+
+    client.get_product("pro_1")
+    client.get_product("pro_1")
+
+    assert len(adapter.requests) == 2
+
+
+def test_async_concurrent_identical_gets_are_collapsed():
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.05)
+        if request.url.path.endswith("pro_2"):
+            return httpx.Response(500)
+        return httpx.Response(200, content=PRODUCT)
+
+    async def get_products():
+        async with AsyncPaddleApiClient(
+            authentication_method=HeaderAuthentication(token="token"),
+            single_flight=True,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ) as client:
+            return await asyncio.gather(
+                *[client.get_product("pro_1") for _ in range(10)],
+                *[client.get_product("pro_2") for _ in range(10)],
+                return_exceptions=True,
+            )
+
+    results = asyncio.run(get_products())
+
+    assert len(requests) == 2
+    assert all(isinstance(result, ProductResponse) for result in results[:10])
+    assert all(isinstance(result, ServerError) for result in results[10:])
+
+
+def test_concurrent_iterations_share_pages_without_losing_items(fake_client):
+    client, adapter = fake_client([(200, {}, PRODUCTS)], single_flight=True)
+    send = adapter.send
+
+    def slow_send(request, **kwargs):
+        time.sleep(0.2)
+        return send(request, **kwargs)
+
+    adapter.send = slow_send
+    with ThreadPoolExecutor(2) as executor:
+        results = list(executor.map(lambda _: list(client.iter_products()), range(2)))
+
+    assert len(adapter.requests) == 1
+    for products in results:
+        assert [product.id for product in products] == [
+            f"pro_{index}" for index in range(10)
+        ]
+
+
+def test_async_concurrent_iterations_share_pages_without_losing_items():
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, content=PRODUCTS)
+
+    async def iterate_products():
+        async with AsyncPaddleApiClient(
+            authentication_method=HeaderAuthentication(token="token"),
+            single_flight=True,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ) as client:
+
+            async def collect():
+                return [product async for product in client.iter_products()]
+
+            return await asyncio.gather(collect(), collect())
+
+    results = asyncio.run(iterate_products())
+
+    assert len(requests) == 1
+    for products in results:
+        assert [product.id for product in products] == [
+            f"pro_{index}" for index in range(10)
+        ]
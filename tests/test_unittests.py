@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 from paddle_billing_client.models.address import AddressQueryParams
@@ -5,10 +7,10 @@ from paddle_billing_client.models.adjustment import AdjustmentQueryParams
 from paddle_billing_client.models.business import BusinessQueryParams
 from paddle_billing_client.models.customer import CustomerQueryParams
 from paddle_billing_client.models.discount import DiscountQueryParams
-from paddle_billing_client.models.event import EventQueryParams
+from paddle_billing_client.models.event import Event, EventQueryParams
 from paddle_billing_client.models.notification import NotificationQueryParams
 from paddle_billing_client.models.price import PriceQueryParams
-from paddle_billing_client.models.product import ProductQueryParams
+from paddle_billing_client.models.product import Product, ProductQueryParams
 from paddle_billing_client.models.subscription import SubscriptionQueryParams
 from paddle_billing_client.models.transaction import TransactionQueryParams
 
@@ -161,3 +163,43 @@ def test_transaction_query_params_invalid():
     }
     with pytest.raises(ValueError):
         TransactionQueryParams(**query_params)
+
+
+def test_event_data_is_parsed_by_event_type():
+    product = {"id": "pro_1", "name": "Product", "tax_category": "standard"}
+    event = {
+        "event_id": "evt_1",
+        "event_type": "product.updated",
+        "occurred_at": "2024-01-01T00:00:00Z",
+        "data": product,
+    }
+
+    assert isinstance(Event.model_validate(event).data, Product)
+    assert isinstance(Event.model_validate_json(json.dumps(event)).data, Product)
+    unknown = Event.model_validate({**event, "event_type": "payout.paid"})
+    assert unknown.data == product
+    # Kept as dispatched by the validator, without another validation pass
+    assert unknown.data is product
+
+
+def test_event_data_models_are_not_validated_again():
+    product = Product(id="pro_1", name="Product", tax_category="standard")
+
+    event = Event(
+        event_id="evt_1",
+        event_type="product.updated",
+        occurred_at="2024-01-01T00:00:00Z",
+        data=product,
+    )
+
+    assert event.data is product
+
+
+def test_event_data_of_the_wrong_model_is_rejected():
+    with pytest.raises(ValueError):
+        Event(
+            event_id="evt_1",
+            event_type="product.updated",
+            occurred_at="2024-01-01T00:00:00Z",
+            data={"id": "pro_1"},
+        )